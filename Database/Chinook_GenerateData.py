@@ -2,8 +2,20 @@
 Generate realistic large-scale data for Chinook database
 Creates 1,000 customers and 4,000 invoices with realistic, diverse data
 """
+import json
+import os
 import random
-from datetime import datetime, timedelta
+import re
+import struct
+import sys
+import zlib
+from array import array
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from functools import partial
+from itertools import accumulate
+from sys import intern
+from typing import NamedTuple, Optional
 
 # Comprehensive lists of real names from various cultures
 FIRST_NAMES = [
@@ -257,281 +269,711 @@ LOCATIONS = [
     ('New Zealand', 'Wellington', None, '6001-6242', '+64', '@paradise.net.nz'),
 ]
 
-def generate_customers(start_id=60, count=941):
+
+# Reference data compiled once at import. Postal ranges are parsed, strings interned and the
+# small lists the generators draw from hoisted into constants, and weighted draws use
+# precomputed cumulative weights, so the per-row code only does constant-time lookups.
+class Location(NamedTuple):
+    country: str
+    city: str
+    state: Optional[str]
+    postal_range: Optional[tuple]  # (min, max) of a numeric postal code range, drawn uniformly
+    postal_code: str  # Fixed postal code used when there is no numeric range
+    phone_prefix: str
+    email_domain: str
+
+def _compile_location(country, city, state, postal_prefix, phone_prefix, email_domain):
+    """Parse a LOCATIONS entry's postal range ('10001-10292', 'M4B-M6S', ...) once"""
+    postal_range = None
+    postal_code = postal_prefix
+    if '-' in postal_prefix:
+        parts = postal_prefix.split('-')
+        postal_code = parts[0]
+        if parts[0].replace(' ', '').isdigit() and parts[1].replace(' ', '').isdigit():
+            min_val = int(parts[0].replace(' ', ''))
+            max_val = int(parts[1].replace(' ', ''))
+            if min_val < max_val:
+                postal_range = (min_val, max_val)
+    return Location(intern(country), intern(city), state and intern(state), postal_range, intern(postal_code),
+                    intern(phone_prefix), intern(email_domain))
+
+COMPILED_LOCATIONS = tuple(_compile_location(*location) for location in LOCATIONS)
+
+# Lower-cased, space-free name parts for email addresses
+EMAIL_NAMES = {name: name.lower().replace(' ', '') for name in FIRST_NAMES + LAST_NAMES}
+
+INITIALS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+NAME_SUFFIXES = ('Jr.', 'Sr.', 'III', 'II', 'IV')
+STREET_NAMES = ('Main St', 'High St', 'Park Ave', 'Oak Rd', 'Maple Dr', 'Church St',
+                'Market St', 'Station Rd', 'King St', 'Queen St', 'Victoria Rd')
+BILLING_STREET_NAMES = STREET_NAMES[:6]  # Alternate billing addresses use the first six
+COMPANY_NAMES = ('Tech Solutions Inc', 'Global Industries', 'Digital Systems Ltd',
+                 'Innovations Corp', 'Enterprise Solutions', 'Business Services Group',
+                 'Technology Partners', 'Consulting Group', 'Professional Services',
+                 'Development Solutions', 'Software Systems', 'IT Services Ltd')
+
+# Number of tracks per invoice (1-10), weighted toward smaller purchases
+INVOICE_LINE_COUNTS = tuple(range(1, 11))
+INVOICE_LINE_COUNT_WEIGHTS = (0.30, 0.25, 0.15, 0.10, 0.08, 0.05, 0.03, 0.02, 0.01, 0.01)
+INVOICE_LINE_COUNT_CUM_WEIGHTS = tuple(accumulate(INVOICE_LINE_COUNT_WEIGHTS))
+# Track price in cents (most tracks are 0.99, some are 1.99)
+TRACK_PRICES = (99, 99, 99, 99, 199)  # 80% at 0.99, 20% at 1.99
+# Most purchases are qty 1
+QUANTITIES = (1, 2, 3)
+QUANTITY_WEIGHTS = (0.80, 0.15, 0.05)
+QUANTITY_CUM_WEIGHTS = tuple(accumulate(QUANTITY_WEIGHTS))
+
+LOG_TEMPLATES = (
+    "Invoice #{0} processed successfully",
+    "Payment confirmation for invoice #{0}",
+    "Invoice #{0} sent to customer via email",
+    "Invoice #{0} marked as paid - Transaction ID: TXN{1}",
+    "Reminder sent for invoice #{0}",
+    "Invoice #{0} payment received - Amount: ${2}",
+    "Invoice #{0} generated for customer ID {3}",
+    "Processing payment for invoice #{0}",
+    "Invoice #{0} delivery confirmation received",
+    "Invoice #{0} status updated to completed",
+)
+
+# Typed row model shared by every generator and writer. Generators emit these
+# records and each SQL dialect renders them directly, so values never make a
+# round trip through SQL text. Money is held in integer cents to keep totals exact.
+class ArtistRow(NamedTuple):
+    artist_id: int
+    name: str
+
+class AlbumRow(NamedTuple):
+    album_id: int
+    title: str
+    artist_id: int
+
+class TrackRow(NamedTuple):
+    track_id: int
+    name: str
+    album_id: int
+    media_type_id: int
+    genre_id: int
+    composer: Optional[str]
+    milliseconds: int
+    bytes: int
+    unit_price_cents: int
+
+class CustomerRow(NamedTuple):
+    customer_id: int
+    first_name: str
+    last_name: str
+    company: Optional[str]
+    address: str
+    city: str
+    state: Optional[str]
+    country: str
+    postal_code: str
+    phone: str
+    fax: Optional[str]
+    email: str
+    support_rep_id: int
+
+class InvoiceRow(NamedTuple):
+    invoice_id: int
+    customer_id: int
+    invoice_date: date
+    billing_address: str
+    billing_city: str
+    billing_state: Optional[str]
+    billing_country: str
+    billing_postal_code: str
+    total_cents: int
+
+class InvoiceLineRow(NamedTuple):
+    invoice_line_id: int
+    invoice_id: int
+    track_id: int
+    unit_price_cents: int
+    quantity: int
+
+class SystemLogRow(NamedTuple):
+    log_id: int
+    invoice_id: int
+    log_date: datetime
+    log_message: str
+
+class TableSpec(NamedTuple):
+    """Column layout of a generated table
+
+    Columns are (name, kind) pairs in the same order as the row fields. The kind
+    decides how a value is rendered: 'int', 'text', 'text_null', 'money' (cents),
+    'date' or 'datetime'.
+    """
+    name: str
+    label: str
+    columns: tuple
+
+ARTIST = TableSpec('Artist', 'artists', (('ArtistId', 'int'), ('Name', 'text')))
+ALBUM = TableSpec('Album', 'albums', (('AlbumId', 'int'), ('Title', 'text'), ('ArtistId', 'int')))
+TRACK = TableSpec('Track', 'tracks', (
+    ('TrackId', 'int'), ('Name', 'text'), ('AlbumId', 'int'), ('MediaTypeId', 'int'), ('GenreId', 'int'),
+    ('Composer', 'text_null'), ('Milliseconds', 'int'), ('Bytes', 'int'), ('UnitPrice', 'money')))
+CUSTOMER = TableSpec('Customer', 'customers', (
+    ('CustomerId', 'int'), ('FirstName', 'text'), ('LastName', 'text'), ('Company', 'text_null'),
+    ('Address', 'text'), ('City', 'text'), ('State', 'text_null'), ('Country', 'text'),
+    ('PostalCode', 'text'), ('Phone', 'text'), ('Fax', 'text_null'), ('Email', 'text'), ('SupportRepId', 'int')))
+INVOICE = TableSpec('Invoice', 'invoices', (
+    ('InvoiceId', 'int'), ('CustomerId', 'int'), ('InvoiceDate', 'date'), ('BillingAddress', 'text'),
+    ('BillingCity', 'text'), ('BillingState', 'text_null'), ('BillingCountry', 'text'),
+    ('BillingPostalCode', 'text'), ('Total', 'money')))
+INVOICE_LINE = TableSpec('InvoiceLine', 'invoice lines', (
+    ('InvoiceLineId', 'int'), ('InvoiceId', 'int'), ('TrackId', 'int'), ('UnitPrice', 'money'), ('Quantity', 'int')))
+SYSTEM_LOG = TableSpec('SystemLog', 'system log entries', (
+    ('LogId', 'int'), ('InvoiceId', 'int'), ('LogDate', 'datetime'), ('LogMessage', 'text')))
+
+# First ID of each table's generated rows: the IDs after the base Chinook data (SystemLog is not
+# part of it, and its entries start at 1000). A top-up run starts after the IDs in use instead.
+FIRST_IDS = {ARTIST: 276, ALBUM: 348, TRACK: 3504, CUSTOMER: 60, INVOICE: 413, INVOICE_LINE: 2241, SYSTEM_LOG: 1000}
+# Customers and invoices in the base Chinook database
+BASE_CUSTOMERS = 59
+BASE_INVOICES = 412
+
+# Generators yield rows in batches of this size so that no table is ever held in memory in full.
+# Each batch-sized block of a table draws from its own random stream, seeded from the dataset
+# seed, the table and the block number, so any block can be generated on its own - in order,
+# or in a worker process - and always produces the same rows.
+BATCH_ROWS = 1000
+
+def _resolve_seed(seed):
+    """Pick a fresh seed when none was given (each run then produces different data)"""
+    return random.randrange(1 << 32) if seed is None else seed
+
+def _block_rng(seed, table, block):
+    """Independent random stream for one block of one table"""
+    return random.Random(f"{seed}/{table}/{block}")
+
+def _blocks(count, skip=0):
+    """Yield (block, offset, rows) for each BATCH_ROWS-sized block of a table of `count` rows
+
+    Blocks that lie entirely within the first `skip` rows are left out.
+    """
+    for offset in range(skip - skip % BATCH_ROWS, count, BATCH_ROWS):
+        yield offset // BATCH_ROWS, offset, min(BATCH_ROWS, count - offset)
+
+def _batched(rows, size=BATCH_ROWS):
+    """Group an iterable of rows into lists of up to `size` rows"""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+# Read-only data the block generators need from earlier tables (see _run_blocks)
+_shared = None
+
+def _init_worker(shared):
+    global _shared
+    _shared = shared
+
+def _run_blocks(task, tasks, workers=1, shared=None):
+    """Run task(*args) for each args tuple and yield the results in order
+
+    With workers > 1 the blocks are generated in a process pool, each worker receiving
+    `shared` once at startup. Only a few blocks per worker are in flight at a time, so
+    results never pile up in memory faster than the caller consumes them.
+    """
+    if workers <= 1:
+        _init_worker(shared)
+        try:
+            for args in tasks:
+                yield task(*args)
+        finally:
+            _init_worker(None)
+        return
+
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(shared,)) as pool:
+        pending = deque()
+        for args in tasks:
+            pending.append(pool.submit(task, *args))
+            if len(pending) >= workers * 4:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def _skip_rows(batches, first_id):
+    """Drop rows with an ID below first_id from a stream of batches"""
+    for batch in batches:
+        if batch[0][0] < first_id:
+            batch = [row for row in batch if row[0] >= first_id]
+            if not batch:
+                continue
+        yield batch
+
+class CustomerAddressStore:
+    """Compact, column-oriented store of customer addresses for invoice billing
+
+    Row i holds the address of customer first_id + i as indexes into COMPILED_LOCATIONS
+    and STREET_NAMES, a street number and an integer postal code (-1 for the location's
+    fixed code), about 9 bytes per customer instead of a dict of five strings.
+    """
+
+    def __init__(self, first_id=FIRST_IDS[CUSTOMER]):
+        self.first_id = first_id
+        self.location = array('H')
+        self.street_number = array('H')
+        self.street = array('B')
+        self.postal = array('i')
+
+    def __len__(self):
+        return len(self.location)
+
+    def __contains__(self, customer_id):
+        return 0 <= customer_id - self.first_id < len(self.location)
+
+    def extend(self, columns):
+        """Append one block's (location, street_number, street, postal) columns"""
+        location, street_number, street, postal = columns
+        self.location.extend(location)
+        self.street_number.extend(street_number)
+        self.street.extend(street)
+        self.postal.extend(postal)
+
+    def billing_address(self, customer_id):
+        """Return (address, city, state, country, postal_code) for a stored customer"""
+        i = customer_id - self.first_id
+        location = COMPILED_LOCATIONS[self.location[i]]
+        postal = self.postal[i]
+        return (f"{self.street_number[i]} {STREET_NAMES[self.street[i]]}", location.city, location.state,
+                location.country, str(postal) if postal >= 0 else location.postal_code)
+
+def generate_customers(start_id=FIRST_IDS[CUSTOMER], count=941, seed=None, workers=1, addresses=None):
     """Generate realistic customer data
-    
-    Returns:
-        tuple: (customers_sql_list, customers_dict)
-            - customers_sql_list: List of SQL INSERT values
-            - customers_dict: Dict mapping customer_id to customer data for invoice generation
+
+    Args:
+        start_id: Starting customer ID
+        count: Number of customers to generate
+        seed: Dataset seed (random if None)
+        workers: Number of processes to generate blocks in
+        addresses: Optional CustomerAddressStore (with first_id == start_id) that each
+            customer's address is appended to, for invoice billing addresses
+
+    Yields:
+        Lists of up to BATCH_ROWS CustomerRow records
     """
+    seed = _resolve_seed(seed)
+    tasks = ((seed, block, start_id + offset, rows) for block, offset, rows in _blocks(count))
+    for customers, address_columns in _run_blocks(_customer_block, tasks, workers):
+        if addresses is not None:
+            addresses.extend(address_columns)
+        yield customers
+
+def _customer_block(seed, block, start_id, count):
+    rng = _block_rng(seed, 'customers', block)
     customers = []
-    customers_dict = {}  # Store customer data for invoice billing addresses
-    used_emails = set()
-    
+    address_columns = (array('H'), array('H'), array('B'), array('i'))
+    locations, street_numbers, streets, postals = address_columns
+
     for i in range(count):
         customer_id = start_id + i
-        first_name = random.choice(FIRST_NAMES)
-        last_name = random.choice(LAST_NAMES)
-        
+        first_name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        email_first = EMAIL_NAMES[first_name]
+        email_last = EMAIL_NAMES[last_name]
+
         # Add middle initial (40% chance) and suffix (5% chance) for variety
-        if random.random() < 0.40:
-            middle_initial = random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+        if rng.random() < 0.40:
+            middle_initial = rng.choice(INITIALS)
             first_name = f"{first_name} {middle_initial}."
-        
-        if random.random() < 0.05:
-            suffix = random.choice(['Jr.', 'Sr.', 'III', 'II', 'IV'])
+            email_first = f"{email_first}{middle_initial.lower()}."
+
+        if rng.random() < 0.05:
+            suffix = rng.choice(NAME_SUFFIXES)
             last_name = f"{last_name} {suffix}"
-        
-        location = random.choice(LOCATIONS)
-        country, city, state, postal_prefix, phone_prefix, email_domain = location
-        
-        # Generate unique email
-        base_email = f"{first_name.lower().replace(' ', '')}.{last_name.lower().replace(' ', '')}"
-        email = f"{base_email}{customer_id}{email_domain}"
-        
-        # Ensure uniqueness
-        counter = 1
-        while email in used_emails:
-            email = f"{base_email}{customer_id}_{counter}{email_domain}"
-            counter += 1
-        used_emails.add(email)
-        
+            email_last = f"{email_last}{suffix.lower()}"
+
+        # randrange(n) makes the same draw as choice() on an n-item sequence
+        location_idx = rng.randrange(len(COMPILED_LOCATIONS))
+        location = COMPILED_LOCATIONS[location_idx]
+        country, city, state = location.country, location.city, location.state
+
+        # Generate email - unique without bookkeeping because it embeds the customer ID and
+        # the name part never contains digits
+        email = f"{email_first}.{email_last}{customer_id}{location.email_domain}"
+
         # Generate address
-        street_num = random.randint(1, 9999)
-        street_names = ['Main St', 'High St', 'Park Ave', 'Oak Rd', 'Maple Dr', 'Church St', 
-                       'Market St', 'Station Rd', 'King St', 'Queen St', 'Victoria Rd']
-        address = f"{street_num} {random.choice(street_names)}"
-        
+        street_num = rng.randint(1, 9999)
+        street_idx = rng.randrange(len(STREET_NAMES))
+        address = f"{street_num} {STREET_NAMES[street_idx]}"
+
         # Postal code based on range
-        if '-' in postal_prefix:
-            parts = postal_prefix.split('-')
-            if parts[0].replace(' ', '').isdigit() and parts[1].replace(' ', '').isdigit():
-                min_val = int(parts[0].replace(' ', ''))
-                max_val = int(parts[1].replace(' ', ''))
-                if min_val < max_val:
-                    postal = str(random.randint(min_val, max_val))
-                else:
-                    postal = parts[0]
-            else:
-                postal = parts[0]
-        else:
-            postal = postal_prefix
-            
+        postal_range = location.postal_range
+        postal_num = rng.randint(*postal_range) if postal_range else -1
+        postal = str(postal_num) if postal_range else location.postal_code
+
+        locations.append(location_idx)
+        street_numbers.append(street_num)
+        streets.append(street_idx)
+        postals.append(postal_num)
+
         # Phone number
-        phone = f"{phone_prefix} ({random.randint(100,999)}) {random.randint(100,999)}-{random.randint(1000,9999)}"
-        
+        phone = f"{location.phone_prefix} ({rng.randint(100,999)}) {rng.randint(100,999)}-{rng.randint(1000,9999)}"
+
         # Support rep (3-5)
-        support_rep = random.randint(3, 5)
-        
+        support_rep = rng.randint(3, 5)
+
         # 30% chance of having a company
         company = None
-        if random.random() < 0.3:
-            company_names = ['Tech Solutions Inc', 'Global Industries', 'Digital Systems Ltd', 
-                           'Innovations Corp', 'Enterprise Solutions', 'Business Services Group',
-                           'Technology Partners', 'Consulting Group', 'Professional Services',
-                           'Development Solutions', 'Software Systems', 'IT Services Ltd']
-            company = random.choice(company_names)
-        
-        # Store customer data for invoice billing
-        customers_dict[customer_id] = {
-            'address': address,
-            'city': city,
-            'state': state,
-            'country': country,
-            'postal': postal
-        }
-        
-        state_str = f"N'{state}'" if state else 'NULL'
-        company_str = f"N'{company}'" if company else 'NULL'
-        
-        customer = f"    (N'{first_name}', N'{last_name}', {company_str}, N'{address}', N'{city}', {state_str}, N'{country}', N'{postal}', N'{phone}', NULL, N'{email}', {support_rep})"
-        customers.append(customer)
-    
-    return customers, customers_dict
+        if rng.random() < 0.3:
+            company = rng.choice(COMPANY_NAMES)
+
+        customers.append(CustomerRow(customer_id, first_name, last_name, company, address, city, state,
+                                     country, postal, phone, None, email, support_rep))
 
-def generate_systemlog(count=5000, invoice_count=3588):
+    return customers, address_columns
+
+
+def generate_systemlog(count=5000, invoice_count=3588, seed=None, workers=1, skip=0, start_id=FIRST_IDS[SYSTEM_LOG],
+                       invoice_id_start=FIRST_IDS[INVOICE]):
     """Generate SystemLog entries for database size inflation
-    
-    Creates realistic-looking log data. Padding is generated by SQL Server during insertion
-    using REPLICATE() function for maximum speed and minimal memory usage.
-    
+
+    Creates realistic-looking log data. Padding is generated by the database during
+    insertion (REPLICATE/REPEAT/RPAD) for maximum speed and minimal memory usage.
+
     Note: Matches actual SystemLog schema (LogId, InvoiceId, LogDate, LogMessage)
-    
+
     Args:
         count: Number of log entries (each ~7.8KB after SQL padding, so 65000 rows ≈ 500MB)
-        invoice_count: Number of invoices generated (to ensure valid FK references)
-    
-    Returns:
-        List of SQL INSERT values for SystemLog table
+        invoice_count: Number of invoices from invoice_id_start on (to ensure valid FK references)
+        seed: Dataset seed (random if None)
+        workers: Number of processes to generate blocks in
+        skip: Leave out the first `skip` entries (already generated by an earlier run)
+        start_id: Starting log ID
+        invoice_id_start: First invoice ID the entries may reference
+
+    Yields:
+        Lists of up to BATCH_ROWS SystemLogRow records
     """
+    seed = _resolve_seed(seed)
+    tasks = ((seed, block, start_id + offset, rows, invoice_id_start, invoice_count)
+             for block, offset, rows in _blocks(count, skip))
+    return _skip_rows(_run_blocks(_systemlog_block, tasks, workers), start_id + skip)
+
+def _systemlog_block(seed, block, start_id, count, invoice_id_start, invoice_count):
+    rng = _block_rng(seed, 'system_log', block)
     log_entries = []
-    
-    # Template messages for log entries
-    log_templates = [
-        "Invoice #{0} processed successfully",
-        "Payment confirmation for invoice #{0}",
-        "Invoice #{0} sent to customer via email",
-        "Invoice #{0} marked as paid - Transaction ID: TXN{1}",
-        "Reminder sent for invoice #{0}",
-        "Invoice #{0} payment received - Amount: ${2}",
-        "Invoice #{0} generated for customer ID {3}",
-        "Processing payment for invoice #{0}",
-        "Invoice #{0} delivery confirmation received",
-        "Invoice #{0} status updated to completed"
-    ]
-    
+
     # Start date: Jan 1, 2022
     start_date = datetime(2022, 1, 1)
     end_date = datetime(2026, 1, 19)
     total_days = (end_date - start_date).days
-    
-    # Invoice IDs start at 413 and we generate a specific count
-    invoice_id_start = 413
+
     invoice_id_end = invoice_id_start + invoice_count - 1
-    
+
     for i in range(count):
-        log_id = 1000 + i  # Start from 1000 to avoid conflicts with existing logs
-        
+        log_id = start_id + i
+
         # Random invoice ID from the ACTUAL range of generated invoices
-        invoice_id = random.randint(invoice_id_start, invoice_id_end)
-        
+        invoice_id = rng.randint(invoice_id_start, invoice_id_end)
+
         # Random timestamp
-        random_days = random.randint(0, total_days)
-        log_time = start_date + timedelta(days=random_days, 
-                                          hours=random.randint(0, 23),
-                                          minutes=random.randint(0, 59),
-                                          seconds=random.randint(0, 59))
-        log_date = log_time.strftime('%Y-%m-%d %H:%M:%S')
-        
+        random_days = rng.randint(0, total_days)
+        log_time = start_date + timedelta(days=random_days,
+                                          hours=rng.randint(0, 23),
+                                          minutes=rng.randint(0, 59),
+                                          seconds=rng.randint(0, 59))
+
         # Random template with data
-        template = random.choice(log_templates)
+        template = rng.choice(LOG_TEMPLATES)
         message = template.format(
             invoice_id,                          # {0} - invoice ID
-            random.randint(100000, 999999),     # {1} - transaction ID
-            round(random.uniform(0.99, 99.99), 2),  # {2} - amount
-            random.randint(1, 10000)            # {3} - customer ID
+            rng.randint(100000, 999999),     # {1} - transaction ID
+            round(rng.uniform(0.99, 99.99), 2),  # {2} - amount
+            rng.randint(1, 10000)            # {3} - customer ID
         )
-        
-        # Escape single quotes
-        message_escaped = message.replace("'", "''")
-        
-        # Note: Padding will be added by SQL Server using REPLICATE() during insertion
-        log_entry = f"    ({log_id}, {invoice_id}, '{log_date}', N'{message_escaped}')"
-        log_entries.append(log_entry)
-    
+
+        # Note: Padding will be added by the database during insertion
+        log_entries.append(SystemLogRow(log_id, invoice_id, log_time, message))
+
     return log_entries
 
-def generate_invoices(start_id=413, count=3588, customer_count=1000, customer_id_start=1, customers_dict=None):
+
+def _invoice_line_counts(seed, block, count):
+    """Number of lines for each invoice in a block - the first draws of the block's line stream
+
+    Drawing them up front lets the first invoice line ID of every block be worked out
+    without generating the blocks before it. A full block's worth is always drawn so the
+    rest of the stream doesn't depend on how many invoices the block holds.
+    """
+    rng = _block_rng(seed, 'invoice_lines', block)
+    return rng, rng.choices(INVOICE_LINE_COUNTS, cum_weights=INVOICE_LINE_COUNT_CUM_WEIGHTS, k=BATCH_ROWS)[:count]
+
+def generate_invoices(start_id=FIRST_IDS[INVOICE], count=3588, customer_count=1000, customer_id_start=1, addresses=None,
+                      start_line_id=FIRST_IDS[INVOICE_LINE], seed=None, workers=1, engine='python', skip=0, skip_lines=None):
     """Generate realistic invoice data for 2022-2026 (Jan 1, 2022 - Jan 19, 2026)
-    
+
     Args:
         start_id: Starting invoice ID
         count: Number of invoices to generate
         customer_count: Total number of customers (determines max customer ID)
         customer_id_start: Starting customer ID (use 60 if database only has new customers)
-        customers_dict: Dictionary mapping customer_id to address data (for realistic billing)
+        addresses: CustomerAddressStore of the customers (for realistic billing)
+        start_line_id: Starting invoice line ID (2240 lines in base DB)
+        seed: Dataset seed (random if None)
+        workers: Number of processes to generate blocks in
+        engine: 'python', or 'numpy' to draw each block as arrays (see INVOICE_ENGINES)
+        skip: Leave out the first `skip` invoices and their lines (already generated by an
+            earlier run); the remaining rows and their line IDs are exactly as in a full run
+        skip_lines: Leave out the first `skip_lines` invoice lines instead of the lines of
+            the skipped invoices, for a load that stopped part-way through them
+
+    Yields:
+        (TableSpec, rows) pairs: each batch of BATCH_ROWS invoices is followed by the full
+        batches of invoice lines that reference it, so lines are never emitted before their
+        invoice and at most one batch of each is held in memory
     """
+    seed = _resolve_seed(seed)
+    line_counts, invoice_block = INVOICE_ENGINES[engine]
+
+    first_line_id = None if skip_lines is None else start_line_id + skip_lines
+
+    def tasks():
+        line_id = start_line_id
+        for block, offset, rows in _blocks(count):
+            block_lines = int(sum(line_counts(seed, block, rows)[1]))
+            if offset + rows > skip or (first_line_id is not None and line_id + block_lines > first_line_id):
+                yield seed, block, start_id + offset, rows, line_id, customer_id_start, customer_count
+            line_id += block_lines
+
+    first_id = start_id + skip
+    invoice_lines = []
+    for invoices, lines in _run_blocks(invoice_block, tasks(), workers, addresses):
+        if invoices[0].invoice_id < first_id:
+            invoices = [invoice for invoice in invoices if invoice.invoice_id >= first_id]
+            if first_line_id is None:
+                lines = [line for line in lines if line.invoice_id >= first_id]
+        if first_line_id is not None and lines and lines[0].invoice_line_id < first_line_id:
+            lines = [line for line in lines if line.invoice_line_id >= first_line_id]
+        if invoices:
+            yield INVOICE, invoices
+        invoice_lines.extend(lines)
+        while len(invoice_lines) >= BATCH_ROWS:
+            yield INVOICE_LINE, invoice_lines[:BATCH_ROWS]
+            invoice_lines = invoice_lines[BATCH_ROWS:]
+
+    if invoice_lines:
+        yield INVOICE_LINE, invoice_lines
+
+def count_invoice_lines(invoices, seed, engine='python'):
+    """Number of lines the first `invoices` invoices of a dataset have, without generating them"""
+    line_counts = INVOICE_ENGINES[engine][0]
+    return sum(int(sum(line_counts(seed, block, rows)[1])) for block, _, rows in _blocks(invoices))
+
+def _invoice_block(seed, block, start_id, count, invoice_line_id, customer_id_start, customer_count):
+    rng = _block_rng(seed, 'invoices', block)
+    line_rng, line_counts = _invoice_line_counts(seed, block, count)
+    addresses = _shared
     invoices = []
     invoice_lines = []
-    invoice_line_id = 2241  # Starting after existing invoice lines (2240 in base DB)
-    
+
     # Start date: Jan 1, 2022
-    start_date = datetime(2022, 1, 1)
+    start_date = date(2022, 1, 1)
     # End date: Jan 19, 2026 (current date)
-    end_date = datetime(2026, 1, 19)
-    
+    end_date = date(2026, 1, 19)
+
     total_days = (end_date - start_date).days
-    
-    # Track price (most tracks are 0.99, some are 1.99)
-    track_prices = [0.99, 0.99, 0.99, 0.99, 1.99]  # 80% at 0.99, 20% at 1.99
-    
+
     customer_id_end = customer_id_start + customer_count - 1
-    
+
     for i in range(count):
         invoice_id = start_id + i
-        
+
         # Random customer from the range of customers that actually exist
-        customer_id = random.randint(customer_id_start, customer_id_end)
-        
+        customer_id = rng.randint(customer_id_start, customer_id_end)
+
         # Random date between Jan 1, 2022 and Jan 19, 2026
-        random_days = random.randint(0, total_days)
+        random_days = rng.randint(0, total_days)
         invoice_date = start_date + timedelta(days=random_days)
-        
-        date_str = invoice_date.strftime('%Y/%m/%d')
-        
-        # Determine number of tracks to purchase (1-10 tracks, weighted toward smaller purchases)
-        weights = [0.30, 0.25, 0.15, 0.10, 0.08, 0.05, 0.03, 0.02, 0.01, 0.01]  # 1-10 tracks
-        num_tracks = random.choices(range(1, 11), weights=weights)[0]
-        
+
         # Generate invoice lines and calculate total
         invoice_total = 0
         used_tracks = set()
-        
-        for _ in range(num_tracks):
+
+        for _ in range(line_counts[i]):
             # Select a random track (1-3503 for existing tracks, or up to 3942 if new tracks added)
-            track_id = random.randint(1, 3942)
-            
+            track_id = line_rng.randint(1, 3942)
+
             # Avoid duplicate tracks in same invoice
             if track_id in used_tracks:
-                track_id = random.randint(1, 3942)
+                track_id = line_rng.randint(1, 3942)
             used_tracks.add(track_id)
-            
+
             # Unit price and quantity
-            unit_price = random.choice(track_prices)
-            quantity = random.choices([1, 2, 3], weights=[0.80, 0.15, 0.05])[0]  # Most purchases are qty 1
-            
-            line_total = round(unit_price * quantity, 2)
-            invoice_total += line_total
-            
+            unit_price = line_rng.choice(TRACK_PRICES)
+            quantity = line_rng.choices(QUANTITIES, cum_weights=QUANTITY_CUM_WEIGHTS)[0]
+
+            invoice_total += unit_price * quantity
+
             # Create invoice line
-            invoice_line = f"    ({invoice_line_id}, {invoice_id}, {track_id}, {unit_price}, {quantity})"
-            invoice_lines.append(invoice_line)
+            invoice_lines.append(InvoiceLineRow(invoice_line_id, invoice_id, track_id, unit_price, quantity))
             invoice_line_id += 1
-        
-        invoice_total = round(invoice_total, 2)
-        
-        invoice_total = round(invoice_total, 2)
-        
+
         # Use customer's billing address (90% of the time) or generate random address (10% for different shipping)
-        if customers_dict and customer_id in customers_dict and random.random() < 0.90:
+        if addresses and customer_id in addresses and rng.random() < 0.90:
             # Use customer's actual address
-            customer_data = customers_dict[customer_id]
-            billing_address = customer_data['address']
-            city = customer_data['city']
-            state = customer_data['state']
-            country = customer_data['country']
-            postal = customer_data['postal']
+            billing_address, city, state, country, postal = addresses.billing_address(customer_id)
         else:
             # Generate random billing address (for gift purchases, work address, etc.)
-            location = random.choice(LOCATIONS)
-            country, city, state, postal_prefix, _, _ = location
-            
-            street_num = random.randint(1, 9999)
-            street_names = ['Main St', 'High St', 'Park Ave', 'Oak Rd', 'Maple Dr', 'Church St']
-            billing_address = f"{street_num} {random.choice(street_names)}"
-            
-            if '-' in postal_prefix:
-                parts = postal_prefix.split('-')
-                if parts[0].replace(' ', '').isdigit() and parts[1].replace(' ', '').isdigit():
-                    min_val = int(parts[0].replace(' ', ''))
-                    max_val = int(parts[1].replace(' ', ''))
-                    if min_val < max_val:
-                        postal = str(random.randint(min_val, max_val))
-                    else:
-                        postal = parts[0]
-                else:
-                    postal = parts[0]
-            else:
-                postal = postal_prefix
-        
-        state_str = f"N'{state}'" if state else 'NULL'
-        
-        invoice = f"    ({customer_id}, '{date_str}', N'{billing_address}', N'{city}', {state_str}, N'{country}', N'{postal}', {invoice_total})"
-        invoices.append(invoice)
-    
+            location = rng.choice(COMPILED_LOCATIONS)
+            country, city, state = location.country, location.city, location.state
+
+            street_num = rng.randint(1, 9999)
+            billing_address = f"{street_num} {rng.choice(BILLING_STREET_NAMES)}"
+
+            postal_range = location.postal_range
+            postal = str(rng.randint(*postal_range)) if postal_range else location.postal_code
+
+        invoices.append(InvoiceRow(invoice_id, customer_id, invoice_date, billing_address, city, state,
+                                   country, postal, invoice_total))
+
+    return invoices, invoice_lines
+
+_dates = None
+
+def _invoice_dates():
+    """Every possible invoice date (Jan 1, 2022 - Jan 19, 2026), built once per process"""
+    global _dates
+    if _dates is None:
+        start_date = date(2022, 1, 1)
+        total_days = (date(2026, 1, 19) - start_date).days
+        _dates = [start_date + timedelta(days=d) for d in range(total_days + 1)]
+    return _dates
+
+def _numpy_block_rng(seed, table, block):
+    """NumPy counterpart of _block_rng()"""
+    import numpy as np
+    return np.random.default_rng([seed, zlib.crc32(table.encode()), block])
+
+def _numpy_invoice_line_counts(seed, block, count):
+    """NumPy counterpart of _invoice_line_counts()"""
+    import numpy as np
+    rng = _numpy_block_rng(seed, 'invoice_lines', block)
+    weights = np.array(INVOICE_LINE_COUNT_WEIGHTS)
+    return rng, rng.choice(np.arange(1, 11), size=BATCH_ROWS, p=weights / weights.sum())[:count]
+
+def _numpy_invoice_block(seed, block, start_id, count, invoice_line_id, customer_id_start, customer_count):
+    """Vectorized _invoice_block(): draws each column for the whole block as an array
+
+    Same distributions as the pure Python engine (tracks are drawn without replacement
+    within an invoice), but not the same values for a given seed. Columns are always drawn
+    for a full block and then cut to `count`, so a short final block holds exactly the
+    first rows of the full one.
+    """
+    import numpy as np
+
+    rng = _numpy_block_rng(seed, 'invoices', block)
+    line_rng, line_counts = _numpy_invoice_line_counts(seed, block, BATCH_ROWS)
+    addresses = _shared
+
+    dates = _invoice_dates()
+    total_days = len(dates) - 1
+
+    invoice_ids = np.arange(start_id, start_id + BATCH_ROWS)
+    customer_ids = rng.integers(customer_id_start, customer_id_start + customer_count, size=BATCH_ROWS)
+    day_offsets = rng.integers(0, total_days + 1, size=BATCH_ROWS)
+
+    # Invoice lines: owner[i] is the position of line i's invoice within the block
+    line_total = int(line_counts.sum())
+    owner = np.repeat(np.arange(BATCH_ROWS), line_counts)
+    tracks = line_rng.integers(1, 3943, size=line_total)
+    # Replacements for tracks already used earlier in the same invoice. Each line has its own,
+    # so resolving duplicates in one invoice never changes another's tracks.
+    spare_tracks = line_rng.integers(1, 3943, size=(line_total, 4))
+    attempt = 0
+    while True:
+        _, first = np.unique(owner * 4096 + tracks, return_index=True)
+        duplicate = np.ones(line_total, dtype=bool)
+        duplicate[first] = False
+        if not duplicate.any():
+            break
+        if attempt < spare_tracks.shape[1]:
+            tracks[duplicate] = spare_tracks[duplicate, attempt]
+        else:
+            tracks[duplicate] = tracks[duplicate] % 3942 + 1
+        attempt += 1
+    unit_prices = np.where(line_rng.random(line_total) < 0.80, 99, 199)  # 80% at 0.99, 20% at 1.99
+    quantities = line_rng.choice(np.array(QUANTITIES), size=line_total, p=QUANTITY_WEIGHTS)
+
+    # Invoice totals are the grouped sum of each invoice's line amounts
+    line_starts = np.concatenate(([0], np.cumsum(line_counts)[:-1]))
+    totals = np.add.reduceat(unit_prices * quantities, line_starts)
+
+    # Billing address: the customer's own (90%) or a random one
+    own_address = rng.random(BATCH_ROWS) < 0.90
+    location_idx = rng.integers(0, len(COMPILED_LOCATIONS), size=BATCH_ROWS)
+    street_nums = rng.integers(1, 10000, size=BATCH_ROWS)
+    street_idx = rng.integers(0, len(BILLING_STREET_NAMES), size=BATCH_ROWS)  # Index into STREET_NAMES too
+    postal_draws = rng.random(BATCH_ROWS)
+
+    # Keep only the block's first `count` invoices and their lines
+    line_total = int(line_counts[:count].sum())
+    invoice_ids, customer_ids, day_offsets, totals = (invoice_ids[:count], customer_ids[:count],
+                                                      day_offsets[:count], totals[:count])
+    own_address, location_idx, street_nums, street_idx, postal_draws = (
+        own_address[:count], location_idx[:count], street_nums[:count], street_idx[:count], postal_draws[:count])
+    owner, tracks = owner[:line_total], tracks[:line_total]
+    unit_prices, quantities = unit_prices[:line_total], quantities[:line_total]
+
+    # Random addresses draw the postal code from the location's range (-1: fixed code)
+    postal_min = np.array([location.postal_range[0] if location.postal_range else -1
+                           for location in COMPILED_LOCATIONS])
+    postal_span = np.array([location.postal_range[1] - location.postal_range[0] + 1 if location.postal_range else 0
+                            for location in COMPILED_LOCATIONS])
+    postals = np.where(postal_span[location_idx] > 0,
+                       postal_min[location_idx] + (postal_draws * postal_span[location_idx]).astype(np.int64), -1)
+
+    # Customers' own addresses are gathered from the address store columns. Billing street
+    # names are the first entries of STREET_NAMES, so both index the same list.
+    if addresses:
+        store_idx = customer_ids - addresses.first_id
+        own_address &= (store_idx >= 0) & (store_idx < len(addresses))
+        store_idx = np.where(own_address, store_idx, 0)
+        location_idx = np.where(own_address, np.frombuffer(addresses.location, dtype=np.uint16)[store_idx], location_idx)
+        street_nums = np.where(own_address, np.frombuffer(addresses.street_number, dtype=np.uint16)[store_idx], street_nums)
+        street_idx = np.where(own_address, np.frombuffer(addresses.street, dtype=np.uint8)[store_idx], street_idx)
+        store_postals = np.frombuffer(addresses.postal, dtype=np.dtype(f'i{addresses.postal.itemsize}'))
+        postals = np.where(own_address, store_postals[store_idx], postals)
+
+    invoices = []
+    for invoice_id, customer_id, day, loc, street_num, street, postal, total in zip(
+            invoice_ids.tolist(), customer_ids.tolist(), day_offsets.tolist(), location_idx.tolist(),
+            street_nums.tolist(), street_idx.tolist(), postals.tolist(), totals.tolist()):
+        location = COMPILED_LOCATIONS[loc]
+        invoices.append(InvoiceRow(invoice_id, customer_id, dates[day], f"{street_num} {STREET_NAMES[street]}",
+                                   location.city, location.state, location.country,
+                                   str(postal) if postal >= 0 else location.postal_code, total))
+
+    # Build the line tuples straight from the column lists, skipping the per-row constructor call
+    make_line = partial(tuple.__new__, InvoiceLineRow)
+    line_ids = range(invoice_line_id, invoice_line_id + line_total)
+    invoice_lines = list(map(make_line, zip(line_ids, invoice_ids[owner].tolist(), tracks.tolist(),
+                                            unit_prices.tolist(), quantities.tolist())))
     return invoices, invoice_lines
 
+# Invoice generation engines: (line count draw, block generator)
+INVOICE_ENGINES = {
+    'python': (_invoice_line_counts, _invoice_block),
+    'numpy': (_numpy_invoice_line_counts, _numpy_invoice_block),
+}
+
+def numpy_available():
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
 # Real artists from charts with clean content (200 popular artists)
 CHART_ARTISTS = [
     # Pop/Contemporary (50 artists)
@@ -711,32 +1153,39 @@ CHART_ARTISTS = [
                      ('Gossamer', ['Take A Walk', 'Carried Away'])]),
 ]
 
-def generate_artists_albums_tracks(start_artist_id=276, start_album_id=348, start_track_id=3504):
-    """Generate 200 real artists with albums and tracks from charts"""
+
+def generate_artists_albums_tracks(start_artist_id=FIRST_IDS[ARTIST], start_album_id=FIRST_IDS[ALBUM],
+                                   start_track_id=FIRST_IDS[TRACK], seed=None):
+    """Generate real artists with albums and tracks from charts
+
+    The catalog is small and fixed, so it is drawn from a single random stream.
+
+    Returns:
+        tuple: (artists, albums, tracks) as lists of ArtistRow, AlbumRow and TrackRow records
+    """
+    rng = _block_rng(_resolve_seed(seed), 'catalog', 0)
     artists = []
     albums = []
     tracks = []
-    
+
     artist_id = start_artist_id
     album_id = start_album_id
     track_id = start_track_id
-    
+
     # Genre IDs (from existing Chinook schema): 1=Rock, 2=Jazz, 3=Metal, 4=Alternative, 7=Latin, 8=Reggae, 9=Pop, 13=Heavy Metal, 17=Hip Hop/Rap, 20=R&B/Soul, 23=Alternative & Punk
     genre_mapping = {
-        'Rock': 1, 'Pop': 9, 'Alternative': 4, 'Hip Hop': 17, 'R&B': 20, 
+        'Rock': 1, 'Pop': 9, 'Alternative': 4, 'Hip Hop': 17, 'R&B': 20,
         'Country': 2, 'Electronic': 4, 'Jazz': 2, 'Soul': 20
     }
-    
+
     # MediaType: 1=MPEG, 2=Protected AAC, 3=Protected MPEG-4, 4=Purchased AAC, 5=AAC
     media_type = 1  # MPEG audio file
-    
+
     for artist_name, artist_albums in CHART_ARTISTS:
-        # Insert artist - escape single quotes for SQL
-        artist_escaped = artist_name.replace("'", "''")
-        artists.append(f"    (N'{artist_escaped}')")
+        artists.append(ArtistRow(artist_id, artist_name))
         current_artist_id = artist_id
         artist_id += 1
-        
+
         # Determine genre based on artist position in list
         if 'Taylor Swift' in artist_name or 'Katy Perry' in artist_name or 'Ariana Grande' in artist_name:
             genre_id = 9  # Pop
@@ -751,37 +1200,253 @@ def generate_artists_albums_tracks(start_artist_id=276, start_album_id=348, star
         elif 'Stevie Wonder' in artist_name or 'Marvin Gaye' in artist_name or 'Whitney Houston' in artist_name:
             genre_id = 20  # R&B/Soul
         else:
-            genre_id = random.choice([1, 4, 9])
-        
+            genre_id = rng.choice([1, 4, 9])
+
         for album_name, track_list in artist_albums:
-            # Insert album - escape single quotes for SQL
-            album_escaped = album_name.replace("'", "''")
-            albums.append(f"    (N'{album_escaped}', {current_artist_id})")
+            albums.append(AlbumRow(album_id, album_name, current_artist_id))
             current_album_id = album_id
             album_id += 1
-            
+
             # Insert tracks
             for track_name in track_list:
                 # Random duration between 3-5 minutes (in milliseconds)
-                duration_ms = random.randint(180000, 300000)
+                duration_ms = rng.randint(180000, 300000)
                 # Random file size between 5-12 MB (in bytes)
-                file_bytes = random.randint(5000000, 12000000)
-                # Price between $0.99-$1.29
-                price = random.choice([0.99, 1.29])
-                
-                # Escape single quotes for SQL
-                track_escaped = track_name.replace("'", "''")
-                tracks.append(f"    (N'{track_escaped}', {current_album_id}, {media_type}, {genre_id}, NULL, {duration_ms}, {file_bytes}, {price})")
+                file_bytes = rng.randint(5000000, 12000000)
+                # Price between $0.99-$1.29 (in cents)
+                price = rng.choice([99, 129])
+
+                tracks.append(TrackRow(track_id, track_name, current_album_id, media_type, genre_id, None,
+                                       duration_ms, file_bytes, price))
                 track_id += 1
-    
+
     return artists, albums, tracks
 
+# Tables in foreign key order - the order rows are generated, written and inserted
+TABLES = (ARTIST, ALBUM, TRACK, CUSTOMER, INVOICE, INVOICE_LINE, SYSTEM_LOG)
+
+# Foreign keys between generated tables: table -> ((column, referenced table), ...)
+FOREIGN_KEYS = {
+    ALBUM: (('ArtistId', ARTIST),),
+    TRACK: (('AlbumId', ALBUM),),
+    INVOICE: (('CustomerId', CUSTOMER),),
+    INVOICE_LINE: (('InvoiceId', INVOICE), ('TrackId', TRACK)),
+    SYSTEM_LOG: (('InvoiceId', INVOICE),),
+}
+
+class DatasetPlan(NamedTuple):
+    """Row counts and seed for one generation run - the same plan always yields the same data
+
+    Output is prefix-stable: for a given seed, the first N customers are the same whatever
+    the total. Invoices and their lines are prefix-stable for a fixed customer count, and
+    log entries for a fixed invoice count. The existing_* counts describe rows already
+    loaded by an earlier run with the same seed; only rows after them are emitted, and
+    they are exactly the rows a full run of this plan would produce. The catalog is only
+    emitted by a full run. existing_invoice_lines is only set when a load stopped part-way
+    through the lines of its invoices (see LoadCheckpoint); by default the existing lines
+    are those of the existing invoices.
+
+    The first_*_id fields place the generated rows; they only move for a top-up run (see
+    top_up_plan()). New invoices bill customers from FIRST_IDS[CUSTOMER] up to the last
+    generated one, and log entries reference invoices likewise, so rows a top-up run
+    starts after are assumed to fill their IDs without gaps. catalog is False when the
+    database already holds the chart catalog.
+    """
+    customers: int = 941
+    invoices: int = 3588
+    systemlog: int = 0
+    seed: int = 0
+    engine: str = 'python'  # Invoice engine, see INVOICE_ENGINES
+    existing_customers: int = 0
+    existing_invoices: int = 0
+    existing_systemlog: int = 0
+    existing_invoice_lines: Optional[int] = None
+    first_customer_id: int = FIRST_IDS[CUSTOMER]
+    first_invoice_id: int = FIRST_IDS[INVOICE]
+    first_invoice_line_id: int = FIRST_IDS[INVOICE_LINE]
+    first_log_id: int = FIRST_IDS[SYSTEM_LOG]
+    catalog: bool = True
+
+    def batches(self, workers=1):
+        """Generate the dataset (see generate_dataset())"""
+        return generate_dataset(self, workers)
+
+    @property
+    def is_delta(self):
+        return bool(self.existing_customers or self.existing_invoices or self.existing_systemlog
+                    or self.existing_invoice_lines)
+
+    @property
+    def emits_catalog(self):
+        return self.catalog and not self.is_delta
+
+    @property
+    def billed_customers(self):
+        """Number of customers, from FIRST_IDS[CUSTOMER] on, that invoices are drawn from"""
+        return self.first_customer_id - FIRST_IDS[CUSTOMER] + self.customers
+
+    @property
+    def logged_invoices(self):
+        """Number of invoices, from FIRST_IDS[INVOICE] on, that log entries reference"""
+        return self.first_invoice_id - FIRST_IDS[INVOICE] + self.invoices
+
+    def table_seed(self, spec):
+        """Seed for the rows of CUSTOMER, INVOICE (with its lines) or SYSTEM_LOG
+
+        Block streams are keyed by block number, so rows placed after other rows (a top-up
+        run) mix their first ID into the seed; otherwise they would repeat, under the new
+        IDs, the rows a run from FIRST_IDS starts with.
+        """
+        first_id = {CUSTOMER: self.first_customer_id, INVOICE: self.first_invoice_id,
+                    SYSTEM_LOG: self.first_log_id}[spec]
+        if first_id == FIRST_IDS[spec]:
+            return self.seed
+        return zlib.crc32(f"{self.seed}/{spec.name}/{first_id}".encode())
+
+    def expected_rows(self):
+        """Rows each table will receive, or None where it is only known after generation"""
+        albums = [album for _, artist_albums in CHART_ARTISTS for album in artist_albums]
+        catalog = self.emits_catalog
+        return {
+            ARTIST: len(CHART_ARTISTS) if catalog else 0,
+            ALBUM: len(albums) if catalog else 0,
+            TRACK: sum(len(track_list) for _, track_list in albums) if catalog else 0,
+            CUSTOMER: max(self.customers - self.existing_customers, 0),
+            INVOICE: max(self.invoices - self.existing_invoices, 0),
+            INVOICE_LINE: None,  # 1-10 lines per invoice, drawn during generation
+            SYSTEM_LOG: max(self.systemlog - self.existing_systemlog, 0),
+        }
+
+def generate_dataset(plan, workers=1):
+    """Generate the whole dataset lazily
+
+    Args:
+        plan: DatasetPlan with the row counts and seed
+        workers: Number of processes to generate customer, invoice and log blocks in.
+            The output is identical for any number of workers.
+
+    Yields:
+        (TableSpec, rows) pairs in foreign key order, each holding at most BATCH_ROWS rows.
+        Invoice and invoice line batches are interleaved (see generate_invoices()).
+    """
+    if plan.emits_catalog:
+        artists, albums, tracks = generate_artists_albums_tracks(seed=plan.seed)
+        for spec, rows in ((ARTIST, artists), (ALBUM, albums), (TRACK, tracks)):
+            for batch in _batched(rows):
+                yield spec, batch
+
+    # Addresses are kept so invoices can bill customers at their own address. Customers that
+    # already exist are regenerated (not emitted) so their addresses are known too.
+    addresses = CustomerAddressStore(first_id=plan.first_customer_id)
+    first_customer_id = plan.first_customer_id + plan.existing_customers
+    for batch in generate_customers(start_id=plan.first_customer_id, count=plan.customers, seed=plan.table_seed(CUSTOMER),
+                                    workers=workers, addresses=addresses):
+        batch = [customer for customer in batch if customer.customer_id >= first_customer_id]
+        if batch:
+            yield CUSTOMER, batch
+
+    # Only reference generated customers (60+) to avoid dependency on original data
+    if plan.invoices > plan.existing_invoices or plan.existing_invoice_lines is not None:
+        yield from generate_invoices(start_id=plan.first_invoice_id, count=plan.invoices,
+                                     customer_count=plan.billed_customers, customer_id_start=FIRST_IDS[CUSTOMER],
+                                     addresses=addresses, start_line_id=plan.first_invoice_line_id,
+                                     seed=plan.table_seed(INVOICE), workers=workers, engine=plan.engine,
+                                     skip=plan.existing_invoices, skip_lines=plan.existing_invoice_lines)
+
+    for batch in generate_systemlog(count=plan.systemlog, invoice_count=plan.logged_invoices,
+                                    seed=plan.table_seed(SYSTEM_LOG), workers=workers, skip=plan.existing_systemlog,
+                                    start_id=plan.first_log_id):
+        yield SYSTEM_LOG, batch
+
+def top_up_plan(plan, state):
+    """The plan that grows a database's tables to the row counts of `plan`
+
+    Args:
+        plan: DatasetPlan whose customers, invoices and systemlog are the row counts the
+            tables should end up with, rows already there included
+        state: TableSpec -> (rows, highest ID or None) of the database, as returned by
+            read_table_state() or read_table_manifest(); missing tables count as empty
+
+    Returns:
+        A DatasetPlan of the missing rows only, with IDs after the highest in use (and never
+        below FIRST_IDS). The catalog is left out if the database already holds it.
+
+    Raises:
+        ValueError: if the new invoices or log entries would have nothing to reference
+    """
+    def first_id(spec):
+        last_id = state.get(spec, (0, None))[1]
+        return FIRST_IDS[spec] if last_id is None else max(last_id + 1, FIRST_IDS[spec])
+
+    def missing(spec, target):
+        return max(target - state.get(spec, (0, None))[0], 0)
+
+    topped_up = plan._replace(customers=missing(CUSTOMER, plan.customers),
+                              invoices=missing(INVOICE, plan.invoices),
+                              systemlog=missing(SYSTEM_LOG, plan.systemlog),
+                              first_customer_id=first_id(CUSTOMER), first_invoice_id=first_id(INVOICE),
+                              first_invoice_line_id=first_id(INVOICE_LINE), first_log_id=first_id(SYSTEM_LOG),
+                              catalog=all(first_id(spec) == FIRST_IDS[spec] for spec in (ARTIST, ALBUM, TRACK)))
+    if topped_up.invoices and not topped_up.billed_customers:
+        raise ValueError(f"the new invoices need customers from ID {FIRST_IDS[CUSTOMER]} on to bill")
+    if topped_up.systemlog and not topped_up.logged_invoices:
+        raise ValueError(f"the new log entries need invoices from ID {FIRST_IDS[INVOICE]} on to reference")
+    return topped_up
+
+def read_table_manifest(path):
+    """Read a table state for top_up_plan() from JSON: {"Customer": {"rows": n, "max_id": id}, ...}"""
+    with open(path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    specs = {spec.name: spec for spec in TABLES}
+    unknown = [name for name in manifest if name not in specs]
+    if unknown:
+        raise ValueError(f"unknown tables in {path}: {', '.join(unknown)}")
+    return {specs[name]: (int(entry.get('rows', 0)), None if entry.get('max_id') is None else int(entry['max_id']))
+            for name, entry in manifest.items()}
+
+def _import_pyodbc():
+    """pyodbc with connection pooling enabled, or None if it is not installed"""
+    try:
+        import pyodbc
+    except ImportError:
+        return None
+    pyodbc.pooling = True  # Must be set before the first connection is made
+    return pyodbc
+
+def connect_sqlserver(server, database, auth_type='windows', username=None, password=None):
+    """Open a pyodbc connection (from the pool) using the newest installed SQL Server ODBC driver"""
+    pyodbc = _import_pyodbc()
+    drivers = sorted(driver for driver in pyodbc.drivers() if re.match(r'ODBC Driver \d+ for SQL Server$', driver))
+    driver = drivers[-1] if drivers else 'SQL Server'
+    parts = [f"DRIVER={{{driver}}}", f"SERVER={server}", f"DATABASE={database}", "TrustServerCertificate=yes"]
+    if auth_type == 'windows':
+        parts.append("Trusted_Connection=yes")
+    else:
+        parts += [f"UID={username}", f"PWD={{{password}}}"]
+    return pyodbc.connect(";".join(parts), autocommit=False, timeout=10)
+
 def test_sqlserver_connection(server, database, auth_type='windows', username=None, password=None):
-    """Test SQL Server connection before generating files using sqlcmd"""
+    """Test SQL Server connection before generating files
+
+    Uses a pyodbc connection when pyodbc is installed - it goes back to the pool and is
+    reused by the load - and otherwise runs a query with sqlcmd.
+    """
     import subprocess
     
-    try:
-        # Build sqlcmd test command
+    if _import_pyodbc() is not None:
+        print(f"Testing connection to {server}/{database}...")
+        try:
+            connection = connect_sqlserver(server, database, auth_type, username, password)
+            connection.cursor().execute("SELECT 1").fetchall()
+            connection.close()
+        except Exception as e:
+            print(f"✗ Connection failed: {str(e)}\n")
+            return False
+        print("✓ Connection successful\n")
+        return True
+    
+    try:
+        # Build sqlcmd test command
         if auth_type == 'windows':
             cmd = ['sqlcmd', '-S', server, '-d', database, '-E', '-Q', 'SELECT 1']
         else:
@@ -810,12 +1475,126 @@ def test_sqlserver_connection(server, database, auth_type='windows', username=No
         print(f"✗ Connection failed: {str(e)}\n")
         return False
 
+# Script compression: file extension per --compress format
+COMPRESSIONS = {'gzip': '.gz', 'zstd': '.zst', 'xz': '.xz'}
+
+def _block_compressor(compression):
+    """Return a function compressing one block into a self-contained gzip member, zstd frame or xz stream
+
+    Concatenated members/frames/streams are valid files for gzip, zstd and xz alike, so
+    blocks can be compressed independently and written one after another.
+    """
+    if compression == 'gzip':
+        import gzip
+        return partial(gzip.compress, compresslevel=6, mtime=0)
+    if compression == 'xz':
+        import lzma
+        return partial(lzma.compress, preset=3)
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise SystemExit("--compress zstd requires the zstandard package (pip install zstandard)")
+        # A compressor is not thread-safe, so each block gets its own
+        return lambda data: zstandard.ZstdCompressor(level=3).compress(data)
+    raise ValueError(f"Unknown compression: {compression}")
+
+def open_compressed_text(path):
+    """Open a (possibly compressed) SQL script for streaming text reads, by file extension"""
+    if path.endswith(COMPRESSIONS['gzip']):
+        import gzip
+        return gzip.open(path, 'rt', encoding='utf-8')
+    if path.endswith(COMPRESSIONS['xz']):
+        import lzma
+        return lzma.open(path, 'rt', encoding='utf-8')
+    if path.endswith(COMPRESSIONS['zstd']):
+        import io
+        try:
+            import zstandard
+        except ImportError:
+            raise SystemExit("Reading .zst files requires the zstandard package (pip install zstandard)")
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), read_across_frames=True, closefd=True)
+        return io.TextIOWrapper(reader, encoding='utf-8')
+    return open(path, encoding='utf-8')
+
+class BlockCompressedWriter:
+    """Text file that compresses its output in independent blocks on a thread pool
+
+    Text is collected into blocks of about block_size characters; each full block is
+    compressed on a worker thread (zlib, lzma and zstd release the GIL while they work)
+    and the results are written in order. At most two blocks per thread are in flight,
+    so memory stays bounded when the disk is the bottleneck.
+    """
+
+    def __init__(self, path, compression, block_size=4 << 20, threads=None):
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._compress = _block_compressor(compression)
+        self._file = open(path, 'wb')
+        self._threads = threads or os.cpu_count() or 1
+        self._pool = ThreadPoolExecutor(max_workers=self._threads)
+        self._pending = deque()
+        self._parts = []
+        self._size = 0
+        self.block_size = block_size
+
+    def write(self, text):
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.block_size:
+            self._submit()
+        return len(text)
+
+    def _submit(self):
+        data = ''.join(self._parts).encode('utf-8')
+        self._parts = []
+        self._size = 0
+        self._pending.append(self._pool.submit(self._compress, data))
+        while len(self._pending) > 2 * self._threads:
+            self._file.write(self._pending.popleft().result())
+
+    def close(self):
+        if self._file.closed:
+            return
+        if self._parts:
+            self._submit()
+        while self._pending:
+            self._file.write(self._pending.popleft().result())
+        self._pool.shutdown()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
 def insert_to_sqlserver(server, database, sql_file, auth_type='windows', username=None, password=None):
-    """Execute SQL file directly into SQL Server database using sqlcmd utility"""
+    """Execute SQL directly into SQL Server database using sqlcmd utility
+
+    Args:
+        sql_file: Path of the SQL file to execute, or a callable that writes the script to a
+            text stream. A callable is piped straight into sqlcmd's stdin as it is generated,
+            so the script is never written to disk or held in memory. Compressed files
+            (.gz, .zst, .xz) are decompressed as a stream into stdin, since sqlcmd -i
+            only reads plain files.
+    """
+    import shutil
     import subprocess
-    import os
+    import threading
     import time
     
+    if not callable(sql_file) and sql_file.endswith(tuple(COMPRESSIONS.values())):
+        compressed_file = sql_file
+        print(f"Decompressing {compressed_file} into sqlcmd")
+        
+        def sql_file(f):
+            with open_compressed_text(compressed_file) as source:
+                shutil.copyfileobj(source, f, 1 << 20)
+    
+    streaming = callable(sql_file)
+    
     try:
         # Build sqlcmd command
         if auth_type == 'windows':
@@ -824,7 +1603,6 @@ def insert_to_sqlserver(server, database, sql_file, auth_type='windows', usernam
                 '-S', server,
                 '-d', database,
                 '-E',  # Windows Authentication
-                '-i', sql_file,
                 '-I'   # Enable QUOTED_IDENTIFIER
             ]
         else:
@@ -834,18 +1612,23 @@ def insert_to_sqlserver(server, database, sql_file, auth_type='windows', usernam
                 '-d', database,
                 '-U', username,
                 '-P', password,
-                '-i', sql_file,
                 '-I'   # Enable QUOTED_IDENTIFIER
             ]
+        if not streaming:
+            cmd += ['-i', sql_file]  # Otherwise sqlcmd reads the script from stdin
         
-        print(f"Executing SQL file via sqlcmd: {server}/{database}...")
-        print(f"  File: {sql_file}\n")
+        if streaming:
+            print(f"Streaming generated SQL via sqlcmd: {server}/{database}...\n")
+        else:
+            print(f"Executing SQL file via sqlcmd: {server}/{database}...")
+            print(f"  File: {sql_file}\n")
         
         start_time = time.time()
         
         # Execute sqlcmd with real-time output
         process = subprocess.Popen(
             cmd,
+            stdin=subprocess.PIPE if streaming else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
@@ -855,58 +1638,2953 @@ def insert_to_sqlserver(server, database, sql_file, auth_type='windows', usernam
             universal_newlines=True
         )
         
-        # Stream output in real-time
-        stdout_lines = []
-        stderr_lines = []
+        # Stream output in real-time (on a thread while we are busy feeding stdin)
+        def echo_output():
+            for line in process.stdout:
+                print(line.rstrip())
+        
+        if streaming:
+            reader = threading.Thread(target=echo_output, daemon=True)
+            reader.start()
+            try:
+                sql_file(process.stdin)
+                process.stdin.close()
+            except BrokenPipeError:
+                pass  # sqlcmd exited early; its stderr is reported below
+            reader.join()
+        else:
+            echo_output()
+        
+        # Wait for completion and get stderr
+        process.wait()
+        stderr_output = process.stderr.read()
+        
+        elapsed_time = time.time() - start_time
+        
+        # Check for errors
+        if process.returncode != 0:
+            print("\n" + "=" * 80)
+            print("ERROR: SQL execution failed")
+            print("=" * 80)
+            print(stderr_output)
+            return False
+        
+        print("\n" + "=" * 80)
+        print("SUCCESS: All data inserted directly into SQL Server database!")
+        print(f"Total execution time: {elapsed_time:.2f} seconds ({elapsed_time/60:.2f} minutes)")
+        print("=" * 80)
+        return True
+        
+    except FileNotFoundError:
+        print("\nERROR: sqlcmd utility not found.")
+        print("\nPlease ensure SQL Server Command Line Utilities are installed.")
+        print("Download from: https://docs.microsoft.com/en-us/sql/tools/sqlcmd-utility")
+        return False
+    except Exception as e:
+        print(f"\nERROR: {str(e)}")
+        return False
+
+
+class AdaptiveBatchSize:
+    """Rows per INSERT round trip for one table, tuned from the measured rows/sec
+
+    Starts at `initial` rows and keeps doubling while each doubling raises throughput by
+    at least `gain`, then settles on the fastest size measured. A batch slower than
+    max_seconds halves the size, and so does a failed batch at a size that has not
+    succeeded before (DirectLoader retries it in smaller pieces); after backing off the
+    size never grows past that point again. With minimum == maximum the size is fixed.
+    """
+    gain = 1.1
+    window_batches = 4  # Batches (and seconds) measured at each size before deciding
+    window_seconds = 0.2
+    max_seconds = 2.0
+
+    def __init__(self, initial=BATCH_ROWS, minimum=50, maximum=50000):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.size = min(max(initial, minimum), maximum)
+        self.proven = 0  # Largest batch inserted without an error
+        self.settled = minimum == maximum
+        self.best_size = None
+        self.best_rate = 0.0
+        self._rows = 0
+        self._seconds = 0.0
+        self._batches = 0
+
+    @property
+    def probing(self):
+        """True while the size has not yet succeeded (and could shrink), so a failure may be the size's fault"""
+        return self.proven < self.size > self.minimum
+
+    def record(self, rows, seconds):
+        """Account for a batch that succeeded"""
+        self.proven = max(self.proven, rows)
+        if seconds > self.max_seconds and rows >= self.size and self.size > self.minimum:
+            self._back_off()
+            return
+        if self.settled:
+            return
+        self._rows += rows
+        self._seconds += seconds
+        self._batches += 1
+        if self._batches < self.window_batches or self._seconds < self.window_seconds:
+            return
+        rate = self._rows / self._seconds
+        self._rows, self._seconds, self._batches = 0, 0.0, 0
+        if rate > self.best_rate * self.gain:
+            self.best_size, self.best_rate = self.size, rate
+            if self.size * 2 <= self.maximum:
+                self.size *= 2
+                return
+        self.size = self.best_size
+        self.settled = True
+
+    def failed(self):
+        """Back off after a failed batch at an unproven size; False if it cannot shrink"""
+        if self.size <= self.minimum:
+            return False
+        self._back_off()
+        return True
+
+    def _back_off(self):
+        self.maximum = max(self.size // 2, self.minimum)
+        self.size = self.maximum
+        self.best_size = min(self.best_size or self.size, self.size)
+        self.settled = True
+
+CHECKPOINT_FILE = 'chinook_load_checkpoint.json'
+
+class LoadCheckpoint:
+    """Progress of a checkpointed direct load, kept in a JSON state file for --resume
+
+    The file holds the target, the plan and, for each table, the rows committed so far
+    and the last committed ID. Generated data is deterministic, so remaining_plan() can
+    describe exactly the rows still missing as existing_* counts of the same plan. The
+    file is rewritten just before each commit with the counts being committed, and again
+    after it; if the load stops in between, settle() asks the database which one holds.
+    """
+
+    def __init__(self, path, target, plan, rows, committed=None, committing=None, complete=False):
+        self.path = path
+        self.target = target  # {'database': DIRECT_TARGETS key, 'connection': description}
+        self.plan = plan
+        self.rows = rows  # Commit about every this many rows
+        self.committed = committed or {}  # Table name -> {'rows': n, 'last_id': id}
+        self.committing = committing
+        self.complete = complete
+        self._earlier = dict(self.committed)  # Committed by earlier runs of the load
+
+    @classmethod
+    def load(cls, path):
+        """Read a state file (None if there is none)"""
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding='utf-8') as f:
+            state = json.load(f)
+        return cls(path, state['target'], DatasetPlan(**state['plan']), state['checkpoint_rows'],
+                   state['committed'], state['committing'], state['complete'])
+
+    def save(self):
+        state = {
+            'target': self.target,
+            'plan': self.plan._asdict(),
+            'checkpoint_rows': self.rows,
+            'committed': self.committed,
+            'committing': self.committing,
+            'complete': self.complete,
+        }
+        # Written to a temporary file and renamed, so a crash never leaves half a state file
+        temporary = f"{self.path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.path)
+
+    def begin_commit(self, row_counts, last_ids):
+        """Record the rows about to be committed (TableSpec -> rows and last ID of this run)"""
+        committing = {name: dict(entry) for name, entry in self._earlier.items()}
+        for spec, rows in row_counts.items():
+            entry = committing.setdefault(spec.name, {'rows': 0, 'last_id': None})
+            entry['rows'] += rows
+            entry['last_id'] = last_ids.get(spec, entry['last_id'])
+        self.committing = committing
+        self.save()
+
+    def end_commit(self):
+        self.committed, self.committing = self.committing, None
+        self.save()
+
+    def finish(self):
+        self.complete = True
+        self.save()
+
+    def settle(self, loader):
+        """Resolve a commit that was in progress when the load stopped, by looking for its last row"""
+        specs = {spec.name: spec for spec in TABLES}
+        changed = [name for name, entry in self.committing.items() if entry != self.committed.get(name)]
+        # Tables in load order: the first one changed is the most likely to exist in every schema
+        name = min(changed, key=lambda name: TABLES.index(specs[name]))
+        if loader.row_exists(specs[name], self.committing[name]['last_id']):
+            self.committed = self.committing
+        self.committing = None
+        self._earlier = dict(self.committed)
+        self.save()
+
+    def remaining_plan(self):
+        """The plan of the load, restricted to the rows that have not been committed"""
+        committed = {name: entry['rows'] for name, entry in self.committed.items()}
+        if not committed:
+            return self.plan
+        plan = self.plan
+        lines = plan.existing_invoice_lines
+        if lines is None:
+            lines = count_invoice_lines(plan.existing_invoices, plan.table_seed(INVOICE), plan.engine)
+        return plan._replace(existing_customers=plan.existing_customers + committed.get(CUSTOMER.name, 0),
+                             existing_invoices=plan.existing_invoices + committed.get(INVOICE.name, 0),
+                             existing_invoice_lines=lines + committed.get(INVOICE_LINE.name, 0),
+                             existing_systemlog=plan.existing_systemlog + committed.get(SYSTEM_LOG.name, 0))
+
+class LoadStrategy(NamedTuple):
+    """How a direct load trades durability and constraint checking for speed (--load-strategy)
+
+    Each loader maps the flags onto its database; see prepare(), restore() and the
+    loaders' begin() and begin_table().
+    """
+    name: str
+    description: str
+    batch_commits: bool  # Commit after every batch instead of once at the end
+    bulk_logging: bool  # The database's bulk-load settings (TABLOCK, UNLOGGED staging, unique_checks off)
+    unlogged: bool  # Write-ahead/redo logging off for the load wherever the database allows it
+    defer_constraints: bool  # Foreign keys not checked during the load, validated in one pass at the end
+
+    def report(self, rows, seconds, restore_seconds):
+        """Run report line with the throughput measured under this strategy"""
+        line = (f"Load strategy {self.name} ({self.description}): {rows:,} rows in {seconds:.1f}s "
+                f"({rows / max(seconds, 1e-9):,.0f} rows/sec)")
+        if self.bulk_logging or self.defer_constraints:
+            line += f", {restore_seconds:.1f}s of it restoring logging and validating constraints"
+        return line
+
+LOAD_STRATEGIES = {
+    'safe': LoadStrategy('safe', 'one transaction, fully logged, constraints checked per row',
+                         False, False, False, False),
+    'fast': LoadStrategy('fast', 'per-batch commits with bulk-load logging',
+                         True, True, False, False),
+    'unsafe-max': LoadStrategy('unsafe-max', 'per-batch commits, logging off, constraints validated at the end',
+                               True, True, True, True),
+}
+
+class DirectLoader:
+    """Streams (TableSpec, rows) batches into a database over one connection
+
+    Has the same begin()/write()/end() interface as SqlScriptWriter, so generated batches
+    go straight from the generator into the database, and generation workers keep
+    producing the next blocks while a batch is being inserted. Subclasses implement
+    insert() (and begin_table()/end_table() where a table needs setting up in each
+    transaction, finish() to undo session settings); this class prints timestamped
+    progress with rows/sec per table and commits at the end. commit() can also be called
+    between batches to load in several transactions (see ParallelLoader).
+    """
+    name = None
+    max_connections = None  # Connections that can usefully load at once (None: no limit)
+    progress_seconds = 5  # None for no progress messages
+    savepoint_name = 'chinook_batch'
+    # Column kind -> conversion of generated values into driver parameters
+    converters = {'money': lambda cents: Decimal(cents) / 100}
+
+    def __init__(self, connection, batch_size=None, checkpoint=None, strategy=LOAD_STRATEGIES['safe']):
+        """batch_size: rows per insert round trip, or None to size batches per table (AdaptiveBatchSize)
+        checkpoint: LoadCheckpoint to commit about every checkpoint.rows rows and record them in
+        strategy: LoadStrategy
+        """
+        self.connection = connection
+        self.batch_size = batch_size
+        self.checkpoint = checkpoint
+        self.strategy = strategy
+        # prepare() and restore() the load around begin() and end(); a ParallelLoader calls
+        # them once for all its connections instead
+        self.whole_load = True
+        self.committed_rows = 0
+        self.row_counts = {}
+        self.last_ids = {}  # TableSpec -> ID of the last row inserted
+        self.table_seconds = {}  # TableSpec -> seconds spent inserting
+        self.batch_sizes = {}  # TableSpec -> AdaptiveBatchSize
+        self._pending = {}  # TableSpec -> rows received but not yet inserted
+        self._converted_columns = {}
+        self._last_progress = {}
+        self._open_tables = []  # Tables written to in the current transaction
+        self._uncommitted = 0  # Rows received since the last commit
+        self._skip = set()  # Tables begin_table() found missing: their rows are dropped, not counted
+
+    def begin(self):
+        import time
+        self._start = time.perf_counter()
+        if self.whole_load:
+            self.prepare()
+
+    def write(self, spec, rows):
+        import time
+        if not rows or spec in self._skip:
+            return
+        if spec not in self._open_tables:
+            if spec not in self.row_counts:
+                self.row_counts[spec] = 0
+                self.table_seconds[spec] = 0.0
+                if self.batch_size:
+                    self.batch_sizes[spec] = AdaptiveBatchSize(self.batch_size, self.batch_size, self.batch_size)
+                else:
+                    self.batch_sizes[spec] = AdaptiveBatchSize()
+                if self.progress_seconds:
+                    self._progress(f"Inserting {spec.label}...")
+            self._open_tables.append(spec)
+            self.begin_table(spec)
+            if spec in self._skip:
+                self._open_tables.remove(spec)
+                del self.row_counts[spec]
+                return
+        # Rows are re-batched to the table's current batch size
+        pending = self._pending.setdefault(spec, [])
+        pending.extend(rows)
+        while len(pending) >= self.batch_sizes[spec].size:
+            size = self.batch_sizes[spec].size
+            self._insert_batch(spec, pending[:size])
+            del pending[:size]
+        self._uncommitted += len(rows)
+        checkpoint_due = self.checkpoint is not None and self._uncommitted >= self.checkpoint.rows
+        batch_due = self.strategy.batch_commits and self._uncommitted >= self.batch_sizes[spec].size
+        # The catalog is only generated by a full run, so it is never split over commits (see LoadCheckpoint)
+        if (checkpoint_due or batch_due) and spec not in (ARTIST, ALBUM, TRACK):
+            self.commit()
+            if checkpoint_due and self.progress_seconds:
+                self._progress(f"  Checkpoint: {spec.label} committed up to ID {self.last_ids[spec]:,}")
+        if not self.progress_seconds:
+            return
+        now = time.perf_counter()
+        if now - self._last_progress.setdefault(spec, now) >= self.progress_seconds:
+            self._last_progress[spec] = now
+            self._progress(f"  {spec.label}: {self.row_counts[spec]:,} rows ({self.rows_per_second(spec):,.0f} rows/sec, "
+                           f"batch size {self.batch_sizes[spec].size:,})")
+
+    def _insert_batch(self, spec, rows):
+        """Insert one batch, timing the round trip for the table's AdaptiveBatchSize"""
+        import time
+        batch_size = self.batch_sizes[spec]
+        probing = batch_size.probing
+        if probing:
+            self.savepoint()
+        started = time.perf_counter()
+        try:
+            self.insert(spec, rows)
+        except Exception as e:
+            # Only a batch at a size that has not worked before is retried smaller
+            if not probing or not batch_size.failed():
+                raise
+            self.rollback_to_savepoint()
+            self._progress(f"  {spec.label}: a batch of {len(rows):,} rows failed ({e}); "
+                           f"retrying in batches of {batch_size.size:,}")
+            # The size is read again for every piece: a piece that fails shrinks it further
+            start = 0
+            while start < len(rows):
+                piece = rows[start:start + batch_size.size]
+                self._insert_batch(spec, piece)
+                start += len(piece)
+            return
+        seconds = time.perf_counter() - started
+        if probing:
+            self.release_savepoint()
+        self.row_counts[spec] += len(rows)
+        self.last_ids[spec] = rows[-1][0]
+        self.table_seconds[spec] += seconds
+        batch_size.record(len(rows), seconds)
+
+    def flush(self, spec):
+        """Insert the rows of a table still waiting for a full batch"""
+        pending = self._pending.pop(spec, None)
+        if pending:
+            self._insert_batch(spec, pending)
+
+    def commit(self):
+        """End the tables written to in the current transaction and commit it"""
+        for spec in self._open_tables:
+            self.flush(spec)
+            self.end_table(spec)
+        self._open_tables = []
+        self._uncommitted = 0
+        if self.checkpoint is not None:
+            self.checkpoint.begin_commit(self.row_counts, self.last_ids)
+        self.connection.commit()
+        self.committed_rows = sum(self.row_counts.values())
+        if self.checkpoint is not None:
+            self.checkpoint.end_commit()
+
+    def end(self):
+        import time
+        self._progress("Committing transaction...")
+        self.commit()
+        self.finish()
+        restore_started = time.perf_counter()
+        if self.whole_load:
+            self.restore()
+        finished = time.perf_counter()
+        if self.checkpoint is not None:
+            self.checkpoint.finish()
+        for spec, rows in self.row_counts.items():
+            print(f"  ✓ {spec.name}: {rows:,} rows in {self.table_seconds[spec]:.1f}s "
+                  f"({self.rows_per_second(spec):,.0f} rows/sec, batch size {self.batch_sizes[spec].size:,})")
+        if self.whole_load:
+            print(f"  {self.strategy.report(self.committed_rows, finished - self._start, finished - restore_started)}")
+        self._progress(f"Data insertion completed successfully! ({finished - self._start:.1f}s)")
+
+    def rows_per_second(self, spec):
+        return self.row_counts[spec] / max(self.table_seconds[spec], 1e-9)
+
+    def _progress(self, message):
+        print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] {message}", flush=True)
+
+    def parameters(self, spec, rows):
+        """Rows as driver parameters, converted by column kind (cent amounts become Decimals)"""
+        positions = self._converted_columns.get(spec)
+        if positions is None:
+            positions = self._converted_columns[spec] = [(i, self.converters[kind])
+                                                         for i, (_, kind) in enumerate(spec.columns)
+                                                         if kind in self.converters]
+        if not positions:
+            return rows
+        converted = []
+        for row in rows:
+            row = list(row)
+            for i, convert in positions:
+                row[i] = convert(row[i])
+            converted.append(row)
+        return converted
+
+    def begin_table(self, spec):
+        """Prepare a table for inserts; add it to self._skip if it is missing from the database"""
+        pass
+
+    def insert(self, spec, rows):
+        raise NotImplementedError
+
+    def end_table(self, spec):
+        pass
+
+    def finish(self):
+        """Called once after the last commit"""
+        pass
+
+    def prepare(self):
+        """Apply the load strategy's database-wide settings before the first batch (committed)"""
+        pass
+
+    def restore(self, validate=True):
+        """Undo prepare() after the load; validate deferred constraints unless the load failed"""
+        pass
+
+    def row_exists(self, spec, row_id):
+        """Whether the row with this ID is in the database"""
+        self.cursor.execute(f"SELECT COUNT(*) FROM {self.dialect.table_name(spec)} "
+                            f"WHERE {self.dialect.column_name(spec.columns[0][0])} = {int(row_id)}")
+        return bool(self.cursor.fetchone()[0])
+
+    def table_exists(self, spec):
+        raise NotImplementedError
+
+    def table_state(self, spec):
+        """(rows, highest ID) of a table for a top-up run; (0, None) when it is empty or missing"""
+        if not self.table_exists(spec):
+            return 0, None
+        self.cursor.execute(f"SELECT COUNT(*), MAX({self.dialect.column_name(spec.columns[0][0])}) "
+                            f"FROM {self.dialect.table_name(spec)}")
+        rows, last_id = self.cursor.fetchone()
+        return int(rows), None if last_id is None else int(last_id)
+
+    def savepoint(self):
+        self.cursor.execute(f"SAVEPOINT {self.savepoint_name}")
+
+    def rollback_to_savepoint(self):
+        self.cursor.execute(f"ROLLBACK TO SAVEPOINT {self.savepoint_name}")
+
+    def release_savepoint(self):
+        # Released at once: PostgreSQL slows down when many subtransactions are open
+        self.cursor.execute(f"RELEASE SAVEPOINT {self.savepoint_name}")
+
+    def rollback(self):
+        self._open_tables = []
+        self._pending = {}
+        try:
+            self.connection.rollback()
+        except Exception:
+            pass
+        if not self.whole_load:
+            return
+        if self.committed_rows:
+            print(f"{self.committed_rows:,} rows committed before the failure are kept")
+        try:
+            self.restore(validate=False)
+        except Exception as e:
+            print(f"Could not undo the {self.strategy.name} load strategy's settings: {e}")
+
+class SqlServerLoader(DirectLoader):
+    """SQL Server through pyodbc: parameterised inserts sent with fast_executemany
+
+    fast_executemany binds a whole batch as one array of parameters, so rows are neither
+    rendered as T-SQL nor parsed by the server. IDENTITY_INSERT can only be on for one
+    table per session; it is switched only when the table changes (invoices and invoice
+    lines arrive interleaved), not around every batch.
+
+    Load strategies: bulk_logging inserts WITH (TABLOCK), which SQL Server can log
+    minimally under the SIMPLE or BULK_LOGGED recovery model; unlogged switches a FULL
+    recovery database to BULK_LOGGED for the load; defer_constraints disables the
+    tables' constraints (NOCHECK) and re-enables them WITH CHECK afterwards, which
+    validates every row in one pass and leaves them trusted.
+    """
+    name = 'mssql'
+
+    def __init__(self, connection, **options):
+        super().__init__(connection, **options)
+        self.dialect = DIALECTS['mssql']
+        self.cursor = connection.cursor()
+        self.cursor.fast_executemany = True
+        self._identity_table = None
+        self._statements = {}
+        self._recovery_model = None  # Recovery model to go back to after the load
+
+    def prepare(self):
+        if self.strategy.bulk_logging:
+            self.cursor.execute("SELECT recovery_model_desc FROM sys.databases WHERE name = DB_NAME()")
+            recovery_model = self.cursor.fetchone()[0]
+            if recovery_model == 'FULL' and self.strategy.unlogged:
+                self._alter_database("SET RECOVERY BULK_LOGGED")
+                self._recovery_model = recovery_model
+                self._progress("Recovery model switched from FULL to BULK_LOGGED for the load "
+                               "(take a full or log backup afterwards)")
+            elif recovery_model == 'FULL':
+                self._progress("The database uses the FULL recovery model, so TABLOCK inserts are still fully logged")
+        if self.strategy.defer_constraints:
+            for spec in TABLES:
+                table = self.dialect.table_name(spec)
+                self.cursor.execute(f"IF OBJECT_ID(N'{table}') IS NOT NULL ALTER TABLE {table} NOCHECK CONSTRAINT ALL")
+        self.connection.commit()
+
+    def restore(self, validate=True):
+        if self.strategy.defer_constraints:
+            # WITH CHECK checks the existing rows too, so the constraints are trusted again
+            check = "WITH CHECK CHECK" if validate else "CHECK"
+            for spec in TABLES:
+                table = self.dialect.table_name(spec)
+                self.cursor.execute(f"IF OBJECT_ID(N'{table}') IS NOT NULL ALTER TABLE {table} {check} CONSTRAINT ALL")
+            self.connection.commit()
+        if self._recovery_model is not None:
+            self._alter_database(f"SET RECOVERY {self._recovery_model}")
+            self._recovery_model = None
+
+    def _alter_database(self, setting):
+        # ALTER DATABASE cannot run inside a transaction
+        self.connection.commit()
+        self.connection.autocommit = True
+        try:
+            self.cursor.execute(f"ALTER DATABASE CURRENT {setting}")
+        finally:
+            self.connection.autocommit = False
+
+    def begin_table(self, spec):
+        placeholders = ", ".join("?" for _ in spec.columns)
+        if spec is SYSTEM_LOG:
+            # SystemLog has no IDENTITY column; padding is generated server-side
+            if not self.table_exists(spec):
+                self._progress("SystemLog table not found - skipping log entries")
+                self._skip.add(spec)
+            placeholders = "?, ?, ?, ? + ' | ' + REPLICATE('PADDING_', 70000)"
+        hint = " WITH (TABLOCK)" if self.strategy.bulk_logging else ""
+        self._statements[spec] = (f"INSERT INTO {self.dialect.table_name(spec)}{hint} ({self.dialect.column_list(spec)}) "
+                                  f"VALUES ({placeholders})")
+
+    def table_exists(self, spec):
+        self.cursor.execute(f"SELECT COUNT(*) FROM sys.tables WHERE name = '{spec.name}'")
+        return bool(self.cursor.fetchone()[0])
+
+    def _set_identity_insert(self, spec):
+        if self._identity_table is spec:
+            return
+        if self._identity_table is not None:
+            self.cursor.execute(f"SET IDENTITY_INSERT {self.dialect.table_name(self._identity_table)} OFF")
+        if spec is not None:
+            self.cursor.execute(f"SET IDENTITY_INSERT {self.dialect.table_name(spec)} ON")
+        self._identity_table = spec
+
+    def insert(self, spec, rows):
+        self._set_identity_insert(None if spec is SYSTEM_LOG else spec)
+        self.cursor.executemany(self._statements[spec], self.parameters(spec, rows))
+
+    def finish(self):
+        self._set_identity_insert(None)
+
+    def savepoint(self):
+        # Before the first statement there is no transaction (and nothing to roll back) yet
+        self.cursor.execute(f"IF @@TRANCOUNT > 0 SAVE TRANSACTION {self.savepoint_name}")
+
+    def rollback_to_savepoint(self):
+        self.cursor.execute(f"IF @@TRANCOUNT > 0 ROLLBACK TRANSACTION {self.savepoint_name}")
+
+    def release_savepoint(self):
+        pass
+
+# Markers on a PipelinedWriter queue
+_PIPELINE_END = object()
+_PIPELINE_ABORT = object()
+
+class PipelinedWriter:
+    """Runs a writer (begin()/write()/end()) in its own thread, fed through a bounded queue
+
+    write() only queues the batch, so the caller goes straight on to generating the next
+    one while the writer renders and sends the previous ones: generation, rendering and
+    database I/O overlap. Once the writer is `depth` batches behind, write() blocks, so
+    memory stays bounded however slow the database is. Everything the writer does runs
+    on its thread, including rolling back if it fails; its error is raised by the next
+    write() or by end().
+    """
+
+    def __init__(self, writer, depth=8):
+        import queue
+        self.writer = writer
+        self._queue = queue.Queue(maxsize=depth)
+        self._thread = None
+        self._error = None
+
+    def begin(self):
+        import threading
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def write(self, spec, rows):
+        if self._error is not None:
+            raise self._error
+        self._queue.put((spec, rows))
+
+    def end(self):
+        self._queue.put(_PIPELINE_END)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def rollback(self):
+        """Stop the writer after a failure in the caller; it rolls back on its own thread"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_PIPELINE_ABORT)
+            self._thread.join()
+
+    def _run(self):
+        item = None
+        try:
+            self.writer.begin()
+            while True:
+                item = self._queue.get()
+                if item is _PIPELINE_END or item is _PIPELINE_ABORT:
+                    break
+                self.writer.write(*item)
+            if item is _PIPELINE_END:
+                self.writer.end()
+                return
+        except Exception as e:
+            self._error = e
+        rollback = getattr(self.writer, 'rollback', None)
+        if rollback is not None:
+            rollback()
+        # Keep taking batches until the caller stops, so it never blocks on a full queue
+        while item is not _PIPELINE_END and item is not _PIPELINE_ABORT:
+            item = self._queue.get()
+
+def load_direct(source, loader, workers=1):
+    """Stream a dataset into a database through a DirectLoader (or a ParallelLoader)
+
+    The loader runs behind a PipelinedWriter, so the next batches are generated while
+    earlier ones are being inserted. A DirectLoader loads in one transaction, which is
+    rolled back if anything fails, unless it commits as it goes (--checkpoint, or a
+    LoadStrategy with batch_commits).
+
+    Returns:
+        dict: Rows inserted per TableSpec (none for a table the loader found missing), or
+        None if the load failed
+    """
+    pipeline = PipelinedWriter(loader)
+    try:
+        write_dataset(source.batches(workers), [pipeline])
+        return {spec: loader.row_counts.get(spec, 0) for spec in TABLES}
+    except Exception as e:
+        pipeline.rollback()
+        print("\n" + "=" * 80)
+        print(f"ERROR: Direct insertion failed, transaction rolled back: {e}")
+        print("=" * 80)
+        return None
+
+class ParallelLoader:
+    """Streams (TableSpec, rows) batches into a database over several connections at once
+
+    Each table is cut into partitions of consecutive rows - contiguous ID ranges - and
+    each partition is inserted and committed as one transaction by whichever connection
+    is free (a DirectLoader, each run in its own thread). A table's partitions only start
+    once every table it references (FOREIGN_KEYS) has been received in full and
+    committed, so the independent Artist/Album/Track and Customer chains load side by
+    side, and InvoiceLine and SystemLog spread over all the connections. Partitions that
+    arrive before their parents are committed are spooled to a temporary file rather
+    than held in memory.
+
+    The load is not one transaction: if it fails, partitions already committed are kept.
+    """
+    partition_rows = 50000
+    system_log_partition_rows = 5000  # SystemLog rows are padded on the server
+
+    def __init__(self, loaders, expected_rows):
+        """loaders: one DirectLoader per connection; expected_rows: see DatasetPlan.expected_rows()"""
+        import threading
+        from collections import deque
+        self.loaders = loaders
+        self.expected_rows = expected_rows
+        for loader in loaders:
+            loader.progress_seconds = None  # Progress is reported per partition instead
+            loader.whole_load = False  # The load strategy is prepared and restored once, below
+        self.row_counts = dict.fromkeys(TABLES, 0)  # Rows committed
+        self._received = dict.fromkeys(TABLES, 0)
+        self._buffers = {}  # TableSpec -> batches not yet cut into a partition
+        self._partitions = dict.fromkeys(TABLES, 0)  # Partitions cut so far
+        self._committed = dict.fromkeys(TABLES, 0)
+        self._complete = set()  # Tables that will receive no more rows
+        self._waiting = {spec: [] for spec in TABLES}  # Spool offsets of partitions waiting for parents
+        self._ready = deque()  # (spec, batches, spool offset) partitions to load, batches None if spooled
+        self._in_memory = 0  # Partitions in _ready held in memory
+        self._spools = {}
+        self._spool_lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._stream_ended = False
+        self._error = None
+        self._threads = []
+        self._started = {}  # TableSpec -> when its first partition started
+        self._finished = {}  # TableSpec -> when its last partition was committed
+
+    def begin(self):
+        import threading
+        import time
+        self._start = time.perf_counter()
+        self.loaders[0].prepare()
+        self._progress(f"Loading over {len(self.loaders)} connections...")
+        for number, loader in enumerate(self.loaders, 1):
+            thread = threading.Thread(target=self._work, args=(number, loader), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def write(self, spec, rows):
+        if not rows:
+            return
+        self._raise_error()
+        self._received[spec] += len(rows)
+        batches = self._buffers.setdefault(spec, [])
+        batches.append(rows)
+        limit = self.system_log_partition_rows if spec is SYSTEM_LOG else self.partition_rows
+        if sum(map(len, batches)) >= limit:
+            self._cut(spec)
+        expected = self.expected_rows.get(spec)
+        if expected is not None and self._received[spec] >= expected:
+            self._close(spec)
+
+    def end(self):
+        import time
+        for spec in TABLES:
+            self._close(spec)
+        with self._condition:
+            self._stream_ended = True
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+        self._raise_error()
+        for spec in TABLES:
+            rows = self.row_counts[spec]
+            if rows:
+                seconds = self._finished[spec] - self._started[spec]
+                sizes = sorted(loader.batch_sizes[spec].size for loader in self.loaders if spec in loader.batch_sizes)
+                sizes = f"{sizes[0]:,}" if sizes[0] == sizes[-1] else f"{sizes[0]:,}-{sizes[-1]:,}"
+                print(f"  ✓ {spec.name}: {rows:,} rows in {seconds:.1f}s ({rows / max(seconds, 1e-9):,.0f} rows/sec, "
+                      f"batch size {sizes})")
+        restore_started = time.perf_counter()
+        self.loaders[0].restore()
+        finished = time.perf_counter()
+        strategy = self.loaders[0].strategy
+        print(f"  {strategy.report(sum(self.row_counts.values()), finished - self._start, finished - restore_started)}")
+        self._progress(f"Data insertion completed successfully! ({finished - self._start:.1f}s "
+                       f"over {len(self.loaders)} connections)")
+
+    def rollback(self):
+        """Stop the connections after a failure (each rolls back its open partition)"""
+        with self._condition:
+            if self._error is None:
+                self._error = RuntimeError("load aborted")
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+        committed = ", ".join(f"{spec.name} {rows:,}" for spec, rows in self.row_counts.items() if rows)
+        if committed:
+            print(f"Rows already committed are kept: {committed}")
+        try:
+            self.loaders[0].restore(validate=False)
+        except Exception as e:
+            print(f"Could not undo the {self.loaders[0].strategy.name} load strategy's settings: {e}")
+
+    def _progress(self, message):
+        # One write per line, so lines from different connections don't run together
+        print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] {message}\n", end='', flush=True)
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def _parents_committed(self, spec):
+        return all(parent in self._complete and self._committed[parent] == self._partitions[parent]
+                   for _, parent in FOREIGN_KEYS.get(spec, ()))
+
+    def _cut(self, spec):
+        """Queue a table's buffered batches as one partition, or spool them if it has to wait"""
+        batches = self._buffers.pop(spec, None)
+        if not batches:
+            return
+        with self._condition:
+            self._partitions[spec] += 1
+            if self._parents_committed(spec):
+                # At most one partition per connection waits in memory, so generation
+                # cannot run far ahead of the database
+                while self._in_memory >= len(self.loaders) and self._error is None:
+                    self._condition.wait()
+                self._raise_error()
+                self._ready.append((spec, batches, None))
+                self._in_memory += 1
+                self._condition.notify_all()
+                return
+        offset = self._spool(spec, batches)
+        with self._condition:
+            # The parents may have been committed while the partition was being spooled
+            if self._parents_committed(spec):
+                self._ready.append((spec, None, offset))
+                self._condition.notify_all()
+            else:
+                self._waiting[spec].append(offset)
+
+    def _close(self, spec):
+        """Mark a table as received in full"""
+        self._cut(spec)
+        with self._condition:
+            self._complete.add(spec)
+            self._release()
+
+    def _release(self):
+        """Queue spooled partitions whose parents are now committed (called holding the condition)"""
+        for spec, offsets in self._waiting.items():
+            if offsets and self._parents_committed(spec):
+                self._ready.extend((spec, None, offset) for offset in offsets)
+                del offsets[:]
+        self._condition.notify_all()
+
+    def _done(self):
+        return self._error is not None or (self._stream_ended and self._committed == self._partitions)
+
+    def _spool(self, spec, batches):
+        import pickle
+        import tempfile
+        with self._spool_lock:
+            spool = self._spools.get(spec)
+            if spool is None:
+                spool = self._spools[spec] = tempfile.TemporaryFile()
+                parents = ", ".join(parent.name for _, parent in FOREIGN_KEYS[spec])
+                self._progress(f"{spec.name} waits for {parents} to be committed; spooling its rows to a temporary file")
+            spool.seek(0, os.SEEK_END)
+            offset = spool.tell()
+            pickle.dump(batches, spool, pickle.HIGHEST_PROTOCOL)
+            return offset
+
+    def _unspool(self, spec, offset):
+        import pickle
+        with self._spool_lock:
+            spool = self._spools[spec]
+            spool.seek(offset)
+            return pickle.load(spool)
+
+    def _work(self, number, loader):
+        """Load partitions on one connection until the dataset is loaded or the load fails"""
+        import time
+        try:
+            loader.begin()
+            while True:
+                with self._condition:
+                    while not self._ready and not self._done():
+                        self._condition.wait()
+                    if self._error is not None or not self._ready:
+                        break
+                    spec, batches, offset = self._ready.popleft()
+                    if batches is not None:
+                        self._in_memory -= 1
+                        self._condition.notify_all()
+                    self._started.setdefault(spec, time.perf_counter())
+                if batches is None:
+                    batches = self._unspool(spec, offset)
+                started = time.perf_counter()
+                inserted = loader.row_counts.get(spec, 0)
+                for rows in batches:
+                    loader.write(spec, rows)
+                loader.commit()
+                finished = time.perf_counter()
+                # Rows for a table the loader skips are not counted (see DirectLoader.begin_table())
+                rows = loader.row_counts.get(spec, 0) - inserted
+                with self._condition:
+                    self._committed[spec] += 1
+                    self.row_counts[spec] += rows
+                    self._finished[spec] = finished
+                    self._release()
+                if not rows:
+                    continue
+                self._progress(f"  {spec.name} {batches[0][0][0]}-{batches[-1][-1][0]} committed on connection "
+                               f"{number} ({rows / max(finished - started, 1e-9):,.0f} rows/sec)")
+            loader.finish()
+        except Exception as e:
+            loader.rollback()
+            with self._condition:
+                if self._error is None:
+                    self._error = e
+                self._condition.notify_all()
+
+class PostgresqlLoader(DirectLoader):
+    """PostgreSQL through psycopg (3, or psycopg2): every batch streamed in with COPY ... FROM STDIN
+
+    Batches are encoded in COPY text format in memory and copied over the one connection,
+    so the server parses no INSERT statements and nothing is written to disk. SystemLog
+    rows are copied into a temporary table and padded by REPEAT() as they are moved into
+    system_log, and identity sequences are moved past the new rows once everything is
+    committed.
+
+    Load strategies: bulk_logging turns synchronous_commit off for the session and makes
+    system_log (the bulk of the data, with no foreign keys) UNLOGGED for the load and
+    LOGGED again afterwards. defer_constraints drops the foreign keys from and to the
+    generated tables and re-creates them NOT VALID followed by VALIDATE CONSTRAINT;
+    without them, unlogged can make every generated table UNLOGGED for the load.
+    """
+    name = 'postgresql'
+
+    def __init__(self, connection, **options):
+        super().__init__(connection, **options)
+        self.dialect = SCRIPT_FORMATS['copy']
+        self.cursor = connection.cursor()
+        self._statements = {}
+        self._unlogged = []  # Tables made UNLOGGED for the load
+        self._dropped = []  # (table, constraint, definition) of the foreign keys dropped for the load
+
+    def begin(self):
+        super().begin()
+        if self.strategy.bulk_logging:
+            # Commits return before their WAL is flushed: a crash can lose the last ones, but corrupts nothing
+            self.cursor.execute("SET synchronous_commit = off")
+
+    def prepare(self):
+        if not self.strategy.bulk_logging:
+            return
+        names = ", ".join(f"'{self.dialect.table_name(spec)}'" for spec in TABLES)
+        self.cursor.execute(f"SELECT table_name FROM information_schema.tables "
+                            f"WHERE table_schema = current_schema() AND table_name IN ({names})")
+        tables = [row[0] for row in self.cursor.fetchall()]
+        if self.strategy.defer_constraints:
+            self.cursor.execute(f"SELECT conrelid::regclass::text, conname, pg_get_constraintdef(oid) FROM pg_constraint "
+                                f"WHERE contype = 'f' AND (conrelid::regclass::text IN ({names}) "
+                                f"OR confrelid::regclass::text IN ({names}))")
+            for table, constraint, definition in self.cursor.fetchall():
+                self.cursor.execute(f'ALTER TABLE {table} DROP CONSTRAINT "{constraint}"')
+                self._dropped.append((table, constraint, definition))
+            if self._dropped:
+                self._progress(f"Foreign keys dropped for the load: {', '.join(c for _, c, _ in self._dropped)}")
+        # A table with foreign keys to or from logged tables cannot be made UNLOGGED
+        every_table = self.strategy.unlogged and self.strategy.defer_constraints
+        for table in tables:
+            if every_table or table == self.dialect.table_name(SYSTEM_LOG):
+                self.cursor.execute(f"ALTER TABLE {table} SET UNLOGGED")
+                self._unlogged.append(table)
+        self.connection.commit()
+
+    def restore(self, validate=True):
+        for table in self._unlogged:
+            self.cursor.execute(f"ALTER TABLE {table} SET LOGGED")
+        self._unlogged = []
+        for table, constraint, definition in self._dropped:
+            self.cursor.execute(f'ALTER TABLE {table} ADD CONSTRAINT "{constraint}" {definition} NOT VALID')
+        self.connection.commit()
+        if validate:
+            for table, constraint, _ in self._dropped:
+                self.cursor.execute(f'ALTER TABLE {table} VALIDATE CONSTRAINT "{constraint}"')
+            self.connection.commit()
+        elif self._dropped:
+            self._progress("Foreign keys re-created NOT VALID; run ALTER TABLE ... VALIDATE CONSTRAINT to check them")
+        self._dropped = []
+
+    def table_exists(self, spec):
+        self.cursor.execute("SELECT EXISTS (SELECT FROM information_schema.tables "
+                            f"WHERE table_schema = current_schema() AND table_name = '{self.dialect.table_name(spec)}')")
+        return bool(self.cursor.fetchone()[0])
+
+    def begin_table(self, spec):
+        if spec is SYSTEM_LOG:
+            if not self.table_exists(spec):
+                self._progress("system_log table not found - skipping log entries")
+                self._skip.add(spec)
+                return
+            self.cursor.execute("CREATE TEMPORARY TABLE system_log_copy (log_id INTEGER, invoice_id INTEGER, "
+                                "log_date TIMESTAMP, log_message TEXT) ON COMMIT DROP")
+            self._statements[spec] = "COPY system_log_copy FROM STDIN"
+        else:
+            self._statements[spec] = f"COPY {self.dialect.table_name(spec)} ({self.dialect.column_list(spec)}) FROM STDIN"
+
+    def insert(self, spec, rows):
+        data = self.dialect.insert_batch(spec, rows)
+        if hasattr(self.cursor, 'copy'):
+            with self.cursor.copy(self._statements[spec]) as copy:
+                copy.write(data)
+        else:
+            import io
+            self.cursor.copy_expert(self._statements[spec], io.StringIO(data))
+
+    def end_table(self, spec):
+        if spec is SYSTEM_LOG:
+            self.cursor.execute(self.dialect.move_system_log())
+
+    def finish(self):
+        # Sequences are not transactional, so this also sees rows committed by other connections.
+        # Skipped tables are not in row_counts (see DirectLoader.write()).
+        for spec in self.row_counts:
+            self.cursor.execute(DIALECTS['postgresql'].end_table(spec, None, None))
+        self.connection.commit()
+
+def _import_psycopg():
+    """psycopg 3, or psycopg2, or None if neither is installed"""
+    try:
+        import psycopg
+        return psycopg
+    except ImportError:
+        pass
+    try:
+        import psycopg2
+        return psycopg2
+    except ImportError:
+        return None
+
+def connect_postgresql(host='localhost', port=5432, database='chinook', username='postgres', password=None):
+    """Open a psycopg connection; a blank password falls back to PGPASSWORD/.pgpass"""
+    psycopg = _import_psycopg()
+    parameters = dict(host=host, port=port, dbname=database, user=username, connect_timeout=10)
+    if password:
+        parameters['password'] = password
+    return psycopg.connect(**parameters)
+
+def test_postgresql_connection(host='localhost', port=5432, database='chinook', username='postgres', password=None):
+    """Test PostgreSQL connection before generating data"""
+    if _import_psycopg() is None:
+        print("✗ Connection failed: psycopg is not installed (pip install psycopg)\n")
+        return False
+    print(f"Testing connection to {host}:{port}/{database}...")
+    try:
+        connection = connect_postgresql(host, port, database, username, password)
+        connection.close()
+    except Exception as e:
+        print(f"✗ Connection failed: {str(e)}\n")
+        return False
+    print("✓ Connection successful\n")
+    return True
+
+class MysqlLoader(DirectLoader):
+    """MySQL through PyMySQL: multi-row INSERT statements sized to fit max_allowed_packet
+
+    Batches go through PyMySQL's executemany(), which folds them into multi-row INSERT
+    statements (PyMySQL has no server-side prepared statements). Its statement limit is
+    derived from the server's max_allowed_packet, so big batches never fail with "packet
+    too large". executemany() only folds a VALUES list of plain placeholders, so SystemLog
+    rows are staged in a temporary table and padded server-side by REPEAT() when
+    end_table() moves them into SystemLog.
+
+    Load strategies: bulk_logging turns unique_checks and foreign_key_checks off for the
+    session (MySQL's bulk-load advice); unlogged disables the InnoDB redo log for the
+    load (MySQL 8.0.21+, instance-wide, needs INNODB_REDO_LOG_ENABLE); defer_constraints
+    adds a validation pass that looks for rows whose foreign keys have no parent row.
+    """
+    name = 'mysql'
+    max_statement_bytes = 4 << 20
+
+    def __init__(self, connection, **options):
+        super().__init__(connection, **options)
+        self.dialect = DIALECTS['mysql']
+        self.cursor = connection.cursor()
+        self._statements = {}
+        self._checks = None  # Session unique_checks and foreign_key_checks to go back to
+        self._redo_log_disabled = False
+
+    def begin(self):
+        super().begin()
+        self.cursor.execute("SELECT @@max_allowed_packet")
+        max_allowed_packet = int(self.cursor.fetchone()[0])
+        # Leave room for the packet header and any multi-byte characters in the estimate
+        self.statement_limit = min(self.max_statement_bytes, max_allowed_packet - 64 * 1024)
+        self.cursor.max_stmt_length = self.statement_limit
+        self._progress(f"max_allowed_packet is {max_allowed_packet:,} bytes; "
+                       f"statements are kept under {self.statement_limit:,} bytes")
+        if self.strategy.bulk_logging:
+            self.cursor.execute("SELECT @@unique_checks, @@foreign_key_checks")
+            self._checks = tuple(self.cursor.fetchone())
+            self.cursor.execute("SET unique_checks = 0, foreign_key_checks = 0")
+
+    def finish(self):
+        # The connection is pooled, so session settings must not outlive the load
+        if self._checks is not None:
+            self.cursor.execute(f"SET unique_checks = {int(self._checks[0])}, foreign_key_checks = {int(self._checks[1])}")
+            self._checks = None
+
+    def rollback(self):
+        super().rollback()
+        try:
+            self.finish()
+        except Exception:
+            pass
+
+    def prepare(self):
+        if not self.strategy.unlogged:
+            return
+        try:
+            self.cursor.execute("ALTER INSTANCE DISABLE INNODB REDO_LOG")
+        except Exception as e:
+            self._progress(f"Could not disable the InnoDB redo log ({e}); loading with it on")
+            return
+        self._redo_log_disabled = True
+        self._progress("InnoDB redo log disabled for the load (a crash now can leave the instance unusable)")
+
+    def restore(self, validate=True):
+        if self._redo_log_disabled:
+            self.cursor.execute("ALTER INSTANCE ENABLE INNODB REDO_LOG")
+            self._redo_log_disabled = False
+        if not (validate and self.strategy.defer_constraints):
+            return
+        names = ", ".join(f"'{spec.name}'" for spec in TABLES)
+        self.cursor.execute("SELECT TABLE_NAME, COLUMN_NAME, REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME "
+                            "FROM information_schema.KEY_COLUMN_USAGE WHERE TABLE_SCHEMA = DATABASE() "
+                            f"AND REFERENCED_TABLE_NAME IS NOT NULL AND TABLE_NAME IN ({names})")
+        problems = []
+        for table, column, parent, parent_column in self.cursor.fetchall():
+            self.cursor.execute(f"SELECT COUNT(*) FROM `{table}` c LEFT JOIN `{parent}` p "
+                                f"ON p.`{parent_column}` = c.`{column}` "
+                                f"WHERE c.`{column}` IS NOT NULL AND p.`{parent_column}` IS NULL")
+            orphans = self.cursor.fetchone()[0]
+            if orphans:
+                problems.append(f"{orphans:,} {table} rows have a {column} with no {parent} row")
+        if problems:
+            raise RuntimeError(f"foreign key validation failed: {'; '.join(problems)}")
+
+    def table_exists(self, spec):
+        self.cursor.execute("SELECT COUNT(*) FROM information_schema.tables "
+                            f"WHERE table_schema = DATABASE() AND table_name = '{spec.name}'")
+        return bool(self.cursor.fetchone()[0])
+
+    def begin_table(self, spec):
+        table = self.dialect.table_name(spec)
+        if spec is SYSTEM_LOG:
+            if not self.table_exists(spec):
+                self._progress("SystemLog table not found - skipping log entries")
+                self._skip.add(spec)
+                return
+            # Temporary tables are per connection and neither statement commits the transaction
+            table = "SystemLogStage"
+            self.cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {table}")
+            self.cursor.execute(f"CREATE TEMPORARY TABLE {table} "
+                                "(LogId INT, InvoiceId INT, LogDate DATETIME, LogMessage LONGTEXT)")
+        placeholders = ", ".join("%s" for _ in spec.columns)
+        self._statements[spec] = f"INSERT INTO {table} ({self.dialect.column_list(spec)}) VALUES ({placeholders})"
+
+    def insert(self, spec, rows):
+        self.cursor.executemany(self._statements[spec], self.parameters(spec, rows))
+
+    def end_table(self, spec):
+        if spec is SYSTEM_LOG:
+            # MySQL generates ~7.8KB padding per row using REPEAT() while moving the staged rows
+            self.cursor.execute(f"INSERT INTO {self.dialect.table_name(SYSTEM_LOG)} ({self.dialect.column_list(SYSTEM_LOG)}) "
+                                "SELECT LogId, InvoiceId, LogDate, CONCAT(LogMessage, ' | ', REPEAT('PADDING_', 70000)) "
+                                "FROM SystemLogStage")
+            self.cursor.execute("DROP TEMPORARY TABLE SystemLogStage")
+
+def _import_pymysql():
+    try:
+        import pymysql
+        return pymysql
+    except ImportError:
+        return None
+
+# One open connection per MySQL server/database/user, shared by the connection test and the load
+_mysql_connections = {}
+
+def connect_mysql(host='localhost', port=3306, database='chinook', username='root', password=None, pooled=True):
+    """Return the pooled PyMySQL connection for these settings, opening it if needed
+
+    A blank password falls back to MYSQL_PWD. With pooled=False a new connection is
+    opened (and not pooled) every time.
+    """
+    key = (host, port, database, username)
+    connection = _mysql_connections.get(key) if pooled else None
+    if connection is not None:
+        connection.ping(reconnect=True)
+        return connection
+    pymysql = _import_pymysql()
+    connection = pymysql.connect(host=host, port=port, database=database, user=username,
+                                 password=password or os.environ.get('MYSQL_PWD', ''),
+                                 charset='utf8mb4', autocommit=False, connect_timeout=10)
+    if pooled:
+        _mysql_connections[key] = connection
+    return connection
+
+def test_mysql_connection(host='localhost', port=3306, database='chinook', username='root', password=None):
+    """Test MySQL connection before generating data (the connection is kept for the load)"""
+    if _import_pymysql() is None:
+        print("✗ Connection failed: PyMySQL is not installed (pip install pymysql)\n")
+        return False
+    print(f"Testing connection to {host}:{port}/{database}...")
+    try:
+        connect_mysql(host, port, database, username, password)
+    except Exception as e:
+        print(f"✗ Connection failed: {str(e)}\n")
+        return False
+    print("✓ Connection successful\n")
+    return True
+
+SQLITE_DATABASE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'SQLite',
+                                    'Database_Creation-Chinook_SQLite-Full.sql')
+SQLITE_DEFAULT_PATH = 'SQLite/chinook_large.db'
+
+class SqliteLoader(DirectLoader):
+    """SQLite through the standard library sqlite3 module: executemany in one transaction
+
+    Needs no server or driver, so the generator can be benchmarked end to end anywhere.
+    The Chinook database (schema and base rows, which the generated rows' foreign keys
+    point at) is created if the database has no Customer table yet. For the
+    load the rollback journal is kept in memory and fsyncs are switched off
+    (journal_mode=MEMORY, synchronous=OFF), restored afterwards. Unlike journal_mode=OFF
+    this still lets a failed batch roll back to its savepoint, but a crash mid-load can
+    corrupt the file, so load into a scratch database file. That makes every load as
+    relaxed as SQLite allows, so load strategies only change how often it commits.
+    """
+    name = 'sqlite'
+    max_connections = 1  # SQLite has one writer at a time
+    converters = {'money': lambda cents: cents / 100,
+                  'date': lambda value: f"{value.isoformat()} 00:00:00",
+                  'datetime': lambda value: value.isoformat(' ')}
+
+    def __init__(self, connection, **options):
+        super().__init__(connection, **options)
+        self.dialect = DIALECTS['sqlite']
+        self.cursor = connection.cursor()
+        self._statements = {}
+        self._pragmas = {}
+
+    def table_exists(self, spec):
+        return bool(self.connection.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = ?",
+                                            (spec.name,)).fetchone()[0])
+
+    def begin(self):
+        super().begin()
+        if not self.table_exists(CUSTOMER):
+            self._progress(f"Creating Chinook database from {os.path.basename(SQLITE_DATABASE_FILE)}...")
+            with open(SQLITE_DATABASE_FILE, encoding='utf-8') as f:
+                self.connection.executescript(f.read())
+        # Journal mode can only change outside a transaction
+        for pragma, value in (('journal_mode', 'MEMORY'), ('synchronous', 'OFF')):
+            self._pragmas[pragma] = self.connection.execute(f"PRAGMA {pragma}").fetchone()[0]
+            self.connection.execute(f"PRAGMA {pragma} = {value}")
+
+    def begin_table(self, spec):
+        if not self.connection.in_transaction:
+            self.connection.execute("BEGIN")
+        placeholders = ", ".join("?" for _ in spec.columns)
+        if spec is SYSTEM_LOG:
+            if not self.table_exists(spec):
+                self._progress("SystemLog table not found - skipping log entries")
+                self._skip.add(spec)
+            placeholders = f"?, ?, ?, ? || ' | ' || {self.dialect.padding}"
+        self._statements[spec] = (f"INSERT INTO {self.dialect.table_name(spec)} ({self.dialect.column_list(spec)}) "
+                                  f"VALUES ({placeholders})")
+
+    def insert(self, spec, rows):
+        self.connection.executemany(self._statements[spec], self.parameters(spec, rows))
+
+    def finish(self):
+        for pragma, value in self._pragmas.items():
+            self.connection.execute(f"PRAGMA {pragma} = {value}")
+        self._pragmas = {}
+
+    def rollback(self):
+        super().rollback()
+        try:
+            self.finish()
+        except Exception:
+            pass
+
+def connect_sqlite(path):
+    """Open a SQLite database file (created if missing) with transactions managed explicitly
+
+    The connection may be used from a loader thread (one thread at a time).
+    """
+    import sqlite3
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+
+def test_sqlite_connection(path):
+    """Check the SQLite database file can be opened (or created) before generating data"""
+    print(f"Opening {path}...")
+    try:
+        connection = connect_sqlite(path)
+        version = connection.execute("SELECT sqlite_version()").fetchone()[0]
+        connection.close()
+    except Exception as e:
+        print(f"✗ Connection failed: {str(e)}\n")
+        return False
+    print(f"✓ Connection successful (SQLite {version})\n")
+    return True
+
+def _money(cents):
+    """Render integer cents as a two-decimal SQL numeric literal"""
+    return f"{cents // 100}.{cents % 100:02d}"
+
+def _snake_case(name):
+    """Convert a PascalCase Chinook identifier to the PostgreSQL snake_case form"""
+    return re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
+
+class SqlDialect:
+    """Renders typed rows as a platform-specific SQL script
+
+    Subclasses provide identifier quoting, literal formatting and statement
+    templates. Batching and progress messages are handled by SqlScriptWriter.
+    """
+    name = None
+    directory = None
+    batch_size = 1000
+    string_prefix = ''
+    batch_progress = True  # Progress messages between batches (not possible inside a COPY)
+
+    def __init__(self):
+        self._formatter_cache = {}
+
+    def quote(self, value):
+        if value is None:
+            return 'NULL'
+        escaped = value.replace("'", "''")
+        return f"{self.string_prefix}'{escaped}'"
+
+    def format_date(self, value):
+        return f"'{value.isoformat()}'"
+
+    def format_datetime(self, value):
+        return f"'{value.isoformat(' ')}'"
+
+    def table_name(self, spec):
+        return spec.name
+
+    def column_name(self, column):
+        return column
+
+    def column_list(self, spec):
+        return ", ".join(self.column_name(column) for column, _ in spec.columns)
+
+    def column_formatter(self, spec, column, kind):
+        """Return the callable that renders one column of this table as a literal"""
+        if kind == 'int':
+            return str
+        if kind == 'money':
+            return _money
+        if kind == 'date':
+            return self.format_date
+        if kind == 'datetime':
+            return self.format_datetime
+        return self.quote
+
+    def formatters(self, spec):
+        """Column formatters for a table, in column order"""
+        formatters = self._formatter_cache.get(spec.name)
+        if formatters is None:
+            formatters = [self.column_formatter(spec, column, kind) for column, kind in spec.columns]
+            self._formatter_cache[spec.name] = formatters
+        return formatters
+
+    def format_values(self, spec, rows):
+        """Render rows as '    (v1, v2, ...)' tuples"""
+        formatters = self.formatters(spec)
+        return [f"    ({', '.join([fmt(value) for fmt, value in zip(formatters, row)])})" for row in rows]
+
+    def begin_script(self):
+        return ""
+
+    def end_script(self):
+        return ""
+
+    def progress(self, message):
+        return ""
+
+    def begin_table(self, spec, first_id, last_id):
+        """Table header; last_id is None when the row count is not known in advance"""
+        if last_id is None:
+            return f"-- Additional {spec.label} ({first_id}+)\n"
+        return f"-- Additional {spec.label} ({first_id}-{last_id})\n"
+
+    def insert_batch(self, spec, rows):
+        raise NotImplementedError
+
+    def end_table(self, spec, first_id, last_id):
+        return "\n"
+
+class MssqlDialect(SqlDialect):
+    """SQL Server: [dbo].[Table] identifiers, N'' literals, IDENTITY_INSERT and GO batches"""
+    name = 'mssql'
+    directory = 'MSSQL'
+    string_prefix = 'N'
+
+    def format_date(self, value):
+        return f"'{value.year:04d}/{value.month:02d}/{value.day:02d}'"
+
+    def table_name(self, spec):
+        return f"[dbo].[{spec.name}]"
+
+    def column_name(self, column):
+        return f"[{column}]"
+
+    def begin_script(self):
+        return ("-- Begin transaction for bulk insert\n"
+                "PRINT 'Starting data insertion at ' + CONVERT(VARCHAR, GETDATE(), 120);\n"
+                "GO\n\n"
+                "BEGIN TRANSACTION;\n"
+                "GO\n\n")
+
+    def end_script(self):
+        return ("-- Commit all changes\n"
+                + self.progress("Committing transaction...")
+                + "COMMIT TRANSACTION;\n"
+                "GO\n\n"
+                + self.progress("Data insertion completed successfully!"))
+
+    def progress(self, message):
+        return f"PRINT '[' + CONVERT(VARCHAR, GETDATE(), 120) + '] {message}';\nGO\n"
+
+    def begin_table(self, spec, first_id, last_id):
+        header = super().begin_table(spec, first_id, last_id)
+        if spec is SYSTEM_LOG:
+            header += ("-- Note: Only inserts if SystemLog table exists in the database\n"
+                       "-- SQL Server generates ~7.8KB padding per row using REPLICATE() for fast insertion\n")
+        return header
+
+    def insert_batch(self, spec, rows):
+        table = self.table_name(spec)
+        values = ",\n".join(self.format_values(spec, rows))
+        if spec is SYSTEM_LOG:
+            # SystemLog has no IDENTITY column; padding is generated server-side
+            return ("IF EXISTS (SELECT * FROM sys.tables WHERE name = 'SystemLog')\n"
+                    "BEGIN\n"
+                    f"INSERT INTO {table} ({self.column_list(spec)})\n"
+                    "SELECT LogId, InvoiceId, LogDate, LogMessage + ' | ' + REPLICATE('PADDING_', 70000)\n"
+                    "FROM (VALUES\n"
+                    f"{values}\n"
+                    ") AS LogData(LogId, InvoiceId, LogDate, LogMessage);\n"
+                    "END\n"
+                    "GO\n\n")
+        return (f"SET IDENTITY_INSERT {table} ON;\n"
+                f"INSERT INTO {table} ({self.column_list(spec)}) VALUES\n"
+                f"{values};\n"
+                f"SET IDENTITY_INSERT {table} OFF;\n"
+                "GO\n\n")
+
+    def end_table(self, spec, first_id, last_id):
+        return ""
+
+class OracleDialect(SqlDialect):
+    """Oracle: INSERT ALL ... SELECT FROM dual with explicit IDs"""
+    name = 'oracle'
+    directory = 'Oracle'
+    batch_size = 500  # Oracle INSERT ALL limit
+
+    def format_date(self, value):
+        return f"TO_DATE('{value.isoformat()}', 'YYYY-MM-DD')"
+
+    def format_datetime(self, value):
+        return f"TO_DATE('{value.isoformat(' ')}', 'YYYY-MM-DD HH24:MI:SS')"
+
+    def begin_script(self):
+        # Oracle doesn't auto-commit by default; DEFINE OFF stops SQL*Plus treating '&' in names as a variable
+        return "-- Oracle bulk insert\nSET DEFINE OFF;\n\n"
+
+    def end_script(self):
+        return "-- Commit transaction\nCOMMIT;\n"
+
+    def begin_table(self, spec, first_id, last_id):
+        header = super().begin_table(spec, first_id, last_id)
+        if spec is SYSTEM_LOG:
+            header += "-- Oracle pads each row after insert using RPAD() (SQL VARCHAR2 limit applies)\n"
+        return header
+
+    def insert_batch(self, spec, rows):
+        into = f"  INTO {self.table_name(spec)} ({self.column_list(spec)}) VALUES "
+        lines = [into + values.lstrip() for values in self.format_values(spec, rows)]
+        return "INSERT ALL\n" + "\n".join(lines) + "\nSELECT * FROM dual;\n"
+
+    def end_table(self, spec, first_id, last_id):
+        if spec is SYSTEM_LOG:
+            # Pad only the rows written by this script for database size inflation
+            return ("\n-- Pad log messages for database size inflation\n"
+                    "UPDATE SystemLog\n"
+                    "SET LogMessage = LogMessage || ' | ' || RPAD('PADDING_', 32000, 'PADDING_')\n"
+                    f"WHERE LogId BETWEEN {first_id} AND {last_id};\n\n")
+        return "\n"
+
+class PostgresqlDialect(SqlDialect):
+    """PostgreSQL: snake_case identifiers, TIMESTAMP literals and explicit identity values"""
+    name = 'postgresql'
+    directory = 'PostgreSQL'
+
+    def format_date(self, value):
+        return f"TIMESTAMP '{value.isoformat()}'"
+
+    def format_datetime(self, value):
+        return f"TIMESTAMP '{value.isoformat(' ')}'"
+
+    def table_name(self, spec):
+        return _snake_case(spec.name)
+
+    def column_name(self, column):
+        return _snake_case(column)
+
+    def begin_script(self):
+        return "-- Begin transaction for bulk insert\nBEGIN;\n\n"
+
+    def end_script(self):
+        return ("-- Commit transaction\n"
+                + self.progress("Committing transaction...")
+                + "COMMIT;\n"
+                + self.progress("Data insertion completed successfully!"))
+
+    def progress(self, message):
+        return f"DO $$ BEGIN RAISE NOTICE '[%] {message}', NOW(); END $$;\n"
+
+    def begin_table(self, spec, first_id, last_id):
+        header = super().begin_table(spec, first_id, last_id)
+        if spec is SYSTEM_LOG:
+            header += ("-- Note: Only inserts if system_log table exists in the database\n"
+                       "-- PostgreSQL generates ~7.8KB padding per row using REPEAT() for fast insertion\n")
+        return header
+
+    def insert_batch(self, spec, rows):
+        table = self.table_name(spec)
+        values = ",\n".join(self.format_values(spec, rows))
+        if spec is SYSTEM_LOG:
+            # Each batch in its own DO block with a table existence check
+            return ("DO $$\n"
+                    "BEGIN\n"
+                    "  IF EXISTS (SELECT FROM information_schema.tables "
+                    "WHERE table_schema = current_schema() AND table_name = 'system_log') THEN\n"
+                    f"    INSERT INTO {table} ({self.column_list(spec)}) OVERRIDING SYSTEM VALUE\n"
+                    "    SELECT log_id, invoice_id, log_date, log_message || ' | ' || REPEAT('PADDING_', 70000)\n"
+                    "    FROM (VALUES\n"
+                    f"{values}\n"
+                    "    ) AS log_data(log_id, invoice_id, log_date, log_message);\n"
+                    "  END IF;\n"
+                    "END $$;\n\n")
+        return (f"INSERT INTO {table} ({self.column_list(spec)}) OVERRIDING SYSTEM VALUE VALUES\n"
+                f"{values};\n\n")
+
+    def end_table(self, spec, first_id, last_id):
+        # Explicit IDs bypass the identity sequence, so move it past the new rows
+        table = self.table_name(spec)
+        id_column = self.column_name(spec.columns[0][0])
+        setval = f"setval(pg_get_serial_sequence('{table}', '{id_column}'), (SELECT MAX({id_column}) FROM {table}))"
+        if spec is SYSTEM_LOG:
+            return ("DO $$\n"
+                    "BEGIN\n"
+                    "  IF EXISTS (SELECT FROM information_schema.tables "
+                    "WHERE table_schema = current_schema() AND table_name = 'system_log') THEN\n"
+                    f"    PERFORM {setval};\n"
+                    "  END IF;\n"
+                    "END $$;\n\n")
+        return f"SELECT {setval};\n\n"
+
+def _copy_text(value):
+    """Escape a value for PostgreSQL COPY text format (\\N is NULL)"""
+    if value is None:
+        return '\\N'
+    if '\\' in value or '\t' in value or '\n' in value or '\r' in value:
+        value = value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+    return value
+
+class PostgresqlCopyDialect(PostgresqlDialect):
+    """PostgreSQL COPY ... FROM STDIN: one COPY per table with rows as tab-separated text
+
+    The server parses COPY rows far faster than INSERT literals. SystemLog rows are copied
+    into a temporary table first and padded with REPEAT() while moving them across, so
+    the padding is still generated server-side and only if system_log exists.
+    """
+    batch_progress = False
+
+    def column_formatter(self, spec, column, kind):
+        if kind == 'date':
+            return date.isoformat
+        if kind == 'datetime':
+            return lambda value: value.isoformat(' ')
+        if kind in ('text', 'text_null'):
+            return _copy_text
+        return super().column_formatter(spec, column, kind)
+
+    def begin_table(self, spec, first_id, last_id):
+        header = super().begin_table(spec, first_id, last_id) + self.progress(f"Copying {spec.label}...")
+        if spec is SYSTEM_LOG:
+            return (header
+                    + "CREATE TEMPORARY TABLE system_log_copy (log_id INTEGER, invoice_id INTEGER, "
+                      "log_date TIMESTAMP, log_message TEXT) ON COMMIT DROP;\n"
+                    + "COPY system_log_copy FROM STDIN;\n")
+        return header + f"COPY {self.table_name(spec)} ({self.column_list(spec)}) FROM STDIN;\n"
+
+    def insert_batch(self, spec, rows):
+        formatters = self.formatters(spec)
+        return ''.join(['\t'.join([fmt(value) for fmt, value in zip(formatters, row)]) + '\n' for row in rows])
+
+    def move_system_log(self):
+        """Move the copied SystemLog rows into system_log, padding them on the way"""
+        return ("DO $$\n"
+                "BEGIN\n"
+                "  IF EXISTS (SELECT FROM information_schema.tables "
+                "WHERE table_schema = current_schema() AND table_name = 'system_log') THEN\n"
+                f"    INSERT INTO {self.table_name(SYSTEM_LOG)} ({self.column_list(SYSTEM_LOG)}) OVERRIDING SYSTEM VALUE\n"
+                "    SELECT log_id, invoice_id, log_date, log_message || ' | ' || REPEAT('PADDING_', 70000)\n"
+                "    FROM system_log_copy;\n"
+                "  END IF;\n"
+                "END $$;\n\n")
+
+    def end_table(self, spec, first_id, last_id):
+        footer = "\\.\n\n"
+        if spec is SYSTEM_LOG:
+            footer += self.move_system_log()
+        return footer + super().end_table(spec, first_id, last_id)
+
+class MysqlDialect(SqlDialect):
+    """MySQL: backtick identifiers and single-quoted, backslash-escaped literals"""
+    name = 'mysql'
+    directory = 'MySQL'
+
+    def quote(self, value):
+        if value is None:
+            return 'NULL'
+        return "'" + value.replace('\\', '\\\\').replace("'", "''") + "'"
+
+    def table_name(self, spec):
+        return f"`{spec.name}`"
+
+    def column_name(self, column):
+        return f"`{column}`"
+
+    def column_formatter(self, spec, column, kind):
+        if spec is SYSTEM_LOG and column == 'LogMessage':
+            # MySQL generates ~7.8KB padding per row using REPEAT() during insertion
+            return lambda value: f"CONCAT({self.quote(value)}, ' | ', REPEAT('PADDING_', 70000))"
+        return super().column_formatter(spec, column, kind)
+
+    def begin_script(self):
+        return "-- Begin transaction for bulk insert\nSTART TRANSACTION;\n\n"
+
+    def end_script(self):
+        return ("-- Commit transaction\n"
+                + self.progress("Committing transaction...")
+                + "COMMIT;\n"
+                + self.progress("Data insertion completed successfully!"))
+
+    def progress(self, message):
+        return f"SELECT CONCAT('[', NOW(), '] {message}') AS Progress;\n"
+
+    def insert_batch(self, spec, rows):
+        values = ",\n".join(self.format_values(spec, rows))
+        return (f"INSERT INTO {self.table_name(spec)} ({self.column_list(spec)}) VALUES\n"
+                f"{values};\n\n")
+
+class SqliteDialect(SqlDialect):
+    """SQLite: plain identifiers, dates stored as 'YYYY-MM-DD HH:MM:SS' text as in Chinook_Sqlite"""
+    name = 'sqlite'
+    directory = 'SQLite'
+    batch_size = 500  # SQLITE_MAX_COMPOUND_SELECT: a VALUES list is a compound SELECT
+    # SQLite has no REPEAT(): 70000 zero bytes in hex are 70000 '00' pairs to replace
+    padding = "replace(hex(zeroblob(70000)), '00', 'PADDING_')"
+
+    def format_date(self, value):
+        return f"'{value.isoformat()} 00:00:00'"
+
+    def column_formatter(self, spec, column, kind):
+        if spec is SYSTEM_LOG and column == 'LogMessage':
+            return lambda value: f"{self.quote(value)} || ' | ' || {self.padding}"
+        return super().column_formatter(spec, column, kind)
+
+    def begin_script(self):
+        return "-- Begin transaction for bulk insert\nBEGIN TRANSACTION;\n\n"
+
+    def end_script(self):
+        return ("-- Commit transaction\n"
+                + self.progress("Committing transaction...")
+                + "COMMIT;\n"
+                + self.progress("Data insertion completed successfully!"))
+
+    def progress(self, message):
+        return f"SELECT '[' || datetime('now') || '] {message}' AS Progress;\n"
+
+    def begin_table(self, spec, first_id, last_id):
+        header = super().begin_table(spec, first_id, last_id)
+        if spec is SYSTEM_LOG:
+            header += "-- SQLite generates the padding per row with replace(hex(zeroblob())) during insertion\n"
+        return header
+
+    def insert_batch(self, spec, rows):
+        values = ",\n".join(self.format_values(spec, rows))
+        return (f"INSERT INTO {self.table_name(spec)} ({self.column_list(spec)}) VALUES\n"
+                f"{values};\n\n")
+
+DIALECTS = {dialect.name: dialect for dialect in (MssqlDialect(), OracleDialect(), PostgresqlDialect(), MysqlDialect(),
+                                                  SqliteDialect())}
+
+# --format choices besides 'sql' (INSERT scripts in every dialect): format -> its dialect
+SCRIPT_FORMATS = {'copy': PostgresqlCopyDialect()}
+
+def _script_dialect(db_type, output_format='sql'):
+    if output_format == 'sql':
+        return DIALECTS[db_type]
+    dialect = SCRIPT_FORMATS[output_format]
+    if dialect.name != db_type:
+        raise ValueError(f"--format {output_format} is only available for {dialect.name}")
+    return dialect
+
+def _progress_due(spec, batch_index, total_batches):
+    """Progress every 10 batches for large tables (5 for SystemLog), otherwise on the first batch"""
+    if spec is SYSTEM_LOG:
+        interval = 5 if total_batches is None or total_batches >= 20 else 1
+    else:
+        interval = 10 if total_batches is None or total_batches >= 10 else total_batches
+    return (batch_index - 1) % interval == 0
+
+class SqlScriptWriter:
+    """Writes streamed (TableSpec, rows) batches as one SQL script in the given dialect
+
+    Rows are rendered as they arrive, so only the batch being written is ever held in
+    memory. A table is closed once its expected row count has been written; tables
+    whose size is not known up front are closed when a later table starts, or by end().
+    """
+
+    def __init__(self, f, dialect, expected_rows=None):
+        """
+        Args:
+            f: Text file to write to
+            dialect: SqlDialect instance (see DIALECTS)
+            expected_rows: Optional dict mapping TableSpec to its row count (None if unknown)
+        """
+        self.f = f
+        self.dialect = dialect
+        self.expected_rows = expected_rows or {}
+        self.row_counts = {}
+        self._open = {}  # TableSpec -> [first_id, last_id, batches_written]
+
+    def begin(self):
+        self.f.write(self.dialect.begin_script())
+
+    def write(self, spec, rows):
+        if not rows:
+            return
+        dialect = self.dialect
+        expected = self.expected_rows.get(spec)
+
+        for other in list(self._open):
+            if self.expected_rows.get(other) is None and TABLES.index(other) < TABLES.index(spec):
+                self._close(other)
+
+        state = self._open.get(spec)
+        if state is None:
+            first_id = rows[0][0]
+            last_id = first_id + expected - 1 if expected else None
+            self.f.write(dialect.begin_table(spec, first_id, last_id))
+            state = self._open[spec] = [first_id, None, 0]
+
+        batch_size = dialect.batch_size
+        total_batches = (expected + batch_size - 1) // batch_size if expected else None
+        for batch_num in range(0, len(rows), batch_size):
+            state[2] += 1
+            batch_index = state[2]
+            if dialect.batch_progress and _progress_due(spec, batch_index, total_batches):
+                if total_batches == 1:
+                    self.f.write(dialect.progress(f"Inserting {spec.label}..."))
+                elif total_batches is None:
+                    self.f.write(dialect.progress(f"Inserting {spec.label}... batch {batch_index}"))
+                else:
+                    self.f.write(dialect.progress(f"Inserting {spec.label}... batch {batch_index} of {total_batches}"))
+            self.f.write(dialect.insert_batch(spec, rows[batch_num:batch_num + batch_size]))
+
+        state[1] = rows[-1][0]
+        self.row_counts[spec] = self.row_counts.get(spec, 0) + len(rows)
+        if self.row_counts[spec] == expected:
+            self._close(spec)
+
+    def end(self):
+        for spec in list(self._open):
+            self._close(spec)
+        self.f.write(self.dialect.end_script())
+
+    def _close(self, spec):
+        first_id, last_id, _ = self._open.pop(spec)
+        self.f.write(self.dialect.end_table(spec, first_id, last_id))
+
+class _CountingFile:
+    """Forwards writes to a text file and counts the characters written"""
+
+    def __init__(self, f):
+        self.f = f
+        self.size = 0
+
+    def write(self, text):
+        self.size += len(text)
+        return self.f.write(text)
+
+class ChunkedSqlWriter:
+    """Writes streamed (TableSpec, rows) batches as size-bounded, per-table SQL chunk files
+
+    Each chunk (e.g. invoice_line.0007.sql) holds rows of one table in a transaction of
+    its own and can be run, or re-run, on its own. A new chunk is started once the current
+    one has reached chunk_bytes of SQL. end() writes manifest.json, listing the chunks in
+    load order with their row and ID ranges, file sizes, and the chunks they depend on:
+    those holding the parent rows their foreign keys point to. Chunks with no dependency
+    path between them can be loaded concurrently.
+    """
+
+    def __init__(self, directory, dialect, chunk_bytes=64 << 20, compress=None, plan=None):
+        self.directory = directory
+        self.dialect = dialect
+        self.chunk_bytes = chunk_bytes
+        self.compress = compress
+        self.plan = plan
+        self.row_counts = {}
+        self._chunks = []
+        self._current = {}  # TableSpec -> (chunk, file, counting file, SqlScriptWriter)
+
+    def begin(self):
+        os.makedirs(self.directory, exist_ok=True)
+
+    def write(self, spec, rows):
+        if not rows:
+            return
+        current = self._current.get(spec)
+        if current is not None and current[2].size >= self.chunk_bytes:
+            self._close(spec)
+            current = None
+        if current is None:
+            current = self._open(spec, rows[0][0])
+
+        chunk, _, _, writer = current
+        writer.write(spec, rows)
+        chunk['rows'] += len(rows)
+        chunk['last_id'] = rows[-1][0]
+        for column, _ in FOREIGN_KEYS.get(spec, ()):
+            position = [name for name, _ in spec.columns].index(column)
+            values = [row[position] for row in rows]
+            low, high = min(values), max(values)
+            if column in chunk['references']:
+                previous_low, previous_high = chunk['references'][column]
+                low, high = min(low, previous_low), max(high, previous_high)
+            chunk['references'][column] = (low, high)
+        self.row_counts[spec] = self.row_counts.get(spec, 0) + len(rows)
+
+    def _open(self, spec, first_id):
+        index = sum(1 for chunk in self._chunks if chunk['table'] == spec.name)
+        name = f"{_snake_case(spec.name)}.{index:04d}.sql" + (COMPRESSIONS[self.compress] if self.compress else '')
+        chunk = {'file': name, 'table': spec.name, 'index': index, 'rows': 0,
+                 'first_id': first_id, 'last_id': None, 'references': {}}
+        self._chunks.append(chunk)
+        path = os.path.join(self.directory, name)
+        f = BlockCompressedWriter(path, self.compress) if self.compress else open(path, 'w', encoding='utf-8')
+        counter = _CountingFile(f)
+        writer = SqlScriptWriter(counter, self.dialect, {spec: None})
+        writer.begin()
+        current = self._current[spec] = (chunk, f, counter, writer)
+        return current
+
+    def _close(self, spec):
+        chunk, f, _, writer = self._current.pop(spec)
+        writer.end()
+        f.close()
+        chunk['bytes'] = os.path.getsize(os.path.join(self.directory, chunk['file']))
+
+    def end(self):
+        for spec in list(self._current):
+            self._close(spec)
+
+        # A chunk depends on the chunks of each referenced table whose IDs overlap the
+        # range of values in its foreign key column (IDs below them are base data)
+        specs = {spec.name: spec for spec in TABLES}
+        for chunk in self._chunks:
+            depends_on = []
+            for column, parent in FOREIGN_KEYS.get(specs[chunk['table']], ()):
+                low, high = chunk['references'][column]
+                depends_on += [other['file'] for other in self._chunks
+                               if other['table'] == parent.name
+                               and other['first_id'] <= high and other['last_id'] >= low]
+            chunk['depends_on'] = depends_on
+            del chunk['references']
+
+        # Load order: tables in foreign key order, then chunks in ID order
+        self._chunks.sort(key=lambda chunk: (TABLES.index(specs[chunk['table']]), chunk['index']))
+        manifest = {
+            'format': 'chinook-sql-chunks',
+            'version': 1,
+            'dialect': self.dialect.name,
+            'compress': self.compress,
+            'plan': self.plan._asdict() if self.plan else None,
+            'chunk_bytes': self.chunk_bytes,
+            'tables': {spec.name: self.row_counts.get(spec, 0) for spec in TABLES},
+            'chunks': self._chunks,
+        }
+        with open(os.path.join(self.directory, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+            f.write('\n')
+
+class BulkFileWriter:
+    """Writes streamed (TableSpec, rows) batches as one data file per table plus load scripts
+
+    Rows are written as delimited text as they arrive. Subclasses set the terminators and
+    value formats, and write the control files and driver script for their database's
+    bulk loader in write_load_files(), once every table's row count and ID range is known.
+    """
+    database = None  # DIALECTS key
+    data_extension = 'dat'
+    field_terminator = '\t'
+    row_terminator = '\n'
+    null = ''
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.dialect = DIALECTS[self.database]
+        self.tables = {}  # TableSpec -> {'file', 'rows', 'first_id', 'last_id'}
+        self.row_counts = {}
+        self._files = {}
+        self._formatters = {}
+
+    def begin(self):
+        os.makedirs(self.directory, exist_ok=True)
+
+    def format_value(self, spec, column, kind):
+        """Return the callable that renders one column value as data file text"""
+        if kind == 'money':
+            return _money
+        if kind == 'date':
+            return date.isoformat
+        if kind == 'datetime':
+            return lambda value: value.isoformat(' ')
+        if kind == 'text_null':
+            return lambda value: self.null if value is None else value
+        if kind == 'text':
+            return lambda value: value
+        return str
+
+    def write(self, spec, rows):
+        if not rows:
+            return
+        f = self._files.get(spec)
+        if f is None:
+            name = f"{_snake_case(spec.name)}.{self.data_extension}"
+            f = self._files[spec] = open(os.path.join(self.directory, name), 'w', encoding='utf-8', newline='')
+            self.tables[spec] = {'file': name, 'rows': 0, 'first_id': rows[0][0], 'last_id': None}
+            self._formatters[spec] = [self.format_value(spec, column, kind) for column, kind in spec.columns]
+        formatters = self._formatters[spec]
+        field, end = self.field_terminator, self.row_terminator
+        f.write(''.join([field.join([fmt(value) for fmt, value in zip(formatters, row)]) + end for row in rows]))
+        table = self.tables[spec]
+        table['rows'] += len(rows)
+        table['last_id'] = rows[-1][0]
+        self.row_counts[spec] = table['rows']
+
+    def end(self):
+        for f in self._files.values():
+            f.close()
+        self.write_load_files()
+
+    def write_load_files(self):
+        raise NotImplementedError
+
+    def _write_file(self, name, text):
+        with open(os.path.join(self.directory, name), 'w', encoding='utf-8') as f:
+            f.write(text)
+
+class BcpWriter(BulkFileWriter):
+    """SQL Server: bcp character data files, non-XML format files and a BULK INSERT script
+
+    BULK INSERT ... WITH (KEEPIDENTITY, TABLOCK) loads each table as a single minimally
+    logged stream (under the SIMPLE or BULK_LOGGED recovery model) with the generated IDs
+    kept. The files also load with `bcp <table> in <file> -f <table>.fmt -E`. SystemLog is
+    loaded into a temporary table and padded with REPLICATE() on the way into SystemLog.
+    """
+    database = 'mssql'
+    row_terminator = '\r\n'
+    batch_size = 100000  # BATCHSIZE: rows per committed batch
+    host_lengths = {'int': 12, 'money': 30, 'date': 24, 'datetime': 24, 'text': 8000, 'text_null': 8000}
+
+    def format_value(self, spec, column, kind):
+        # Unseparated dates and ISO 8601 timestamps are read the same under any DATEFORMAT
+        if kind == 'date':
+            return lambda value: value.strftime('%Y%m%d')
+        if kind == 'datetime':
+            return lambda value: value.isoformat('T')
+        return super().format_value(spec, column, kind)
+
+    def format_file(self, spec):
+        lines = ["14.0", str(len(spec.columns))]
+        for number, (column, kind) in enumerate(spec.columns, 1):
+            terminator = '\\r\\n' if number == len(spec.columns) else '\\t'
+            lines.append(f'{number:<4}SQLCHAR  0  {self.host_lengths[kind]:<6}"{terminator}"  {number:<4}{column:<20}""')
+        return "\n".join(lines) + "\n"
+
+    def write_load_files(self):
+        script = ["-- Bulk load generated data files with BULK INSERT",
+                  "-- Run with: sqlcmd -S <server> -d <database> -E -i load_bcp.sql",
+                  "-- DataDir must be a path the SQL Server service can read; override it with",
+                  "--   sqlcmd -v DataDir=\"\\\\fileserver\\share\\bcp\"",
+                  "-- For minimal logging use the SIMPLE or BULK_LOGGED recovery model.",
+                  f':setvar DataDir "{os.path.abspath(self.directory)}"',
+                  "SET NOCOUNT ON;",
+                  "GO",
+                  ""]
+        options = f"FORMATFILE = '$(DataDir)/{{table}}.fmt', CODEPAGE = '65001', KEEPIDENTITY, KEEPNULLS, TABLOCK, BATCHSIZE = {self.batch_size}"
+        for spec in TABLES:
+            table = self.tables.get(spec)
+            if table is None:
+                continue
+            name = _snake_case(spec.name)
+            self._write_file(f"{name}.fmt", self.format_file(spec))
+            data = f"$(DataDir)/{table['file']}"
+            script.append(f"-- {spec.name}: {table['rows']:,} rows ({table['first_id']}-{table['last_id']})")
+            script.append(self.dialect.progress(f"Loading {spec.label}...").rstrip("\n"))
+            if spec is SYSTEM_LOG:
+                script += [
+                    "IF EXISTS (SELECT * FROM sys.tables WHERE name = 'SystemLog')",
+                    "BEGIN",
+                    "    CREATE TABLE #SystemLogLoad (LogId INT, InvoiceId INT, LogDate DATETIME, LogMessage NVARCHAR(4000));",
+                    f"    BULK INSERT #SystemLogLoad FROM '{data}'",
+                    f"    WITH ({options.format(table=name)});",
+                    f"    INSERT INTO {self.dialect.table_name(spec)} WITH (TABLOCK) ({self.dialect.column_list(spec)})",
+                    "    SELECT LogId, InvoiceId, LogDate, LogMessage + ' | ' + REPLICATE('PADDING_', 70000)",
+                    "    FROM #SystemLogLoad;",
+                    "    DROP TABLE #SystemLogLoad;",
+                    "END",
+                    "GO",
+                    ""]
+            else:
+                script += [f"BULK INSERT {self.dialect.table_name(spec)} FROM '{data}'",
+                           f"WITH ({options.format(table=name)});",
+                           "GO",
+                           ""]
+        script.append(self.dialect.progress("Data load completed successfully!"))
+        self._write_file("load_bcp.sql", "\n".join(script))
+
+class LoadDataWriter(BulkFileWriter):
+    """MySQL: tab-separated data files and a LOAD DATA LOCAL INFILE script
+
+    The files use LOAD DATA's default escaping (backslash escapes, \\N for NULL) and keep the
+    generated IDs. SystemLog padding is added by a SET expression as the rows are loaded.
+    LOAD DATA streams the file, so unlike large INSERT batches it is not limited by
+    max_allowed_packet.
+    """
+    database = 'mysql'
+    data_extension = 'tsv'
+    null = '\\N'
+
+    def format_value(self, spec, column, kind):
+        if kind in ('text', 'text_null'):
+            return _copy_text  # Same escaping as PostgreSQL COPY text format
+        return super().format_value(spec, column, kind)
+
+    def write_load_files(self):
+        script = ["-- Bulk load generated data files with LOAD DATA LOCAL INFILE",
+                  "-- Run from this directory (file names are relative to the client):",
+                  "--   mysql --local-infile=1 -u <user> -p <database> < load_data.sql",
+                  ""]
+        for spec in TABLES:
+            table = self.tables.get(spec)
+            if table is None:
+                continue
+            columns = [self.dialect.column_name(column) for column, _ in spec.columns]
+            padding = ""
+            if spec is SYSTEM_LOG:
+                # MySQL generates ~7.8KB padding per row using REPEAT() during the load
+                columns[-1] = "@LogMessage"
+                padding = "\nSET `LogMessage` = CONCAT(@LogMessage, ' | ', REPEAT('PADDING_', 70000))"
+            script += [f"-- {spec.name}: {table['rows']:,} rows ({table['first_id']}-{table['last_id']})",
+                       self.dialect.progress(f"Loading {spec.label}...").rstrip("\n"),
+                       f"LOAD DATA LOCAL INFILE '{table['file']}'",
+                       f"INTO TABLE {self.dialect.table_name(spec)}",
+                       "CHARACTER SET utf8mb4",
+                       "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'",
+                       "LINES TERMINATED BY '\\n'",
+                       f"({', '.join(columns)}){padding};",
+                       ""]
+        script.append(self.dialect.progress("Data load completed successfully!"))
+        self._write_file("load_data.sql", "\n".join(script))
+
+class SqlLoaderWriter(BulkFileWriter):
+    """Oracle: SQL*Loader control and data files set up for direct path loads
+
+    Each table gets a tab-separated data file and a control file with DIRECT=TRUE, which
+    formats blocks straight into the table instead of parsing INSERT statements. The
+    driver scripts run sqlldr for every table in foreign key order. SQL*Loader does not
+    allow SQL expressions on LOB columns, and SystemLog.LogMessage is a CLOB, so its
+    padding is applied by pad_system_log.sql over the loaded ID range after the load.
+    """
+    database = 'oracle'
+    field_types = {'int': 'INTEGER EXTERNAL', 'money': 'DECIMAL EXTERNAL', 'date': 'DATE "YYYY-MM-DD"',
+                   'datetime': 'DATE "YYYY-MM-DD HH24:MI:SS"', 'text': 'CHAR(4000)', 'text_null': 'CHAR(4000)'}
+
+    def control_file(self, spec, data_file):
+        fields = ",\n".join(f"  {column} {self.field_types[kind]}" for column, kind in spec.columns)
+        return ("OPTIONS (DIRECT=TRUE, ERRORS=0)\n"
+                "LOAD DATA\n"
+                "CHARACTERSET AL32UTF8\n"
+                f"INFILE '{data_file}'\n"
+                "APPEND\n"
+                f"INTO TABLE {self.dialect.table_name(spec)}\n"
+                "FIELDS TERMINATED BY X'09'\n"
+                "TRAILING NULLCOLS\n"
+                f"(\n{fields}\n)\n")
+
+    def write_load_files(self):
+        shell = ["#!/bin/sh",
+                 "# Direct path load of the generated data files with SQL*Loader",
+                 "# Usage: ORACLE_CONNECT=user/password@host/service ./load_sqlldr.sh",
+                 'cd "$(dirname "$0")" || exit 1',
+                 'set -e']
+        batch = ["@echo off",
+                 "rem Direct path load of the generated data files with SQL*Loader",
+                 "rem Usage: set ORACLE_CONNECT=user/password@host/service & load_sqlldr.cmd",
+                 'cd /d "%~dp0"']
+        for spec in TABLES:
+            table = self.tables.get(spec)
+            if table is None:
+                continue
+            name = _snake_case(spec.name)
+            self._write_file(f"{name}.ctl", self.control_file(spec, table['file']))
+            command = f"control={name}.ctl log={name}.log bad={name}.bad"
+            shell += [f"echo \"[$(date '+%Y-%m-%d %H:%M:%S')] Loading {spec.label} ({table['rows']:,} rows)...\"",
+                      f'sqlldr userid="$ORACLE_CONNECT" {command}']
+            batch += [f"echo [%DATE% %TIME%] Loading {spec.label} ({table['rows']:,} rows)...",
+                      f'sqlldr userid="%ORACLE_CONNECT%" {command} || exit /b 1']
+            if spec is SYSTEM_LOG:
+                self._write_file("pad_system_log.sql",
+                                 self.dialect.end_table(spec, table['first_id'], table['last_id']).lstrip("\n")
+                                 + "COMMIT;\nEXIT;\n")
+                shell += ["echo 'Padding system log entries...'",
+                          'sqlplus -S "$ORACLE_CONNECT" @pad_system_log.sql']
+                batch += ["echo Padding system log entries...",
+                          'sqlplus -S "%ORACLE_CONNECT%" @pad_system_log.sql || exit /b 1']
+        shell.append("echo 'Data load completed successfully!'")
+        batch.append("echo Data load completed successfully!")
+        self._write_file("load_sqlldr.sh", "\n".join(shell) + "\n")
+        os.chmod(os.path.join(self.directory, "load_sqlldr.sh"), 0o755)
+        self._write_file("load_sqlldr.cmd", "\r\n".join(batch) + "\r\n")
+
+# --format choices that write data files for a bulk loader: format -> BulkFileWriter
+BULK_FORMATS = {'bcp': BcpWriter, 'loaddata': LoadDataWriter, 'sqlldr': SqlLoaderWriter}
+
+def _format_database(output_format):
+    """The database an --format other than 'sql' writes for"""
+    if output_format in SCRIPT_FORMATS:
+        return SCRIPT_FORMATS[output_format].name
+    return BULK_FORMATS[output_format].database
+
+def write_dataset(stream, writers):
+    """Feed one pass over a generated dataset to any number of writers
+
+    Args:
+        stream: Iterable of (TableSpec, rows) batches, e.g. generate_dataset()
+        writers: Objects with begin(), write(spec, rows) and end() (e.g. SqlScriptWriter)
+
+    Returns:
+        dict: Rows generated per TableSpec
+    """
+    row_counts = dict.fromkeys(TABLES, 0)
+    for writer in writers:
+        writer.begin()
+    for spec, rows in stream:
+        row_counts[spec] += len(rows)
+        for writer in writers:
+            writer.write(spec, rows)
+    for writer in writers:
+        writer.end()
+    return row_counts
+
+def write_sql_script(f, dialect, source, workers=1):
+    """Write a dataset as one SQL script in the given dialect
+
+    Args:
+        f: Text file to write to
+        dialect: SqlDialect instance (see DIALECTS)
+        source: DatasetPlan to generate, or StoredDataset to read
+        workers: Generation worker processes
+
+    Returns:
+        dict: Rows written per TableSpec
+    """
+    writer = SqlScriptWriter(f, dialect, source.expected_rows())
+    return write_dataset(source.batches(workers), [writer])
+
+def stream_sql_script(f, dialect, source, workers=1):
+    """Like write_sql_script(), but rendering and writing run in a PipelinedWriter thread
+
+    For a pipe into a database client: the script is rendered and sent while the next
+    batches are generated.
+    """
+    writer = SqlScriptWriter(f, dialect, source.expected_rows())
+    return write_dataset(source.batches(workers), [PipelinedWriter(writer)])
+
+def _write_sql_file(source, db_type, output_file, workers=1, compress=None, chunk_bytes=None, output_format='sql'):
+    if output_format in BULK_FORMATS:
+        writer = BULK_FORMATS[output_format](output_file)
+        return write_dataset(source.batches(workers), [writer])
+    dialect = _script_dialect(db_type, output_format)
+    if chunk_bytes:
+        plan = source if isinstance(source, DatasetPlan) else source.plan
+        writer = ChunkedSqlWriter(output_file, dialect, chunk_bytes, compress, plan)
+        return write_dataset(source.batches(workers), [writer])
+    if compress:
+        f = BlockCompressedWriter(output_file, compress)
+    else:
+        f = open(output_file, 'w', encoding='utf-8')
+    with f:
+        return write_sql_script(f, dialect, source, workers)
+
+def write_sql_files(source, outputs, workers=1, compress=None, chunk_bytes=None, output_format='sql'):
+    """Write the dataset as one SQL script per dialect
+
+    With more than one dialect each script is rendered in its own process, so the wall
+    time is close to that of the slowest dialect rather than the sum of all of them.
+    Every process reads the data itself from a StoredDataset, which is cheaper than
+    shipping every batch to each renderer. A plan is first generated once, with all
+    the workers, into a temporary dataset beside the outputs, so no row is generated
+    more than once.
+
+    Args:
+        source: DatasetPlan to generate, or StoredDataset to read
+        outputs: List of (db_type, output_file) pairs
+        compress: None, or a COMPRESSIONS format to compress the files with
+        chunk_bytes: If set, each output is a directory of SQL chunks of about this size
+            (see ChunkedSqlWriter) instead of a single file
+        output_format: 'sql' for INSERT scripts, or one of SCRIPT_FORMATS or BULK_FORMATS
+            (whose outputs are directories of data files and load scripts)
+        workers: Generation worker processes
+
+    Returns:
+        dict: Rows generated per TableSpec
+    """
+    if len(outputs) == 1:
+        db_type, output_file = outputs[0]
+        return _write_sql_file(source, db_type, output_file, workers, compress, chunk_bytes, output_format)
+
+    import tempfile
+
+    if isinstance(source, StoredDataset):
+        return _render_sql_files(source, outputs, compress, chunk_bytes, output_format)
+    directory = os.path.dirname(os.path.abspath(outputs[0][1]))
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix='chinook_dataset_', dir=directory) as dataset_directory:
+        print(f"Generating the dataset once for {len(outputs)} outputs...")
+        generate_dataset_file(source, dataset_directory, workers)
+        return _render_sql_files(StoredDataset(dataset_directory), outputs, compress, chunk_bytes, output_format)
+
+def _render_sql_files(dataset, outputs, compress, chunk_bytes, output_format):
+    """Render a StoredDataset to several outputs at once, one process each"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=len(outputs)) as pool:
+        futures = [pool.submit(_write_sql_file, dataset, db_type, output_file, 1, compress, chunk_bytes, output_format)
+                   for db_type, output_file in outputs]
+        results = [future.result() for future in futures]
+    return results[0]
+
+# Binary dataset files
+#
+# A generated dataset can be stored once and rendered to any dialect later, on any machine.
+# The data file holds the batches in the order they were generated, each as a block:
+#
+#   <H table index in TABLES> <I rows>, then per column: <I payload bytes> <zlib payload>
+#
+# Column payloads are arrays in the byte order recorded in the manifest: int64 for
+# integers and cent amounts, int32 day ordinals for dates, int64 seconds since 1970 for
+# timestamps. Text is int32 UTF-8 lengths (-1 for NULL) followed by the bytes. Columns in
+# DICTIONARY_COLUMNS are dictionary-encoded: the block carries the values first seen in
+# it (as text) followed by uint32 indexes into the dictionary built up so far.
+# manifest.json describes the plan, columns and per-table row counts and ID ranges.
+DATASET_FORMAT_VERSION = 1
+DATASET_FILE = 'dataset.bin'
+MANIFEST_FILE = 'manifest.json'
+
+ROW_TYPES = {ARTIST: ArtistRow, ALBUM: AlbumRow, TRACK: TrackRow, CUSTOMER: CustomerRow,
+             INVOICE: InvoiceRow, INVOICE_LINE: InvoiceLineRow, SYSTEM_LOG: SystemLogRow}
+
+# Low-cardinality name and location columns
+DICTIONARY_COLUMNS = {
+    'Customer': {'FirstName', 'LastName', 'Company', 'City', 'State', 'Country'},
+    'Invoice': {'BillingCity', 'BillingState', 'BillingCountry'},
+}
+
+_EPOCH = datetime(1970, 1, 1)
+
+def _column_encoding(spec, column, kind):
+    if kind in ('text', 'text_null'):
+        return 'dictionary' if column in DICTIONARY_COLUMNS.get(spec.name, ()) else 'plain'
+    return {'int': 'int64', 'money': 'int64', 'date': 'int32', 'datetime': 'int64'}[kind]
+
+def _encode_text(values):
+    lengths = array('i')
+    parts = []
+    for value in values:
+        if value is None:
+            lengths.append(-1)
+        else:
+            encoded = value.encode('utf-8')
+            lengths.append(len(encoded))
+            parts.append(encoded)
+    return lengths.tobytes() + b''.join(parts)
+
+def _decode_text(payload, count, offset=0, swap=False):
+    """Decode `count` text values from payload[offset:]; returns (values, end offset)"""
+    lengths = array('i')
+    lengths.frombytes(payload[offset:offset + 4 * count])
+    if swap:
+        lengths.byteswap()
+    offset += 4 * count
+    values = []
+    for length in lengths:
+        if length < 0:
+            values.append(None)
+        else:
+            values.append(payload[offset:offset + length].decode('utf-8'))
+            offset += length
+    return values, offset
+
+class DatasetFileWriter:
+    """Writes streamed (TableSpec, rows) batches to a binary dataset directory
+
+    Has the same begin()/write()/end() interface as SqlScriptWriter, so a dataset can be
+    stored and rendered as SQL in the same pass.
+    """
+
+    def __init__(self, directory, plan):
+        self.directory = directory
+        self.plan = plan
+        self._tables = {}
+        self._dictionaries = {}  # (table, column) -> {value: index}
+        self._file = None
+
+    def begin(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._file = open(os.path.join(self.directory, DATASET_FILE), 'wb')
+
+    def write(self, spec, rows):
+        if not rows:
+            return
+        table = self._tables.get(spec.name)
+        if table is None:
+            table = self._tables[spec.name] = {'rows': 0, 'first_id': rows[0][0], 'last_id': None, 'blocks': 0}
+        table['rows'] += len(rows)
+        table['last_id'] = rows[-1][0]
+        table['blocks'] += 1
+
+        self._file.write(struct.pack('<HI', TABLES.index(spec), len(rows)))
+        for position, (column, kind) in enumerate(spec.columns):
+            values = [row[position] for row in rows]
+            payload = self._encode_column(spec, column, kind, values)
+            payload = zlib.compress(payload, 1)
+            self._file.write(struct.pack('<I', len(payload)))
+            self._file.write(payload)
+
+    def _encode_column(self, spec, column, kind, values):
+        encoding = _column_encoding(spec, column, kind)
+        if encoding == 'dictionary':
+            dictionary = self._dictionaries.setdefault((spec.name, column), {})
+            new_values = []
+            indexes = array('I')
+            for value in values:
+                index = dictionary.get(value)
+                if index is None:
+                    index = dictionary[value] = len(dictionary)
+                    new_values.append(value)
+                indexes.append(index)
+            return struct.pack('<I', len(new_values)) + _encode_text(new_values) + indexes.tobytes()
+        if encoding == 'plain':
+            return _encode_text(values)
+        if kind == 'date':
+            return array('i', [value.toordinal() for value in values]).tobytes()
+        if kind == 'datetime':
+            return array('q', [int((value - _EPOCH).total_seconds()) for value in values]).tobytes()
+        return array('q', values).tobytes()
+
+    def end(self):
+        data_bytes = self._file.tell()
+        self._file.close()
+        manifest = {
+            'format': 'chinook-dataset',
+            'version': DATASET_FORMAT_VERSION,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'byteorder': sys.byteorder,
+            'plan': self.plan._asdict(),
+            'data_file': DATASET_FILE,
+            'data_bytes': data_bytes,
+            'tables': [],
+        }
+        for spec in TABLES:
+            table = self._tables.get(spec.name, {'rows': 0, 'first_id': None, 'last_id': None, 'blocks': 0})
+            manifest['tables'].append(dict(name=spec.name, columns=[
+                {'name': column, 'kind': kind, 'encoding': _column_encoding(spec, column, kind)}
+                for column, kind in spec.columns], **table))
+        with open(os.path.join(self.directory, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+            f.write('\n')
+
+class StoredDataset:
+    """A dataset written by DatasetFileWriter, usable wherever a DatasetPlan is rendered"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, MANIFEST_FILE), encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        if self.manifest.get('format') != 'chinook-dataset' or self.manifest.get('version') != DATASET_FORMAT_VERSION:
+            raise ValueError(f"{directory} is not a version {DATASET_FORMAT_VERSION} Chinook dataset")
+        self.plan = DatasetPlan(**self.manifest['plan'])
+
+    def expected_rows(self):
+        """Exact rows per table - unlike a plan, the invoice line count is known"""
+        rows = {table['name']: table['rows'] for table in self.manifest['tables']}
+        return {spec: rows.get(spec.name, 0) for spec in TABLES}
+
+    def batches(self, workers=1):
+        """Read the batches back in their original order (workers is ignored)"""
+        swap = self.manifest['byteorder'] != sys.byteorder
+        dictionaries = {}
+        with open(os.path.join(self.directory, self.manifest['data_file']), 'rb') as f:
+            while True:
+                header = f.read(6)
+                if not header:
+                    return
+                table_index, count = struct.unpack('<HI', header)
+                spec = TABLES[table_index]
+                columns = []
+                for column, kind in spec.columns:
+                    size, = struct.unpack('<I', f.read(4))
+                    payload = zlib.decompress(f.read(size))
+                    columns.append(self._decode_column(spec, column, kind, payload, count, swap, dictionaries))
+                yield spec, list(map(partial(tuple.__new__, ROW_TYPES[spec]), zip(*columns)))
+
+    @staticmethod
+    def _decode_column(spec, column, kind, payload, count, swap, dictionaries):
+        encoding = _column_encoding(spec, column, kind)
+        if encoding == 'dictionary':
+            dictionary = dictionaries.setdefault((spec.name, column), [])
+            new_count, = struct.unpack('<I', payload[:4])
+            new_values, offset = _decode_text(payload, new_count, 4, swap)
+            dictionary.extend(new_values)
+            indexes = array('I')
+            indexes.frombytes(payload[offset:])
+            if swap:
+                indexes.byteswap()
+            return [dictionary[index] for index in indexes]
+        if encoding == 'plain':
+            return _decode_text(payload, count, 0, swap)[0]
+        values = array('i' if encoding == 'int32' else 'q')
+        values.frombytes(payload)
+        if swap:
+            values.byteswap()
+        if kind == 'date':
+            return [date.fromordinal(value) for value in values]
+        if kind == 'datetime':
+            return [_EPOCH + timedelta(seconds=value) for value in values]
+        return values.tolist()
+
+def generate_dataset_file(plan, directory, workers=1):
+    """Generate a dataset and store it in `directory` for rendering later
+
+    Returns:
+        dict: Rows generated per TableSpec
+    """
+    return write_dataset(generate_dataset(plan, workers), [DatasetFileWriter(directory, plan)])
+
+# Command line: direct insertion targets, connection prompts, option parsing and main()
+
+def _insert_sqlserver(plan, workers, server, database, auth_type='windows', username=None, password=None,
+                      **options):
+    """Insert a dataset into SQL Server via pyodbc, or by streaming the script into sqlcmd"""
+    if _import_pyodbc() is not None:
+        # Parameterised batches over a pooled pyodbc connection
+        print(f"Inserting into {server}/{database} via pyodbc...")
+        connection = connect_sqlserver(server, database, auth_type, username, password)
+        try:
+            return load_direct(plan, SqlServerLoader(connection, **options), workers)
+        finally:
+            connection.close()
+    
+    row_counts = None
+    
+    def stream_script(f):
+        nonlocal row_counts
+        row_counts = stream_sql_script(f, DIALECTS['mssql'], plan, workers)
+    
+    insert_to_sqlserver(server, database, stream_script, auth_type, username, password)
+    return row_counts
+
+def _insert_postgresql(plan, workers, host, port, database, username, password=None, **options):
+    """Insert a dataset into PostgreSQL with streaming COPY"""
+    print(f"Inserting into {host}:{port}/{database} via COPY...")
+    connection = connect_postgresql(host, port, database, username, password)
+    try:
+        return load_direct(plan, PostgresqlLoader(connection, **options), workers)
+    finally:
+        connection.close()
+
+def _insert_mysql(plan, workers, host, port, database, username, password=None, **options):
+    """Insert a dataset into MySQL with packet-sized multi-row INSERT statements"""
+    print(f"Inserting into {host}:{port}/{database} via PyMySQL...")
+    connection = connect_mysql(host, port, database, username, password)
+    try:
+        return load_direct(plan, MysqlLoader(connection, **options), workers)
+    finally:
+        # The pooled connection only outlives the connection test for this load
+        _mysql_connections.pop((host, port, database, username), None)
+        connection.close()
+
+def _insert_sqlite(plan, workers, path, **options):
+    """Insert a dataset into a SQLite database file in-process"""
+    print(f"Inserting into {path} via sqlite3...")
+    connection = connect_sqlite(path)
+    try:
+        return load_direct(plan, SqliteLoader(connection, **options), workers)
+    finally:
+        connection.close()
+
+def _prompt_sqlserver_connection():
+    """Ask for SQL Server connection details until the connection test passes (None to give up)"""
+    while True:
+        print()
+        print("SQL Server connection details:")
+        server_input = input("  Server (default: localhost): ").strip()
+        db_server = server_input if server_input else 'localhost'
         
-        # Read stdout
-        for line in process.stdout:
-            print(line.rstrip())
-            stdout_lines.append(line)
+        db_name_input = input("  Database name (default: Chinook_FullRestore): ").strip()
+        db_name = db_name_input if db_name_input else 'Chinook_FullRestore'
         
-        # Wait for completion and get stderr
-        process.wait()
-        stderr_output = process.stderr.read()
+        print()
+        print("Authentication type:")
+        print("  1. Windows Authentication")
+        print("  2. SQL Server Authentication")
+        while True:
+            auth_choice = input("  Enter choice (1-2, default: 1): ").strip()
+            if auth_choice in ['', '1']:
+                auth_type = 'windows'
+                username = None
+                password = None
+                break
+            elif auth_choice == '2':
+                auth_type = 'sql'
+                username = input("  Username: ").strip()
+                import getpass
+                password = getpass.getpass("  Password: ")
+                break
+            else:
+                print("  Invalid choice. Please enter 1 or 2.")
+        print()
         
-        elapsed_time = time.time() - start_time
+        # Test the connection before proceeding
+        connection = dict(server=db_server, database=db_name, auth_type=auth_type, username=username, password=password)
+        if test_sqlserver_connection(**connection):
+            return connection
+        retry = input("Connection failed. Try again? (y/n): ").strip().lower()
+        if retry not in ['y', 'yes']:
+            return None
+
+def _prompt_postgresql_connection():
+    """Ask for PostgreSQL connection details until the connection test passes (None to give up)"""
+    import getpass
+    while True:
+        print()
+        print("PostgreSQL connection details:")
+        host = input("  Host (default: localhost): ").strip() or 'localhost'
+        port = input("  Port (default: 5432): ").strip() or '5432'
+        database = input("  Database name (default: chinook): ").strip() or 'chinook'
+        username = input("  Username (default: postgres): ").strip() or 'postgres'
+        password = getpass.getpass("  Password (blank to use PGPASSWORD/.pgpass): ") or None
+        print()
         
-        # Check for errors
-        if process.returncode != 0:
-            print("\n" + "=" * 80)
-            print("ERROR: SQL execution failed")
-            print("=" * 80)
-            print(stderr_output)
-            return False
+        # Test the connection before proceeding
+        connection = dict(host=host, port=int(port), database=database, username=username, password=password)
+        if test_postgresql_connection(**connection):
+            return connection
+        retry = input("Connection failed. Try again? (y/n): ").strip().lower()
+        if retry not in ['y', 'yes']:
+            return None
+
+def _prompt_mysql_connection():
+    """Ask for MySQL connection details until the connection test passes (None to give up)"""
+    import getpass
+    while True:
+        print()
+        print("MySQL connection details:")
+        host = input("  Host (default: localhost): ").strip() or 'localhost'
+        port = input("  Port (default: 3306): ").strip() or '3306'
+        database = input("  Database name (default: chinook): ").strip() or 'chinook'
+        username = input("  Username (default: root): ").strip() or 'root'
+        password = getpass.getpass("  Password (blank to use MYSQL_PWD): ") or None
+        print()
         
-        print("\n" + "=" * 80)
-        print("SUCCESS: All data inserted directly into SQL Server database!")
-        print(f"Total execution time: {elapsed_time:.2f} seconds ({elapsed_time/60:.2f} minutes)")
-        print("=" * 80)
-        return True
+        # Test the connection before proceeding
+        connection = dict(host=host, port=int(port), database=database, username=username, password=password)
+        if test_mysql_connection(**connection):
+            return connection
+        retry = input("Connection failed. Try again? (y/n): ").strip().lower()
+        if retry not in ['y', 'yes']:
+            return None
+
+def _prompt_sqlite_connection():
+    """Ask for a SQLite database file until it can be opened (None to give up)"""
+    while True:
+        print()
+        print("SQLite database:")
+        path = input(f"  Database file (default: {SQLITE_DEFAULT_PATH}): ").strip() or SQLITE_DEFAULT_PATH
+        print()
         
-    except FileNotFoundError:
-        print("\nERROR: sqlcmd utility not found.")
-        print("\nPlease ensure SQL Server Command Line Utilities are installed.")
-        print("Download from: https://docs.microsoft.com/en-us/sql/tools/sqlcmd-utility")
-        return False
-    except Exception as e:
-        print(f"\nERROR: {str(e)}")
-        return False
+        connection = dict(path=path)
+        if test_sqlite_connection(**connection):
+            return connection
+        retry = input("Could not open the database file. Try again? (y/n): ").strip().lower()
+        if retry not in ['y', 'yes']:
+            return None
+
+DATABASE_LABELS = {'mssql': 'SQL Server', 'oracle': 'Oracle', 'postgresql': 'PostgreSQL', 'mysql': 'MySQL',
+                   'sqlite': 'SQLite'}
+
+class DirectTarget(NamedTuple):
+    """A database that generated data can be inserted into directly"""
+    label: str
+    test: object  # test(**connection) -> bool
+    prompt: object  # prompt() -> connection dict, or None
+    insert: object  # insert(plan, workers, **connection) -> row counts
+    quick_connection: dict  # --quick defaults
+    quick_auth: str
+    describe: object  # describe(connection) -> 'server/database'
+    loader: type  # DirectLoader subclass
+    connect: object  # connect(**connection) -> a new connection for the loader
+
+DIRECT_TARGETS = {
+    'mssql': DirectTarget('SQL Server', test_sqlserver_connection, _prompt_sqlserver_connection, _insert_sqlserver,
+                          dict(server='localhost', database='Chinook_FullRestore', auth_type='windows',
+                               username=None, password=None),
+                          'Windows Authentication',
+                          lambda connection: f"{connection['server']}/{connection['database']}",
+                          SqlServerLoader, connect_sqlserver),
+    'postgresql': DirectTarget('PostgreSQL', test_postgresql_connection, _prompt_postgresql_connection,
+                               _insert_postgresql,
+                               dict(host='localhost', port=5432, database='chinook', username='postgres', password=None),
+                               'user postgres, password from PGPASSWORD/.pgpass',
+                               lambda connection: f"{connection['host']}:{connection['port']}/{connection['database']}",
+                               PostgresqlLoader, connect_postgresql),
+    'mysql': DirectTarget('MySQL', test_mysql_connection, _prompt_mysql_connection, _insert_mysql,
+                          dict(host='localhost', port=3306, database='chinook', username='root', password=None),
+                          'user root, password from MYSQL_PWD',
+                          lambda connection: f"{connection['host']}:{connection['port']}/{connection['database']}",
+                          MysqlLoader, partial(connect_mysql, pooled=False)),
+    'sqlite': DirectTarget('SQLite', test_sqlite_connection, _prompt_sqlite_connection, _insert_sqlite,
+                           dict(path=SQLITE_DEFAULT_PATH), 'in-process sqlite3, no server needed',
+                           lambda connection: connection['path'],
+                           SqliteLoader, connect_sqlite),
+}
+
+def _insert_direct(db_type, plan, workers, connection, connections=1, batch_size=None, checkpoint=None,
+                   strategy=LOAD_STRATEGIES['safe']):
+    """Insert a dataset into a database, over several connections at once when connections > 1
+
+    batch_size fixes the rows per insert round trip; None lets each loader tune it per table.
+    With a LoadCheckpoint only the rows it has not recorded as committed are loaded.
+    """
+    target = DIRECT_TARGETS[db_type]
+    if strategy.name != 'safe':
+        if db_type == 'mssql' and _import_pyodbc() is None:
+            print(f"--load-strategy {strategy.name} needs pyodbc for SQL Server; streaming into sqlcmd as one transaction")
+            strategy = LOAD_STRATEGIES['safe']
+        else:
+            print(f"Load strategy: {strategy.name} - {strategy.description}")
+    if checkpoint is not None:
+        if db_type == 'mssql' and _import_pyodbc() is None:
+            print("--checkpoint needs pyodbc for SQL Server (sqlcmd cannot report its commits)")
+            return None
+        if connections > 1:
+            # Partitions commit out of order, so committed rows would not form a prefix of each table
+            print("--checkpoint: loading over one connection")
+            connections = 1
+        if checkpoint.committing is not None:
+            print("The last checkpoint was interrupted; checking whether its commit went through...")
+            c = target.connect(**connection)
+            try:
+                checkpoint.settle(target.loader(c))
+            finally:
+                c.close()
+        plan = checkpoint.remaining_plan()
+    limit = target.loader.max_connections
+    if connections > 1 and limit is not None and connections > limit:
+        print(f"--connections: {target.label} loads over at most {limit} connection{'s' if limit > 1 else ''}")
+        connections = limit
+    if connections > 1 and db_type == 'mssql' and _import_pyodbc() is None:
+        print("--connections needs pyodbc for SQL Server; streaming into sqlcmd over one connection")
+        connections = 1
+    if connections <= 1:
+        row_counts = target.insert(plan, workers, batch_size=batch_size, checkpoint=checkpoint, strategy=strategy,
+                                   **connection)
+        if row_counts is None and checkpoint is not None and checkpoint.committed:
+            print(f"Committed rows are recorded in {checkpoint.path}: add --resume to the same command to continue")
+        return row_counts
+    
+    print(f"Inserting into {target.describe(connection)} over {connections} connections...")
+    opened = []
+    try:
+        for _ in range(connections):
+            opened.append(target.connect(**connection))
+        loader = ParallelLoader([target.loader(c, batch_size=batch_size, strategy=strategy) for c in opened],
+                                plan.expected_rows())
+        return load_direct(plan, loader, workers)
+    finally:
+        for c in opened:
+            c.close()
+
+def read_table_state(db_type, connection):
+    """Rows and highest ID of each generated table in a live database, for top_up_plan()
+
+    Returns None for SQL Server without pyodbc, where sqlcmd cannot return query results.
+    """
+    target = DIRECT_TARGETS[db_type]
+    if db_type == 'mssql' and _import_pyodbc() is None:
+        return None
+    c = target.connect(**connection)
+    try:
+        loader = target.loader(c)
+        return {spec: loader.table_state(spec) for spec in TABLES}
+    finally:
+        c.close()
+
+def _pop_option(argv, name, default=None):
+    """Remove `name value` from an argument list and return the value (or default if absent)"""
+    if name not in argv:
+        return default
+    i = argv.index(name)
+    if i + 1 >= len(argv):
+        raise SystemExit(f"{name} requires a value")
+    value = argv[i + 1]
+    del argv[i:i + 2]
+    return value
+
+def _output_path(db_type, suffix='', chunked=False, output_format='sql'):
+    """Default SQL output for a dialect: a script, or a directory of chunks"""
+    kind = 'inserts' if output_format == 'sql' else output_format
+    if output_format in BULK_FORMATS:
+        return f'{DIALECTS[db_type].directory}/large_dataset_{kind}_{db_type}'
+    if chunked:
+        kind = 'chunks' if output_format == 'sql' else f'{output_format}_chunks'
+        return f'{DIALECTS[db_type].directory}/large_dataset_{kind}_{db_type}'
+    return f'{DIALECTS[db_type].directory}/large_dataset_{kind}_{db_type}.sql{suffix}'
+
+def _format_databases(databases, output_format):
+    """The databases an --format applies to (all of them for 'sql')"""
+    if output_format == 'sql':
+        return databases
+    format_database = _format_database(output_format)
+    if format_database not in databases:
+        print(f"--format {output_format} is only available for {format_database}")
+        return []
+    if len(databases) > 1:
+        print(f"--format {output_format}: writing {format_database} only")
+    return [format_database]
+
+def _top_up(plan, manifest=None, db_type=None, connection=None):
+    """Turn a plan of target row counts into a top-up plan (see top_up_plan()), or None on error
+
+    The table state comes from the manifest file if one is given, otherwise from the database.
+    """
+    if manifest:
+        source = manifest
+        try:
+            state = read_table_manifest(manifest)
+        except (OSError, ValueError) as e:
+            print(f"Cannot read {manifest}: {e}")
+            return None
+    elif connection is not None:
+        source = DIRECT_TARGETS[db_type].describe(connection)
+        print(f"Reading table sizes from {source}...")
+        state = read_table_state(db_type, connection)
+        if state is None:
+            print("--top-up needs pyodbc to read SQL Server's tables; pass --top-up-manifest instead")
+            return None
+    else:
+        print("--top-up reads the tables of the target database (direct insertion), "
+              "or of a --top-up-manifest file")
+        return None
+    try:
+        topped_up = top_up_plan(plan, state)
+    except ValueError as e:
+        print(f"Cannot top up: {e}")
+        return None
+    print(f"Top-up from {source}:")
+    for spec, target, rows, first_id in ((CUSTOMER, plan.customers, topped_up.customers, topped_up.first_customer_id),
+                                         (INVOICE, plan.invoices, topped_up.invoices, topped_up.first_invoice_id),
+                                         (SYSTEM_LOG, plan.systemlog, topped_up.systemlog, topped_up.first_log_id)):
+        current, last_id = state.get(spec, (0, None))
+        added = f"adding {rows:,} from ID {first_id:,}" if rows else "nothing to add"
+        print(f"  {spec.name}: {current:,} rows (highest ID {'-' if last_id is None else f'{last_id:,}'}), "
+              f"target {target:,} - {added}")
+    if topped_up.invoices:
+        print(f"  {INVOICE_LINE.name}: new lines from ID {topped_up.first_invoice_line_id:,}")
+    print(f"  Catalog: {'adding the chart artists, albums and tracks' if topped_up.catalog else 'already loaded'}")
+    print()
+    return topped_up
 
 def main():
-    import sys
+    # Options valid in every mode are taken out first so they don't affect mode detection
+    argv = list(sys.argv)
+    workers = int(_pop_option(argv, '--workers', 1))
+    if workers < 1:
+        print("--workers must be at least 1")
+        return
+    # Direct insertion: database connections to load over at once (see ParallelLoader)
+    connections = int(_pop_option(argv, '--connections', 1))
+    if connections < 1:
+        print("--connections must be at least 1")
+        return
+    # Direct insertion: fixed rows per insert round trip (default: tuned per table, see AdaptiveBatchSize)
+    batch_size = _pop_option(argv, '--batch-size')
+    batch_size = int(batch_size) if batch_size is not None else None
+    if batch_size is not None and batch_size < 1:
+        print("--batch-size must be at least 1")
+        return
+    # Direct insertion: commit about every N rows and record them for --resume (see LoadCheckpoint)
+    checkpoint_rows = _pop_option(argv, '--checkpoint')
+    checkpoint_rows = int(checkpoint_rows) if checkpoint_rows is not None else None
+    if checkpoint_rows is not None and checkpoint_rows < 1:
+        print("--checkpoint must be at least 1")
+        return
+    checkpoint_file = _pop_option(argv, '--checkpoint-file', CHECKPOINT_FILE)
+    resume = '--resume' in argv
+    if resume:
+        argv.remove('--resume')
+    # Direct insertion: durability and constraint checking traded for speed (see LOAD_STRATEGIES)
+    load_strategy = _pop_option(argv, '--load-strategy', 'safe')
+    if load_strategy not in LOAD_STRATEGIES:
+        print(f"Invalid load strategy: {load_strategy}")
+        print(f"Valid strategies: {', '.join(LOAD_STRATEGIES)}")
+        return
+    engine = _pop_option(argv, '--engine', 'python')
+    if engine not in INVOICE_ENGINES:
+        print(f"Invalid engine: {engine}")
+        print(f"Valid engines: {', '.join(INVOICE_ENGINES)}")
+        return
+    if engine == 'numpy' and not numpy_available():
+        print("--engine numpy requires NumPy (pip install numpy)")
+        return
+    seed = _pop_option(argv, '--seed')
+    seed = int(seed) if seed is not None else random.randrange(1 << 32)
+    # Rows already loaded by an earlier run with the same --seed; only the rows after them are emitted
+    existing_customers = int(_pop_option(argv, '--existing-customers', 0))
+    existing_invoices = int(_pop_option(argv, '--existing-invoices', 0))
+    existing_systemlog = int(_pop_option(argv, '--existing-systemlog', 0))
+    # Top-up: the counts are the sizes the tables should grow to, with IDs after those in use
+    top_up_manifest = _pop_option(argv, '--top-up-manifest')
+    top_up = '--top-up' in argv or top_up_manifest is not None
+    if '--top-up' in argv:
+        argv.remove('--top-up')
+    if top_up and (existing_customers or existing_invoices or existing_systemlog):
+        print("--top-up works out the existing rows itself; leave out --existing-*")
+        return
+    compress = _pop_option(argv, '--compress')
+    if compress is not None and compress not in COMPRESSIONS:
+        print(f"Invalid compression: {compress}")
+        print(f"Valid formats: {', '.join(COMPRESSIONS)}")
+        return
+    suffix = COMPRESSIONS[compress] if compress else ''
+    # Chunked output: a directory of per-table SQL files of about this many MB each
+    chunk_size = _pop_option(argv, '--chunk-size')
+    chunk_bytes = int(float(chunk_size) * 1024 * 1024) if chunk_size else None
+    output_format = _pop_option(argv, '--format', 'sql')
+    if output_format != 'sql' and output_format not in SCRIPT_FORMATS and output_format not in BULK_FORMATS:
+        print(f"Invalid format: {output_format}")
+        print(f"Valid formats: sql, {', '.join(SCRIPT_FORMATS)}, {', '.join(BULK_FORMATS)}")
+        return
     
     print("=" * 80)
     print("Chinook Database - Large Scale Data Generator")
     print("=" * 80)
     print()
     
+    # Two-stage mode: store a generated dataset once, then render it for any dialect
+    if len(argv) > 2 and argv[1] == 'generate':
+        plan = DatasetPlan(customers=int(_pop_option(argv, '--customers', 941)),
+                           invoices=int(_pop_option(argv, '--invoices', 3588)),
+                           systemlog=int(_pop_option(argv, '--systemlog', 0)),
+                           seed=seed, engine=engine, existing_customers=existing_customers,
+                           existing_invoices=existing_invoices, existing_systemlog=existing_systemlog)
+        if top_up:
+            plan = _top_up(plan, top_up_manifest)
+            if plan is None:
+                return
+        directory = argv[2]
+        print(f"Seed: {plan.seed} (use --seed {plan.seed} to reproduce this data)")
+        print(f"Generating dataset into {directory}...")
+        row_counts = generate_dataset_file(plan, directory, workers)
+        print(f"  ✓ {os.path.join(directory, DATASET_FILE)} "
+              f"({os.path.getsize(os.path.join(directory, DATASET_FILE)) / 1024 / 1024:.1f} MB)")
+        print(f"  ✓ {os.path.join(directory, MANIFEST_FILE)}")
+        for spec in TABLES:
+            print(f"  {spec.name}: {row_counts[spec]:,} rows")
+        return
+    if len(argv) > 2 and argv[1] == 'render':
+        db_type = _pop_option(argv, '--dialect', 'all')
+        output_file = _pop_option(argv, '--output')
+        if db_type not in DIALECTS and db_type != 'all':
+            print(f"Invalid dialect: {db_type}")
+            print(f"Valid dialects: {', '.join(DIALECTS)}, all")
+            return
+        if output_file and db_type == 'all':
+            print("--output needs a single --dialect")
+            return
+        source = StoredDataset(argv[2])
+        print(f"Rendering {argv[2]} (seed {source.plan.seed})...")
+        databases = _format_databases(list(DIALECTS) if db_type == 'all' else [db_type], output_format)
+        if not databases:
+            return
+        outputs = [(db, output_file or _output_path(db, suffix, chunk_bytes, output_format)) for db in databases]
+        write_sql_files(source, outputs, compress=compress, chunk_bytes=chunk_bytes, output_format=output_format)
+        for _, path in outputs:
+            print(f"  ✓ {path}")
+        return
+    # Execute a (possibly compressed) SQL Server script file
+    if len(argv) > 2 and argv[1] == 'load':
+        db_server = _pop_option(argv, '--server', 'localhost')
+        db_name = _pop_option(argv, '--database', 'Chinook_FullRestore')
+        username = _pop_option(argv, '--username')
+        password = None
+        if username:
+            import getpass
+            password = getpass.getpass("Password: ")
+        insert_to_sqlserver(db_server, db_name, argv[2], 'sql' if username else 'windows', username, password)
+        return
+    
     # Quick mode with command-line arguments
-    if '--quick' in sys.argv:
+    if '--quick' in argv:
         print("QUICK MODE - Using defaults with command-line options")
         print()
         
-        db_type = 'mssql'
+        db_type = _pop_option(argv, '--target', 'mssql')
+        if db_type not in DIRECT_TARGETS:
+            print(f"Invalid target: {db_type}")
+            print(f"Valid targets: {', '.join(DIRECT_TARGETS)}")
+            return
+        target = DIRECT_TARGETS[db_type]
         insertion_mode = 'direct'
         
         # Default values
@@ -915,25 +4593,21 @@ def main():
         systemlog_count = 65000  # Default to 65000 rows (~500MB) for quick mode
         
         # Parse command-line arguments for custom values
-        for i, arg in enumerate(sys.argv):
-            if arg == '--customers' and i + 1 < len(sys.argv):
-                new_customers = int(sys.argv[i + 1])
-            elif arg == '--invoices' and i + 1 < len(sys.argv):
-                new_invoices = int(sys.argv[i + 1])
-            elif arg == '--systemlog' and i + 1 < len(sys.argv):
-                systemlog_count = int(sys.argv[i + 1])
+        for i, arg in enumerate(argv):
+            if arg == '--customers' and i + 1 < len(argv):
+                new_customers = int(argv[i + 1])
+            elif arg == '--invoices' and i + 1 < len(argv):
+                new_invoices = int(argv[i + 1])
+            elif arg == '--systemlog' and i + 1 < len(argv):
+                systemlog_count = int(argv[i + 1])
         
         generate_systemlog_data = systemlog_count > 0
         
-        # Default SQL Server connection settings
-        db_server = 'localhost'
-        db_name = 'Chinook_FullRestore'
-        auth_type = 'windows'
-        username = None
-        password = None
+        # Default connection settings
+        connection = dict(target.quick_connection)
         
-        print(f"Database: SQL Server ({db_server}/{db_name})")
-        print(f"Mode: Direct insertion (Windows Authentication)")
+        print(f"Database: {target.label} ({target.describe(connection)})")
+        print(f"Mode: Direct insertion ({target.quick_auth})")
         print(f"Customers: {new_customers:,}")
         print(f"Invoices: {new_invoices:,}")
         if generate_systemlog_data:
@@ -944,26 +4618,27 @@ def main():
         print()
         
         # Test connection
-        print("Testing SQL Server connection...")
-        if not test_sqlserver_connection(db_server, db_name, auth_type, username, password):
-            print("❌ Connection failed. Please check your SQL Server settings.")
+        print(f"Testing {target.label} connection...")
+        if not target.test(**connection):
+            print(f"❌ Connection failed. Please check your {target.label} settings.")
             print("   Try running without --quick for interactive mode.")
             return
         print("✓ Connection successful")
         print()
         
     # Interactive mode if no arguments provided
-    elif len(sys.argv) == 1:
+    elif len(argv) == 1:
         print("Select target database(s):")
         print("  1. SQL Server")
         print("  2. Oracle")
         print("  3. PostgreSQL")
         print("  4. MySQL")
-        print("  5. All databases")
+        print("  5. SQLite")
+        print("  6. All databases")
         print()
         
         while True:
-            choice = input("Enter choice (1-5, default: 1): ").strip()
+            choice = input("Enter choice (1-6, default: 1): ").strip()
             if choice == '' or choice == '1':
                 db_type = 'mssql'
                 break
@@ -977,15 +4652,18 @@ def main():
                 db_type = 'mysql'
                 break
             elif choice == '5':
+                db_type = 'sqlite'
+                break
+            elif choice == '6':
                 db_type = 'all'
                 break
             else:
-                print("Invalid choice. Please enter 1-5.")
+                print("Invalid choice. Please enter 1-6.")
         
         print()
         
-        # Ask for insertion mode (only for single database, not 'all')
-        if db_type != 'all':
+        # Ask for insertion mode (only for a single database with a direct-insert backend)
+        if db_type in DIRECT_TARGETS:
             print("Select insertion mode:")
             print("  1. Generate SQL file")
             print("  2. Direct database insert (faster for large datasets)")
@@ -1003,51 +4681,17 @@ def main():
                     print("Invalid choice. Please enter 1 or 2.")
             
             # Get database connection details for direct insert
-            if insertion_mode == 'direct' and db_type == 'mssql':
-                while True:
-                    print()
-                    print("SQL Server connection details:")
-                    server_input = input("  Server (default: localhost): ").strip()
-                    db_server = server_input if server_input else 'localhost'
-                    
-                    db_name_input = input("  Database name (default: Chinook_FullRestore): ").strip()
-                    db_name = db_name_input if db_name_input else 'Chinook_FullRestore'
-                    
-                    print()
-                    print("Authentication type:")
-                    print("  1. Windows Authentication")
-                    print("  2. SQL Server Authentication")
-                    while True:
-                        auth_choice = input("  Enter choice (1-2, default: 1): ").strip()
-                        if auth_choice in ['', '1']:
-                            auth_type = 'windows'
-                            username = None
-                            password = None
-                            break
-                        elif auth_choice == '2':
-                            auth_type = 'sql'
-                            username = input("  Username: ").strip()
-                            import getpass
-                            password = getpass.getpass("  Password: ")
-                            break
-                        else:
-                            print("  Invalid choice. Please enter 1 or 2.")
-                    print()
-                    
-                    # Test the connection before proceeding
-                    if test_sqlserver_connection(db_server, db_name, auth_type, username, password):
-                        break
-                    else:
-                        retry = input("Connection failed. Try again? (y/n): ").strip().lower()
-                        if retry not in ['y', 'yes']:
-                            print("Aborting direct database insertion.")
-                            return
+            if insertion_mode == 'direct':
+                connection = DIRECT_TARGETS[db_type].prompt()
+                if connection is None:
+                    print("Aborting direct database insertion.")
+                    return
         else:
             insertion_mode = 'file'  # Always use file mode for 'all databases'
         
         print()
         print("How many new customers to generate?")
-        print(f"  Current: 59 in base database")
+        print(f"  Current: {BASE_CUSTOMERS} in base database")
         print(f"  Recommended: 941 (for total of 1,000)")
         while True:
             try:
@@ -1062,7 +4706,7 @@ def main():
         
         print()
         print("How many new invoices to generate?")
-        print(f"  Current: 412 in base database")
+        print(f"  Current: {BASE_INVOICES} in base database")
         print(f"  Recommended: 3,588 (for total of 4,000)")
         print(f"  Date range: Jan 1, 2022 - Jan 19, 2026")
         while True:
@@ -1096,8 +4740,8 @@ def main():
     else:
         # Command line mode - always use file generation
         insertion_mode = 'file'
-        db_type = sys.argv[1]
-        valid_types = ['mssql', 'oracle', 'postgresql', 'mysql', 'all']
+        db_type = argv[1]
+        valid_types = list(DIALECTS) + ['all']
         
         if db_type not in valid_types:
             print(f"Invalid database type: {db_type}")
@@ -1105,77 +4749,102 @@ def main():
             return
         
         # Default counts for command line mode
-        new_customers = int(sys.argv[2]) if len(sys.argv) > 2 else 941
-        new_invoices = int(sys.argv[3]) if len(sys.argv) > 3 else 3588
+        new_customers = int(argv[2]) if len(argv) > 2 else 941
+        new_invoices = int(argv[3]) if len(argv) > 3 else 3588
         generate_systemlog_data = False
         systemlog_count = 0
     
-    databases_to_generate = [db_type] if db_type != 'all' else ['mssql', 'oracle', 'postgresql', 'mysql']
-    
-    total_customers = 59 + new_customers
-    total_invoices = 412 + new_invoices
-    
-    # Generate data once
-    print(f"Generating {total_customers:,} customers with diverse, realistic data...")
-    print()
-    
-    customers, customers_dict = generate_customers(start_id=60, count=new_customers)
-    
-    print(f"✓ Generated {len(customers):,} new customers")
-    print(f"  Total customers: {total_customers:,} (59 original + {new_customers:,} new)")
-    print()
+    databases_to_generate = [db_type] if db_type != 'all' else list(DIALECTS)
     
-    print(f"Generating {total_invoices:,} invoices for 2022-2026 (Jan 1, 2022 - Jan 19, 2026)...")
-    print()
+    # The seed makes the data reproducible: it is generated again from it for another database,
+    # and a later run with the same seed can add only the rows beyond the existing ones
+    plan = DatasetPlan(customers=new_customers, invoices=new_invoices,
+                       systemlog=systemlog_count if generate_systemlog_data else 0,
+                       seed=seed, engine=engine, existing_customers=existing_customers,
+                       existing_invoices=existing_invoices, existing_systemlog=existing_systemlog)
     
-    # Only reference the new customers we're generating (60+) to avoid dependency on original data
-    invoices, invoice_lines = generate_invoices(start_id=413, count=new_invoices, customer_count=new_customers, customer_id_start=60, customers_dict=customers_dict)
+    if load_strategy != 'safe' and insertion_mode != 'direct':
+        print("--load-strategy applies to direct insertion (use --chunk-size for scripts that commit per chunk)")
+        return
     
-    print(f"✓ Generated {len(invoices):,} new invoices")
-    print(f"✓ Generated {len(invoice_lines):,} new invoice lines")
-    print(f"  Total invoices: {total_invoices:,} (412 original + {new_invoices:,} new)")
-    print()
+    if top_up:
+        if resume:
+            print("--resume continues the plan recorded in the state file; leave out --top-up")
+            return
+        plan = _top_up(plan, top_up_manifest, db_type, connection if insertion_mode == 'direct' else None)
+        if plan is None:
+            return
+        if not (plan.customers or plan.invoices or plan.systemlog or plan.catalog):
+            print("The tables have already reached the requested sizes - nothing to add")
+            return
+        new_customers, new_invoices = plan.customers, plan.invoices
     
-    print("Generating 200 real artists from charts with clean content...")
-    print()
+    # Checkpointed load: the state file ties the committed rows to this target and plan
+    checkpoint = None
+    if checkpoint_rows or resume:
+        if insertion_mode != 'direct':
+            print("--checkpoint and --resume apply to direct insertion (use --chunk-size for scripts "
+                  "that commit per chunk)")
+            return
+        checkpoint_target = {'database': db_type, 'connection': DIRECT_TARGETS[db_type].describe(connection)}
+        checkpoint = LoadCheckpoint.load(checkpoint_file)
+        if resume:
+            if checkpoint is None:
+                print(f"Nothing to resume: {checkpoint_file} not found")
+                return
+            if checkpoint.target != checkpoint_target:
+                print(f"{checkpoint_file} belongs to a load into {checkpoint.target['connection']} "
+                      f"({checkpoint.target['database']})")
+                return
+            if checkpoint.complete:
+                print(f"The load recorded in {checkpoint_file} has already completed")
+                return
+            plan = checkpoint.plan
+            checkpoint.rows = checkpoint_rows or checkpoint.rows
+            committed = ", ".join(f"{name} {entry['rows']:,}" for name, entry in checkpoint.committed.items())
+            print(f"Resuming the load recorded in {checkpoint_file} (committed: {committed or 'nothing yet'})")
+        elif checkpoint is not None and not checkpoint.complete:
+            print(f"{checkpoint_file} records an unfinished load: add --resume to continue it, "
+                  f"or delete the file to start over")
+            return
+        else:
+            checkpoint = LoadCheckpoint(checkpoint_file, checkpoint_target, plan, checkpoint_rows)
+            checkpoint.save()
     
-    artists, albums, tracks = generate_artists_albums_tracks(start_artist_id=276, start_album_id=348, start_track_id=3504)
+    # A top-up run counts only the rows it adds
+    total_customers = plan.customers if top_up else BASE_CUSTOMERS + plan.customers
+    total_invoices = plan.invoices if top_up else BASE_INVOICES + plan.invoices
     
-    print(f"✓ Generated {len(artists)} artists")
-    print(f"✓ Generated {len(albums)} albums")
-    print(f"✓ Generated {len(tracks)} tracks")
+    # Data is generated lazily while it is written, one batch at a time, so memory use does
+    # not grow with the row counts
+    print(f"Seed: {plan.seed} (use --seed {plan.seed} to reproduce this data)")
+    if workers > 1:
+        print(f"Generating with {workers} worker processes")
+    if plan.is_delta:
+        print(f"Adding to an existing dataset: {plan.existing_customers:,} customers, "
+              f"{plan.existing_invoices:,} invoices and {plan.existing_systemlog:,} SystemLog entries "
+              f"already generated with this seed")
+    print(f"Generating {total_customers:,} customers with diverse, realistic data...")
+    print(f"Generating {total_invoices:,} invoices for 2022-2026 (Jan 1, 2022 - Jan 19, 2026)...")
+    if plan.emits_catalog:
+        print("Generating 200 real artists from charts with clean content...")
+    if plan.systemlog:
+        estimated_mb = (plan.systemlog * 8) // 1000  # ~7.8KB per row
+        print(f"Generating {plan.systemlog:,} SystemLog entries (~{estimated_mb}MB after SQL padding)...")
     print()
     
-    # Generate SystemLog if requested
-    if generate_systemlog_data:
-        estimated_mb = (systemlog_count * 8) // 1000  # ~7.8KB per row
-        print(f"Generating {systemlog_count:,} SystemLog entries (~{estimated_mb}MB after SQL padding)...")
-        print()
-        
-        systemlog = generate_systemlog(count=systemlog_count, invoice_count=new_invoices)
-        
-        print(f"✓ Generated {len(systemlog):,} log entries (SQL Server will add ~7.8KB padding per row)")
-        print()
-    else:
-        systemlog = []
+    row_counts = None
     
     # Insert or generate files based on mode
     if insertion_mode == 'direct':
         # Direct database insertion - can insert to multiple databases with same data
-        # Strategy: Generate SQL file first, then execute it
+        # Strategy: Stream the generated rows straight into the database
         while True:
-            if db_type == 'mssql':
-                # Generate the SQL file
-                db_dirs = {'mssql': 'MSSQL'}
-                output_file = f'{db_dirs[db_type]}/large_dataset_inserts_{db_type}.sql'
-                
-                print(f"Generating SQL file: {output_file}...")
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    write_mssql_format(f, artists, albums, tracks, customers, invoices, invoice_lines, systemlog)
-                print(f"  ✓ SQL file generated\n")
-                
-                # Execute the file directly to the database
-                insert_to_sqlserver(db_server, db_name, output_file, auth_type, username, password)
+            row_counts = _insert_direct(db_type, plan, workers, connection, connections, batch_size, checkpoint,
+                                        LOAD_STRATEGIES[load_strategy])
+            checkpoint = None  # The state file only tracks the first database
+            if top_up:
+                break  # The IDs were chosen for this database
             
             # Ask if user wants to insert to another database
             print()
@@ -1189,91 +4858,51 @@ def main():
                 break
             
             # Prompt for next database
+            choices = list(DATABASE_LABELS)
             print()
             print("Select target database:")
-            print("  1. SQL Server")
-            print("  2. Oracle (not yet implemented)")
-            print("  3. PostgreSQL (not yet implemented)")
-            print("  4. MySQL (not yet implemented)")
+            for number, db in enumerate(choices, 1):
+                suffix_note = "" if db in DIRECT_TARGETS else " (not yet implemented)"
+                print(f"  {number}. {DATABASE_LABELS[db]}{suffix_note}")
             print()
             
             while True:
-                db_choice = input("Enter choice (1-4, default: 1): ").strip()
-                if db_choice == '' or db_choice == '1':
-                    db_type = 'mssql'
-                    break
-                elif db_choice in ['2', '3', '4']:
+                db_choice = input(f"Enter choice (1-{len(choices)}, default: 1): ").strip() or '1'
+                if db_choice.isdigit() and 1 <= int(db_choice) <= len(choices):
+                    db_type = choices[int(db_choice) - 1]
+                    if db_type in DIRECT_TARGETS:
+                        break
                     print("Direct insertion for this database type is not yet implemented.")
                     print("Use 'Generate SQL file' option instead, then execute the file manually.")
                     continue
-                else:
-                    print("Invalid choice. Please enter 1-4.")
+                print(f"Invalid choice. Please enter 1-{len(choices)}.")
             
             # Get connection details for the new database
-            if db_type == 'mssql':
-                while True:
-                    print()
-                    print("SQL Server connection details:")
-                    server_input = input("  Server (default: localhost): ").strip()
-                    db_server = server_input if server_input else 'localhost'
-                    
-                    db_name_input = input("  Database name (default: Chinook_FullRestore): ").strip()
-                    db_name = db_name_input if db_name_input else 'Chinook_FullRestore'
-                    
-                    print()
-                    print("Authentication type:")
-                    print("  1. Windows Authentication")
-                    print("  2. SQL Server Authentication")
-                    while True:
-                        auth_choice = input("  Enter choice (1-2, default: 1): ").strip()
-                        if auth_choice in ['', '1']:
-                            auth_type = 'windows'
-                            username = None
-                            password = None
-                            break
-                        elif auth_choice == '2':
-                            auth_type = 'sql'
-                            username = input("  Username: ").strip()
-                            import getpass
-                            password = getpass.getpass("  Password: ")
-                            break
-                        else:
-                            print("  Invalid choice. Please enter 1 or 2.")
-                    print()
-                    
-                    # Test the connection before proceeding
-                    if test_sqlserver_connection(db_server, db_name, auth_type, username, password):
-                        break
-                    else:
-                        retry = input("Connection failed. Try again? (y/n): ").strip().lower()
-                        if retry not in ['y', 'yes']:
-                            break
+            connection = DIRECT_TARGETS[db_type].prompt()
+            if connection is None:
+                break
     else:
-        # Generate files for each database
-        for db in databases_to_generate:
-            print(f"Creating {db.upper()} format...")
-            
-            # Determine output directory based on database type
-            db_dirs = {
-                'mssql': 'MSSQL',
-                'oracle': 'Oracle',
-                'postgresql': 'PostgreSQL',
-                'mysql': 'MySQL'
-            }
-            output_file = f'{db_dirs[db]}/large_dataset_inserts_{db}.sql'
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                if db == 'mssql':
-                    write_mssql_format(f, artists, albums, tracks, customers, invoices, invoice_lines, systemlog)
-                elif db == 'oracle':
-                    write_oracle_format(f, artists, albums, tracks, customers, invoices, invoice_lines, systemlog)
-                elif db == 'postgresql':
-                    write_postgresql_format(f, artists, albums, tracks, customers, invoices, invoice_lines, systemlog)
-                elif db == 'mysql':
-                    write_mysql_format(f, artists, albums, tracks, customers, invoices, invoice_lines, systemlog)
-            
+        # Generate files for each database - concurrently when there are several
+        # Output directory is determined by the database type
+        databases_to_generate = _format_databases(databases_to_generate, output_format)
+        if not databases_to_generate:
+            return
+        outputs = [(db, _output_path(db, suffix, chunk_bytes, output_format)) for db in databases_to_generate]
+        print(f"Creating {', '.join(db.upper() for db in databases_to_generate)} format...")
+        row_counts = write_sql_files(plan, outputs, workers, compress, chunk_bytes, output_format)
+        
+        for _, output_file in outputs:
             print(f"  ✓ {output_file}")
     
+    if row_counts is not None:
+        print()
+        print(f"✓ Generated {row_counts[CUSTOMER]:,} new customers")
+        print(f"✓ Generated {row_counts[INVOICE]:,} new invoices")
+        print(f"✓ Generated {row_counts[INVOICE_LINE]:,} new invoice lines")
+        print(f"✓ Generated {row_counts[ARTIST]} artists, {row_counts[ALBUM]} albums, {row_counts[TRACK]} tracks")
+        if plan.systemlog:
+            print(f"✓ Generated {row_counts[SYSTEM_LOG]:,} log entries (database adds ~7.8KB padding per row)")
+    
     print()
     print("=" * 80)
     print("Data Generation Summary:")
@@ -1283,757 +4912,14 @@ def main():
     print(f"  - {new_customers:,} realistic customers from diverse cultures")
     print("  - Accurate city/country/state combinations")
     print(f"  - {new_invoices:,} invoices (Jan 1, 2022 - Jan 19, 2026)")
-    print(f"  - {len(invoice_lines):,} invoice line items")
+    if row_counts is not None:
+        print(f"  - {row_counts[INVOICE_LINE]:,} invoice line items")
     print("  - Realistic invoice amounts ($0.99 - $50.00)")
     if insertion_mode == 'file':
         print("  - SQL files generated for: " + ", ".join([d.upper() for d in databases_to_generate]))
     else:
-        print("  - SQL file generated and executed directly to database")
+        print("  - SQL generated and streamed directly to database")
     print("=" * 80)
 
-def write_mssql_format(f, artists, albums, tracks, customers, invoices, invoice_lines, systemlog):
-    """Write data in SQL Server format with batching (max 1000 rows per INSERT)"""
-    batch_size = 1000
-    
-    # Add transaction wrapper for atomicity
-    f.write("-- Begin transaction for bulk insert\n")
-    f.write("PRINT 'Starting data insertion at ' + CONVERT(VARCHAR, GETDATE(), 120);\n")
-    f.write("GO\n\n")
-    
-    f.write("BEGIN TRANSACTION;\n")
-    f.write("GO\n\n")
-    
-    # Artists - has IDENTITY, need to specify IDs explicitly
-    f.write("-- Additional artists (276-355) - Real chart artists\n")
-    f.write("PRINT '[' + CONVERT(VARCHAR, GETDATE(), 120) + '] Inserting artists...';\n")
-    f.write("GO\n")
-    f.write("SET IDENTITY_INSERT [dbo].[Artist] ON;\n")
-    f.write("INSERT INTO [dbo].[Artist] ([ArtistId], [Name]) VALUES\n")
-    # Parse and add explicit ArtistIds
-    artist_lines = []
-    for i, artist in enumerate(artists, start=276):
-        # Remove formatting: "    (N'name')"
-        clean = artist.strip()
-        if clean.startswith("("):
-            clean = clean[1:]
-        if clean.endswith(")"):
-            clean = clean[:-1]
-        artist_lines.append(f"    ({i}, {clean})")
-    f.write(",\n".join(artist_lines))
-    f.write(";\n")
-    f.write("GO\n")
-    f.write("SET IDENTITY_INSERT [dbo].[Artist] OFF;\n")
-    f.write("GO\n\n")
-    
-    # Albums - has IDENTITY, need to specify IDs explicitly with batching
-    f.write("-- Additional albums (348-507) - Real chart albums\n")
-    f.write("PRINT '[' + CONVERT(VARCHAR, GETDATE(), 120) + '] Inserting albums...';\n")
-    f.write("GO\n")
-    
-    # Batch the inserts
-    album_count = len(albums)
-    for batch_num in range(0, album_count, batch_size):
-        batch_end = min(batch_num + batch_size, album_count)
-        
-        f.write("SET IDENTITY_INSERT [dbo].[Album] ON;\n")
-        f.write("INSERT INTO [dbo].[Album] ([AlbumId], [Title], [ArtistId]) VALUES\n")
-        
-        # Write batch items
-        for idx in range(batch_num, batch_end):
-            i = 348 + idx
-            album = albums[idx]
-            clean = album.strip()
-            if clean.startswith("("):
-                clean = clean[1:]
-            if clean.endswith(")"):
-                clean = clean[:-1]
-            parts = clean.rsplit(", ", 1)
-            title_part = parts[0]
-            artist_id = parts[1]
-            
-            if idx < batch_end - 1:
-                f.write(f"    ({i}, {title_part}, {artist_id}),\n")
-            else:
-                f.write(f"    ({i}, {title_part}, {artist_id})\n")
-        
-        f.write(";\n")
-        f.write("SET IDENTITY_INSERT [dbo].[Album] OFF;\n")
-        f.write("GO\n\n")
-    
-    # Tracks - has IDENTITY, need to specify IDs explicitly with batching
-    f.write("-- Additional tracks (3504-3942) - Real chart tracks\n")
-    f.write("PRINT '[' + CONVERT(VARCHAR, GETDATE(), 120) + '] Inserting tracks...';\n")
-    f.write("GO\n")
-    
-    # Batch the inserts
-    track_count = len(tracks)
-    for batch_num in range(0, track_count, batch_size):
-        batch_end = min(batch_num + batch_size, track_count)
-        
-        f.write("SET IDENTITY_INSERT [dbo].[Track] ON;\n")
-        f.write("INSERT INTO [dbo].[Track] ([TrackId], [Name], [AlbumId], [MediaTypeId], [GenreId], [Composer], [Milliseconds], [Bytes], [UnitPrice]) VALUES\n")
-        
-        # Write batch items
-        for idx in range(batch_num, batch_end):
-            i = 3504 + idx
-            track = tracks[idx]
-            clean = track.strip()
-            if clean.startswith("("):
-                clean = clean[1:]
-            if clean.endswith(")"):
-                clean = clean[:-1]
-            quote_end = clean.find("', ")
-            if quote_end > 0:
-                name_part = clean[:quote_end+1]
-                rest = clean[quote_end+2:]
-                
-                if idx < batch_end - 1:
-                    f.write(f"    ({i}, {name_part}, {rest}),\n")
-                else:
-                    f.write(f"    ({i}, {name_part}, {rest})\n")
-        
-        f.write(";\n")
-        f.write("SET IDENTITY_INSERT [dbo].[Track] OFF;\n")
-        f.write("GO\n\n")
-    
-    # Customers - has IDENTITY, need to specify IDs explicitly with batching
-    f.write("-- Additional customers (60-1000+)\n")
-    
-    # Write batches directly without building full list in memory
-    total_batches = (len(customers) + batch_size - 1) // batch_size
-    for batch_num in range(0, len(customers), batch_size):
-        batch_end = min(batch_num + batch_size, len(customers))
-        batch_index = batch_num // batch_size + 1
-        
-        # Add progress message every 10 batches
-        if batch_index % 10 == 1 and total_batches >= 10:
-            f.write(f"PRINT '[' + CONVERT(VARCHAR, GETDATE(), 120) + '] Inserting customers... batch {batch_index} of {total_batches}';\n")
-            f.write("GO\n")
-        
-        f.write("SET IDENTITY_INSERT [dbo].[Customer] ON;\n")
-        f.write("INSERT INTO [dbo].[Customer] ([CustomerId], [FirstName], [LastName], [Company], [Address], [City], [State], [Country], [PostalCode], [Phone], [Fax], [Email], [SupportRepId]) VALUES\n")
-        
-        # Write batch items
-        for idx in range(batch_num, batch_end):
-            i = 60 + idx
-            customer = customers[idx]
-            clean = customer.strip()
-            if clean.startswith("("):
-                clean = clean[1:]
-            if clean.endswith(")"):
-                clean = clean[:-1]
-            
-            if idx < batch_end - 1:
-                f.write(f"    ({i}, {clean}),\n")
-            else:
-                f.write(f"    ({i}, {clean})\n")
-        
-        f.write(";\n")
-        f.write("SET IDENTITY_INSERT [dbo].[Customer] OFF;\n")
-        f.write("GO\n\n")
-    
-    # Invoices - has IDENTITY, need to specify IDs explicitly with batching
-    f.write("-- Additional invoices (413-4000+) - 2022-2026\n")
-    
-    # Write batches directly without building full list in memory
-    total_batches = (len(invoices) + batch_size - 1) // batch_size
-    for batch_num in range(0, len(invoices), batch_size):
-        batch_end = min(batch_num + batch_size, len(invoices))
-        batch_index = batch_num // batch_size + 1
-        
-        # Add progress message every 10 batches
-        if batch_index % 10 == 1 and total_batches >= 10:
-            f.write(f"PRINT '[' + CONVERT(VARCHAR, GETDATE(), 120) + '] Inserting invoices... batch {batch_index} of {total_batches}';\n")
-            f.write("GO\n")
-        
-        f.write("SET IDENTITY_INSERT [dbo].[Invoice] ON;\n")
-        f.write("INSERT INTO [dbo].[Invoice] ([InvoiceId], [CustomerId], [InvoiceDate], [BillingAddress], [BillingCity], [BillingState], [BillingCountry], [BillingPostalCode], [Total]) VALUES\n")
-        
-        # Write batch items
-        for idx in range(batch_num, batch_end):
-            i = 413 + idx
-            invoice = invoices[idx]
-            clean = invoice.strip()
-            if clean.startswith("("):
-                clean = clean[1:]
-            if clean.endswith(")"):
-                clean = clean[:-1]
-            
-            if idx < batch_end - 1:
-                f.write(f"    ({i}, {clean}),\n")
-            else:
-                f.write(f"    ({i}, {clean})\n")
-        
-        f.write(";\n")
-        f.write("SET IDENTITY_INSERT [dbo].[Invoice] OFF;\n")
-        f.write("GO\n\n")
-    
-    # Invoice Lines - has IDENTITY, need to specify IDs explicitly with batching
-    f.write("-- Additional invoice lines (2241+) - Links invoices to tracks\n")
-    
-    # Write batches directly without building full list in memory
-    total_batches = (len(invoice_lines) + batch_size - 1) // batch_size
-    for batch_num in range(0, len(invoice_lines), batch_size):
-        batch_end = min(batch_num + batch_size, len(invoice_lines))
-        batch = invoice_lines[batch_num:batch_end]
-        batch_index = batch_num // batch_size + 1
-        
-        # Add progress message every 10 batches
-        if batch_index % 10 == 1 and total_batches >= 10:
-            f.write(f"PRINT '[' + CONVERT(VARCHAR, GETDATE(), 120) + '] Inserting invoice lines... batch {batch_index} of {total_batches}';\n")
-            f.write("GO\n")
-        
-        f.write("SET IDENTITY_INSERT [dbo].[InvoiceLine] ON;\n")
-        f.write("INSERT INTO [dbo].[InvoiceLine] ([InvoiceLineId], [InvoiceId], [TrackId], [UnitPrice], [Quantity]) VALUES\n")
-        f.write(",\n".join(batch))
-        f.write(";\n")
-        f.write("SET IDENTITY_INSERT [dbo].[InvoiceLine] OFF;\n")
-        f.write("GO\n\n")
-    
-    # SystemLog - optional table for database size inflation
-    if systemlog and len(systemlog) > 0:
-        f.write("-- SystemLog entries for database size inflation\n")
-        f.write("-- Note: Only inserts if SystemLog table exists in the database\n")
-        f.write("-- SQL Server generates ~7.8KB padding per row using REPLICATE() for fast insertion\n")
-        
-        # Write batches directly without building full list in memory
-        total_batches = (len(systemlog) + batch_size - 1) // batch_size
-        for batch_num in range(0, len(systemlog), batch_size):
-            batch_end = min(batch_num + batch_size, len(systemlog))
-            batch_index = batch_num // batch_size + 1
-            
-            # Add progress message (every 5 batches for large datasets, every batch for smaller ones)
-            progress_interval = 5 if total_batches >= 20 else 1
-            if batch_index % progress_interval == 1:
-                f.write(f"PRINT '[' + CONVERT(VARCHAR, GETDATE(), 120) + '] Inserting system log entries... batch {batch_index} of {total_batches}';\n")
-                f.write("GO\n")
-            
-            # Check if table exists before each batch
-            f.write("IF EXISTS (SELECT * FROM sys.tables WHERE name = 'SystemLog')\n")
-            f.write("BEGIN\n")
-            f.write("INSERT INTO [dbo].[SystemLog] ([LogId], [InvoiceId], [LogDate], [LogMessage])\n")
-            f.write("SELECT LogId, InvoiceId, LogDate, LogMessage + ' | ' + REPLICATE('PADDING_', 70000)\n")
-            f.write("FROM (VALUES\n")
-            
-            # Write batch items
-            for idx in range(batch_num, batch_end):
-                log_entry = systemlog[idx]
-                clean = log_entry.strip()
-                if clean.startswith("("):
-                    clean = clean[1:]
-                if clean.endswith(")"):
-                    clean = clean[:-1]
-                
-                if idx < batch_end - 1:
-                    f.write(f"    ({clean}),\n")
-                else:
-                    f.write(f"    ({clean})\n")
-            
-            f.write(") AS LogData(LogId, InvoiceId, LogDate, LogMessage);\n")
-            f.write("END\n")
-            f.write("GO\n\n")
-    
-    # Commit transaction
-    f.write("-- Commit all changes\n")
-    f.write("PRINT '[' + CONVERT(VARCHAR, GETDATE(), 120) + '] Committing transaction...';\n")
-    f.write("GO\n")
-    f.write("COMMIT TRANSACTION;\n")
-    f.write("GO\n\n")
-    
-    f.write("PRINT '[' + CONVERT(VARCHAR, GETDATE(), 120) + '] Data insertion completed successfully!';\n")
-    f.write("GO\n")
-
-def write_oracle_format(f, artists, albums, tracks, customers, invoices, invoice_lines, systemlog):
-    """Write data in Oracle format using INSERT ALL with batching"""
-    import re
-    batch_size = 500  # Oracle INSERT ALL limit
-    
-    # Oracle doesn't auto-commit by default, so no need for SET AUTOCOMMIT
-    f.write("-- Oracle bulk insert\n\n")
-    
-    # Artists
-    f.write("-- Additional artists (276-355) - Real chart artists\n")
-    f.write("INSERT ALL\n")
-    for i, artist in enumerate(artists, start=276):
-        # Artist format is: "    (N'Artist Name')" where quotes are already escaped
-        # Just remove prefix and suffix, keeping the name as-is (already escaped)
-        artist_clean = artist.strip()
-        if artist_clean.startswith("(N'") and artist_clean.endswith("')"):
-            artist_name = artist_clean[3:-2]  # Remove (N' from start and ') from end
-        else:
-            artist_name = artist_clean.replace("    (N'", "").replace("')", "")
-        f.write(f"  INTO Artist (ArtistId, Name) VALUES ({i}, '{artist_name}')\n")
-    f.write("SELECT * FROM dual;\n\n")
-    
-    # Albums - need to parse the format
-    f.write("-- Additional albums (348-507) - Real chart albums\n")
-    f.write("INSERT ALL\n")
-    album_id = 348
-    for album in albums:
-        # Format: "    (N'album_name', artist_id)" where quotes are already escaped
-        # Split on ', ' from the right to get name and artist_id
-        album_clean = album.strip()
-        if album_clean.startswith("(N'"):
-            album_clean = album_clean[3:]  # Remove (N'
-        parts = album_clean.rsplit("', ", 1)
-        album_name = parts[0]  # Already escaped, don't double-escape
-        artist_id = parts[1].replace(")", "")
-        f.write(f"  INTO Album (AlbumId, Title, ArtistId) VALUES ({album_id}, '{album_name}', {artist_id})\n")
-        album_id += 1
-    f.write("SELECT * FROM dual;\n\n")
-    
-    # Tracks
-    f.write("-- Additional tracks (3504-3942) - Real chart tracks\n")
-    track_id = 3504
-    # Oracle has a limit of 1000 rows per INSERT ALL, so batch them
-    batch_size = 500
-    for i in range(0, len(tracks), batch_size):
-        batch = tracks[i:i+batch_size]
-        f.write("INSERT ALL\n")
-        for track in batch:
-            # Format: "    (N'track_name', album_id, media_type, genre_id, NULL, duration, bytes, price)"
-            track_clean = track.strip()
-            if track_clean.startswith("(N'"):
-                track_clean = track_clean[3:]  # Remove (N'
-            parts = track_clean.split("', ", 1)
-            track_name = parts[0]  # Already escaped, don't double-escape
-            rest = parts[1].replace(")", "").split(", ")
-            album_id, media_type, genre_id, composer, duration, file_bytes, price = rest
-            f.write(f"  INTO Track (TrackId, Name, AlbumId, MediaTypeId, GenreId, Composer, Milliseconds, Bytes, UnitPrice) VALUES ({track_id}, '{track_name}', {album_id}, {media_type}, {genre_id}, {composer}, {duration}, {file_bytes}, {price})\n")
-            track_id += 1
-        f.write("SELECT * FROM dual;\n")
-    f.write("\n")
-    
-    # Customers
-    f.write("-- Additional customers (60-1000)\n")
-    customer_id = 60
-    for i in range(0, len(customers), batch_size):
-        batch = customers[i:i+batch_size]
-        f.write("INSERT ALL\n")
-        for customer in batch:
-            # Parse customer fields
-            parts = customer.strip().replace("    (N'", "").split("', N'")
-            first_name = parts[0].replace("'", "''")
-            last_name = parts[1].replace("'", "''")
-            rest_parts = "', N'".join(parts[2:])
-            # This is complex - easier to reconstruct
-            customer_clean = customer.replace("N'", "'").replace("    (", "").replace(")", "")
-            fields = []
-            in_quote = False
-            current = ""
-            for char in customer_clean:
-                if char == "'" and (not current or current[-1] != "\\"):
-                    in_quote = not in_quote
-                    current += char
-                elif char == "," and not in_quote:
-                    fields.append(current.strip().strip("'"))
-                    current = ""
-                else:
-                    current += char
-            if current:
-                fields.append(current.strip().strip("'"))
-            
-            fn, ln, co, ad, ci, st, cty, pc, ph, fx, em, sr = fields
-            fn = fn.replace("'", "''")
-            ln = ln.replace("'", "''")
-            co = co if co != 'NULL' else 'NULL'
-            ad = ad.replace("'", "''")
-            ci = ci.replace("'", "''")
-            st = st if st == 'NULL' else f"'{st}'"
-            cty = cty.replace("'", "''")
-            pc = pc.replace("'", "''")
-            ph = ph.replace("'", "''")
-            em = em.replace("'", "''")
-            
-            co_val = 'NULL' if co == 'NULL' else f"'{co.replace(chr(39), chr(39)+chr(39))}'"
-            st_val = 'NULL' if st == 'NULL' else st
-            
-            f.write(f"  INTO Customer (CustomerId, FirstName, LastName, Company, Address, City, State, Country, PostalCode, Phone, Fax, Email, SupportRepId) VALUES ({customer_id}, '{fn}', '{ln}', {co_val}, '{ad}', '{ci}', {st_val}, '{cty}', '{pc}', '{ph}', NULL, '{em}', {sr})\n")
-            customer_id += 1
-        f.write("SELECT * FROM dual;\n")
-    f.write("\n")
-    
-    # Invoices
-    f.write("-- Additional invoices (413-4000+) - 2022-2026\n")
-    oracle_invoices = []
-    for inv in invoices:
-        # Convert from SQL Server format to Oracle format
-        # Original: (customer_id, 'YYYY/MM/DD', N'address', N'city', N'state' or NULL, N'country', N'postal', total)
-        # Need to wrap date with TO_DATE() and remove N' prefix
-        inv_clean = inv.replace("    (", "").replace(")", "").strip()
-        
-        # Match pattern: number, 'date', then rest
-        match = re.match(r"(\d+),\s*'([^']+)',\s*(.+)", inv_clean)
-        if match:
-            customer_id = match.group(1)
-            invoice_date = match.group(2)
-            rest = match.group(3)
-            
-            # Remove N' prefix from all strings
-            rest = rest.replace("N'", "'")
-            
-            # Rebuild the invoice with TO_DATE
-            oracle_inv = f"  INTO Invoice (InvoiceId, CustomerId, InvoiceDate, BillingAddress, BillingCity, BillingState, BillingCountry, BillingPostalCode, Total) VALUES ({len(oracle_invoices) + 413}, {customer_id}, TO_DATE('{invoice_date}', 'YYYY/MM/DD'), {rest})"
-            oracle_invoices.append(oracle_inv)
-    
-    # Write in batches
-    for i in range(0, len(oracle_invoices), batch_size):
-        batch = oracle_invoices[i:i+batch_size]
-        f.write("INSERT ALL\n")
-        f.write("\n".join(batch))
-        f.write("\nSELECT * FROM dual;\n")
-    f.write("\n")
-    
-    # Invoice Lines
-    f.write("-- Additional invoice lines (2241+) - Links invoices to tracks\n")
-    oracle_invoice_lines = []
-    for line in invoice_lines:
-        # Convert from: "    (invoice_line_id, invoice_id, track_id, unit_price, quantity)"
-        # Remove spaces, then remove both ( and )
-        line_clean = line.strip().lstrip("(").rstrip(")")
-        oracle_line = f"  INTO InvoiceLine (InvoiceLineId, InvoiceId, TrackId, UnitPrice, Quantity) VALUES ({line_clean})"
-        oracle_invoice_lines.append(oracle_line)
-    
-    # Write in batches
-    for i in range(0, len(oracle_invoice_lines), batch_size):
-        batch = oracle_invoice_lines[i:i+batch_size]
-        f.write("INSERT ALL\n")
-        f.write("\n".join(batch))
-        f.write("\nSELECT * FROM dual;\n")
-    f.write("\n")
-    
-    # SystemLog - optional table for database size inflation
-    if systemlog and len(systemlog) > 0:
-        f.write("-- SystemLog entries for database size inflation\n")
-        f.write("-- Oracle generates ~3.5KB padding per row using RPAD() (PL/SQL limit: 32000 chars)\n\n")
-        
-        # Process in batches (Oracle INSERT ALL has 1000 row limit, use 500 to be safe)
-        total_batches = (len(systemlog) + batch_size - 1) // batch_size
-        for batch_num in range(0, len(systemlog), batch_size):
-            batch_end = min(batch_num + batch_size, len(systemlog))
-            
-            # Write batch using INSERT ALL
-            f.write("INSERT ALL\n")
-            for idx in range(batch_num, batch_end):
-                log_entry = systemlog[idx]
-                # Convert from (log_id, invoice_id, 'YYYY/MM/DD', N'message')
-                log_clean = log_entry.strip()
-                if log_clean.startswith("("):
-                    log_clean = log_clean[1:]
-                if log_clean.endswith(")"):
-                    log_clean = log_clean[:-1]
-                
-                # Parse the fields
-                parts = log_clean.split(", ", 3)
-                invoice_id = parts[1]
-                log_date = parts[2].strip("'")
-                log_msg = parts[3].replace("N'", "'")
-                
-                # Start LogId from 1000 to avoid conflicts with existing data
-                new_log_id = 1000 + idx
-                
-                # Insert with explicit LogId starting from 1000
-                # Oracle TO_DATE format: YYYY-MM-DD HH24:MI:SS
-                f.write(f"  INTO SYSTEMLOG (LogId, InvoiceId, LogDate, LogMessage) VALUES ({new_log_id}, {invoice_id}, TO_DATE('{log_date}', 'YYYY-MM-DD HH24:MI:SS'), {log_msg})\n")
-            
-            f.write("SELECT * FROM dual;\n\n")
-        
-        # After all inserts, pad the log messages using UPDATE
-        # Oracle PL/SQL RPAD max is 32767 chars (about 32KB) which gives ~3.5KB per row with overhead
-        f.write("-- Pad log messages for database size inflation (Oracle PL/SQL limit: 32000 chars)\n")
-        f.write("UPDATE SYSTEMLOG\n")
-        f.write("SET LogMessage = LogMessage || ' | ' || RPAD('PADDING_', 32000, 'PADDING_')\n")
-        f.write("WHERE LogId > (SELECT NVL(MAX(LogId), 0) FROM SYSTEMLOG WHERE LogMessage NOT LIKE '%PADDING_%');\n\n")
-    
-    # Commit transaction
-    f.write("-- Commit transaction\n")
-    f.write("COMMIT;\n")
-
-def write_postgresql_format(f, artists, albums, tracks, customers, invoices, invoice_lines, systemlog):
-    """Write data in PostgreSQL format (lowercase, no brackets) with batching"""
-    import re
-    batch_size = 1000
-    
-    # Add transaction for better performance
-    f.write("-- Begin transaction for bulk insert\n")
-    f.write("BEGIN;\n\n")
-    
-    # Artists
-    f.write("-- Additional artists (276-355) - Real chart artists\n")
-    postgres_artists = [a.replace("    (N'", "    ('") for a in artists]
-    f.write("INSERT INTO artist (name) VALUES\n")
-    f.write(",\n".join(postgres_artists))
-    f.write(";\n\n")
-    
-    # Albums
-    f.write("-- Additional albums (348-507) - Real chart albums\n")
-    postgres_albums = [a.replace("    (N'", "    ('") for a in albums]
-    f.write("INSERT INTO album (title, artist_id) VALUES\n")
-    f.write(",\n".join(postgres_albums))
-    f.write(";\n\n")
-    
-    # Tracks
-    f.write("-- Additional tracks (3504-3942) - Real chart tracks\n")
-    postgres_tracks = [t.replace("    (N'", "    ('") for t in tracks]
-    f.write("INSERT INTO track (name, album_id, media_type_id, genre_id, composer, milliseconds, bytes, unit_price) VALUES\n")
-    f.write(",\n".join(postgres_tracks))
-    f.write(";\n\n")
-    
-    # Customers - with batching for large datasets
-    f.write("-- Additional customers (60-1000+)\n")
-    postgres_customers = [c.replace("    (N'", "    ('") for c in customers]
-    total_batches = (len(postgres_customers) + batch_size - 1) // batch_size
-    for batch_num in range(0, len(postgres_customers), batch_size):
-        batch = postgres_customers[batch_num:batch_num+batch_size]
-        batch_index = batch_num // batch_size + 1
-        
-        # Add progress message every 10 batches (or batch 1 for smaller datasets)
-        if (batch_index % 10 == 1 and total_batches >= 10) or (batch_index == 1 and total_batches < 10):
-            f.write(f"DO $$ BEGIN RAISE NOTICE '[%] Inserting customers... batch % of %', NOW(), {batch_index}, {total_batches}; END $$;\n")
-        
-        f.write("INSERT INTO customer (first_name, last_name, company, address, city, state, country, postal_code, phone, fax, email, support_rep_id) VALUES\n")
-        f.write(",\n".join(batch))
-        f.write(";\n\n")
-    
-    # Invoices - with batching for large datasets
-    f.write("-- Additional invoices (413-4000+) - 2022-2026\n")
-    postgres_invoices = []
-    for inv in invoices:
-        # Replace date format YYYY/MM/DD with YYYY-MM-DD for PostgreSQL
-        inv = inv.replace("    (", "    (").replace(", '", ", TIMESTAMP '").replace("'", "'", 1)
-        inv = inv.replace("N'", "'")
-        # Convert YYYY/MM/DD to YYYY-MM-DD
-        inv = re.sub(r"TIMESTAMP '(\d{4})/(\d{2})/(\d{2})", r"TIMESTAMP '\1-\2-\3", inv)
-        postgres_invoices.append(inv)
-    
-    total_batches = (len(postgres_invoices) + batch_size - 1) // batch_size
-    for batch_num in range(0, len(postgres_invoices), batch_size):
-        batch = postgres_invoices[batch_num:batch_num+batch_size]
-        batch_index = batch_num // batch_size + 1
-        
-        # Add progress message every 10 batches (or batch 1 for smaller datasets)
-        if (batch_index % 10 == 1 and total_batches >= 10) or (batch_index == 1 and total_batches < 10):
-            f.write(f"DO $$ BEGIN RAISE NOTICE '[%] Inserting invoices... batch % of %', NOW(), {batch_index}, {total_batches}; END $$;\n")
-        
-        f.write("INSERT INTO invoice (customer_id, invoice_date, billing_address, billing_city, billing_state, billing_country, billing_postal_code, total) VALUES\n")
-        f.write(",\n".join(batch))
-        f.write(";\n\n")
-    
-    # Invoice Lines - with batching for large datasets
-    f.write("-- Additional invoice lines (2241+) - Links invoices to tracks\n")
-    postgres_invoice_lines = [il.replace("    (", "    (") for il in invoice_lines]
-    total_batches = (len(postgres_invoice_lines) + batch_size - 1) // batch_size
-    for batch_num in range(0, len(postgres_invoice_lines), batch_size):
-        batch = postgres_invoice_lines[batch_num:batch_num+batch_size]
-        batch_index = batch_num // batch_size + 1
-        
-        # Add progress message every 10 batches (or batch 1 for smaller datasets)
-        if (batch_index % 10 == 1 and total_batches >= 10) or (batch_index == 1 and total_batches < 10):
-            f.write(f"DO $$ BEGIN RAISE NOTICE '[%] Inserting invoice lines... batch % of %', NOW(), {batch_index}, {total_batches}; END $$;\n")
-        
-        f.write("INSERT INTO invoice_line (invoice_line_id, invoice_id, track_id, unit_price, quantity) OVERRIDING SYSTEM VALUE VALUES\n")
-        f.write(",\n".join(batch))
-        f.write(";\n\n")
-    
-    # SystemLog - optional table for database size inflation
-    if systemlog and len(systemlog) > 0:
-        f.write("-- SystemLog entries for database size inflation\n")
-        f.write("-- Note: Only inserts if system_log table exists in the database\n")
-        f.write("-- PostgreSQL generates ~7.8KB padding per row using REPEAT() for fast insertion\n\n")
-        
-        # Process in batches - each batch in its own DO block so RAISE NOTICE displays immediately
-        total_batches = (len(systemlog) + batch_size - 1) // batch_size
-        for batch_num in range(0, len(systemlog), batch_size):
-            batch_end = min(batch_num + batch_size, len(systemlog))
-            batch_index = batch_num // batch_size + 1
-            
-            # PostgreSQL doesn't have PRINT, but we can use RAISE NOTICE
-            # Put each batch in its own DO block so notices display immediately
-            progress_interval = 5 if total_batches >= 20 else 1
-            if batch_index % progress_interval == 1:
-                f.write(f"DO $$ BEGIN RAISE NOTICE '[%] Inserting system log entries... batch % of %', NOW(), {batch_index}, {total_batches}; END $$;\n")
-            
-            # Write batch - each in its own DO block with table existence check
-            f.write("DO $$\n")
-            f.write("BEGIN\n")
-            f.write("  IF EXISTS (SELECT FROM information_schema.tables WHERE table_name = 'system_log') THEN\n")
-            
-            # Build the batch
-            postgres_systemlog = []
-            for idx in range(batch_num, batch_end):
-                log_entry = systemlog[idx]
-                # Convert from (log_id, invoice_id, 'YYYY/MM/DD', N'message')
-                # to PostgreSQL format with TIMESTAMP and single quotes
-                log_clean = log_entry.strip()
-                if log_clean.startswith("("):
-                    log_clean = log_clean[1:]
-                if log_clean.endswith(")"):
-                    log_clean = log_clean[:-1]
-                
-                # Parse the fields
-                parts = log_clean.split(", ", 3)
-                log_id = parts[0]
-                invoice_id = parts[1]
-                log_date = parts[2].strip("'")
-                log_msg = parts[3].replace("N'", "'")
-                
-                # Convert YYYY/MM/DD to YYYY-MM-DD
-                log_date = log_date.replace("/", "-")
-                
-                postgres_systemlog.append(f"    ({log_id}, {invoice_id}, TIMESTAMP '{log_date}', {log_msg})")
-            
-            f.write("    INSERT INTO system_log (log_id, invoice_id, log_date, log_message) OVERRIDING SYSTEM VALUE\n")
-            f.write("    SELECT log_id, invoice_id, log_date, log_message || ' | ' || REPEAT('PADDING_', 70000)\n")
-            f.write("    FROM (VALUES\n")
-            f.write(",\n".join(postgres_systemlog))
-            f.write("\n    ) AS log_data(log_id, invoice_id, log_date, log_message);\n")
-            f.write("  END IF;\n")
-            f.write("END $$;\n\n")
-    
-    # Commit transaction
-    f.write("-- Commit transaction\n")
-    f.write("DO $$ BEGIN RAISE NOTICE '[%] Committing transaction...', NOW(); END $$;\n")
-    f.write("COMMIT;\n")
-    f.write("DO $$ BEGIN RAISE NOTICE '[%] Data insertion completed successfully!', NOW(); END $$;\n")
-
-def write_mysql_format(f, artists, albums, tracks, customers, invoices, invoice_lines, systemlog):
-    """Write data in MySQL format (backticks, single quotes) with batching"""
-    import re
-    batch_size = 1000
-    
-    # Add transaction for better performance
-    f.write("-- Begin transaction for bulk insert\n")
-    f.write("START TRANSACTION;\n\n")
-    
-    # Artists
-    f.write("-- Additional artists (276-355) - Real chart artists\n")
-    mysql_artists = [a.replace("N'", "'") for a in artists]
-    f.write("INSERT INTO `Artist` (`Name`) VALUES\n")
-    f.write(",\n".join(mysql_artists))
-    f.write(";\n\n")
-    
-    # Albums
-    f.write("-- Additional albums (348-507) - Real chart albums\n")
-    mysql_albums = [a.replace("N'", "'") for a in albums]
-    f.write("INSERT INTO `Album` (`Title`, `ArtistId`) VALUES\n")
-    f.write(",\n".join(mysql_albums))
-    f.write(";\n\n")
-    
-    # Tracks\n    f.write("-- Additional tracks (3504-3942) - Real chart tracks\n")
-    mysql_tracks = [t.replace("N'", "'") for t in tracks]
-    f.write("INSERT INTO `Track` (`Name`, `AlbumId`, `MediaTypeId`, `GenreId`, `Composer`, `Milliseconds`, `Bytes`, `UnitPrice`) VALUES\n")
-    f.write(",\n".join(mysql_tracks))
-    f.write(";\n\n")
-    
-    # Customers - with batching for large datasets
-    f.write("-- Additional customers (60-1000+)\n")
-    mysql_customers = [c.replace("N'", "'") for c in customers]
-    total_batches = (len(mysql_customers) + batch_size - 1) // batch_size
-    for batch_num in range(0, len(mysql_customers), batch_size):
-        batch = mysql_customers[batch_num:batch_num+batch_size]
-        batch_index = batch_num // batch_size + 1
-        
-        # Add progress message every 10 batches (or batch 1 for smaller datasets)
-        if (batch_index % 10 == 1 and total_batches >= 10) or (batch_index == 1 and total_batches < 10):
-            f.write(f"SELECT CONCAT('[', NOW(), '] Inserting customers... batch {batch_index} of {total_batches}') AS Progress;\n")
-        
-        f.write("INSERT INTO `Customer` (`FirstName`, `LastName`, `Company`, `Address`, `City`, `State`, `Country`, `PostalCode`, `Phone`, `Fax`, `Email`, `SupportRepId`) VALUES\n")
-        f.write(",\n".join(batch))
-        f.write(";\n\n")
-    
-    # Invoices - with batching for large datasets
-    f.write("-- Additional invoices (413-4000+) - 2022-2026\n")
-    mysql_invoices = []
-    for inv in invoices:
-        # Convert YYYY/MM/DD to YYYY-MM-DD for MySQL
-        inv_converted = inv.replace("    (", "    (").replace("N'", "'")
-        # Replace date format
-        inv_converted = re.sub(r"(\d{4})/(\d{2})/(\d{2})", r"\1-\2-\3", inv_converted)
-        mysql_invoices.append(inv_converted)
-    
-    total_batches = (len(mysql_invoices) + batch_size - 1) // batch_size
-    for batch_num in range(0, len(mysql_invoices), batch_size):
-        batch = mysql_invoices[batch_num:batch_num+batch_size]
-        batch_index = batch_num // batch_size + 1
-        
-        # Add progress message every 10 batches (or batch 1 for smaller datasets)
-        if (batch_index % 10 == 1 and total_batches >= 10) or (batch_index == 1 and total_batches < 10):
-            f.write(f"SELECT CONCAT('[', NOW(), '] Inserting invoices... batch {batch_index} of {total_batches}') AS Progress;\n")
-        
-        f.write("INSERT INTO `Invoice` (`CustomerId`, `InvoiceDate`, `BillingAddress`, `BillingCity`, `BillingState`, `BillingCountry`, `BillingPostalCode`, `Total`) VALUES\n")
-        f.write(",\n".join(batch))
-        f.write(";\n\n")
-    
-    # Invoice Lines - with batching for large datasets
-    f.write("-- Additional invoice lines (2241+) - Links invoices to tracks\n")
-    mysql_invoice_lines = [il.replace("    (", "    (") for il in invoice_lines]
-    total_batches = (len(mysql_invoice_lines) + batch_size - 1) // batch_size
-    for batch_num in range(0, len(mysql_invoice_lines), batch_size):
-        batch = mysql_invoice_lines[batch_num:batch_num+batch_size]
-        batch_index = batch_num // batch_size + 1
-        
-        # Add progress message every 10 batches (or batch 1 for smaller datasets)
-        if (batch_index % 10 == 1 and total_batches >= 10) or (batch_index == 1 and total_batches < 10):
-            f.write(f"SELECT CONCAT('[', NOW(), '] Inserting invoice lines... batch {batch_index} of {total_batches}') AS Progress;\n")
-        
-        f.write("INSERT INTO `InvoiceLine` (`InvoiceLineId`, `InvoiceId`, `TrackId`, `UnitPrice`, `Quantity`) VALUES\n")
-        f.write(",\n".join(batch))
-        f.write(";\n\n")
-    
-    # SystemLog - optional table for database size inflation
-    if systemlog and len(systemlog) > 0:
-        f.write("-- SystemLog entries for database size inflation\n")
-        f.write("-- Note: Only inserts if SystemLog table exists in the database\n")
-        f.write("-- MySQL generates ~7.8KB padding per row using REPEAT() for fast insertion\n\n")
-        
-        # Process in batches - simpler approach without prepared statements
-        total_batches = (len(systemlog) + batch_size - 1) // batch_size
-        for batch_num in range(0, len(systemlog), batch_size):
-            batch_end = min(batch_num + batch_size, len(systemlog))
-            batch_index = batch_num // batch_size + 1
-            
-            # Add progress message (every 5 batches for large datasets, every batch for smaller ones)
-            progress_interval = 5 if total_batches >= 20 else 1
-            if batch_index % progress_interval == 1:
-                f.write(f"SELECT CONCAT('[', NOW(), '] Inserting system log entries... batch {batch_index} of {total_batches}') AS Progress;\n")
-            
-            f.write(f"-- Batch {batch_index} of {total_batches}\n")
-            f.write("INSERT INTO `SystemLog` (`InvoiceId`, `LogDate`, `LogMessage`)\n")
-            f.write("VALUES\n")
-            
-            # Build the VALUES list
-            for idx in range(batch_num, batch_end):
-                log_entry = systemlog[idx]
-                # Convert from (log_id, invoice_id, 'YYYY/MM/DD', N'message')
-                # MySQL doesn't use explicit log_id (AUTO_INCREMENT handles it)
-                log_clean = log_entry.strip()
-                if log_clean.startswith("("):
-                    log_clean = log_clean[1:]
-                if log_clean.endswith(")"):
-                    log_clean = log_clean[:-1]
-                
-                # Parse the fields
-                parts = log_clean.split(", ", 3)
-                # Skip log_id (parts[0]) since it's AUTO_INCREMENT
-                invoice_id = parts[1]
-                log_date = parts[2].strip("'")  # Remove quotes
-                # Convert YYYY/MM/DD to YYYY-MM-DD for MySQL
-                log_date = log_date.replace("/", "-")
-                log_msg = parts[3].replace("N'", "'")  # Just replace N' with ' - quotes are already properly escaped
-                
-                # Build the value with CONCAT for padding
-                if idx < batch_end - 1:
-                    f.write(f"    ({invoice_id}, '{log_date}', CONCAT({log_msg}, ' | ', REPEAT('PADDING_', 70000))),\n")
-                else:
-                    f.write(f"    ({invoice_id}, '{log_date}', CONCAT({log_msg}, ' | ', REPEAT('PADDING_', 70000)))\n")
-            
-            f.write(";\n\n")
-    
-    # Commit transaction
-    f.write("-- Commit transaction\n")
-    f.write("SELECT CONCAT('[', NOW(), '] Committing transaction...') AS Progress;\n")
-    f.write("COMMIT;\n")
-    f.write("SELECT CONCAT('[', NOW(), '] Data insertion completed successfully!') AS Progress;\n")
-
 if __name__ == "__main__":
     main()
@@ -0,0 +1,213 @@
+-- /*******************************************************************************
+--   Chinook Database
+--   Description: Creates the Chinook tables.
+--   DB Server: SQLite 3
+--   Original Author: Luis Rocha (Evolved by Chris Hawkins at Redgate Software Ltd)
+--   License: https://github.com/lerocha/chinook-database/blob/master/LICENSE.md
+
+--   Version: 1.0.0
+--   Last Updated: 2026-10-16
+--   Update Notes: Initial SQLite schema matching the MySQL 8 and PostgreSQL tables
+-- ********************************************************************************/
+
+-- Usage: sqlite3 chinook.db < Database_Creation-Chinook_SQLite-SchemaOnly.sql
+-- Foreign keys are declared but only enforced with PRAGMA foreign_keys = ON.
+
+/*******************************************************************************
+   Create Tables
+********************************************************************************/
+CREATE TABLE IF NOT EXISTS [Album]
+(
+    [AlbumId] INTEGER NOT NULL,
+    [Title] NVARCHAR(160) NOT NULL,
+    [ArtistId] INTEGER NOT NULL,
+    CONSTRAINT [PK_Album] PRIMARY KEY ([AlbumId]),
+    CONSTRAINT [FK_AlbumArtistId] FOREIGN KEY ([ArtistId]) REFERENCES [Artist] ([ArtistId])
+        ON DELETE NO ACTION ON UPDATE NO ACTION
+);
+
+CREATE TABLE IF NOT EXISTS [Artist]
+(
+    [ArtistId] INTEGER NOT NULL,
+    [Name] NVARCHAR(120),
+    CONSTRAINT [PK_Artist] PRIMARY KEY ([ArtistId])
+);
+
+CREATE TABLE IF NOT EXISTS [Customer]
+(
+    [CustomerId] INTEGER NOT NULL,
+    [FirstName] NVARCHAR(40) NOT NULL,
+    [LastName] NVARCHAR(20) NOT NULL,
+    [Company] NVARCHAR(80),
+    [Address] NVARCHAR(70),
+    [City] NVARCHAR(40),
+    [State] NVARCHAR(40),
+    [Country] NVARCHAR(40),
+    [PostalCode] NVARCHAR(10),
+    [Phone] NVARCHAR(24),
+    [Fax] NVARCHAR(24),
+    [Email] NVARCHAR(60) NOT NULL,
+    [SupportRepId] INTEGER,
+    CONSTRAINT [PK_Customer] PRIMARY KEY ([CustomerId]),
+    CONSTRAINT [FK_CustomerSupportRepId] FOREIGN KEY ([SupportRepId]) REFERENCES [Employee] ([EmployeeId])
+        ON DELETE NO ACTION ON UPDATE NO ACTION
+);
+
+CREATE TABLE IF NOT EXISTS [Employee]
+(
+    [EmployeeId] INTEGER NOT NULL,
+    [LastName] NVARCHAR(20) NOT NULL,
+    [FirstName] NVARCHAR(20) NOT NULL,
+    [Title] NVARCHAR(30),
+    [ReportsTo] INTEGER,
+    [BirthDate] DATETIME,
+    [HireDate] DATETIME,
+    [Address] NVARCHAR(70),
+    [City] NVARCHAR(40),
+    [State] NVARCHAR(40),
+    [Country] NVARCHAR(40),
+    [PostalCode] NVARCHAR(10),
+    [Phone] NVARCHAR(24),
+    [Fax] NVARCHAR(24),
+    [Email] NVARCHAR(60),
+    CONSTRAINT [PK_Employee] PRIMARY KEY ([EmployeeId]),
+    CONSTRAINT [FK_EmployeeReportsTo] FOREIGN KEY ([ReportsTo]) REFERENCES [Employee] ([EmployeeId])
+        ON DELETE NO ACTION ON UPDATE NO ACTION
+);
+
+CREATE TABLE IF NOT EXISTS [Genre]
+(
+    [GenreId] INTEGER NOT NULL,
+    [Name] NVARCHAR(120),
+    CONSTRAINT [PK_Genre] PRIMARY KEY ([GenreId])
+);
+
+CREATE TABLE IF NOT EXISTS [Invoice]
+(
+    [InvoiceId] INTEGER NOT NULL,
+    [CustomerId] INTEGER NOT NULL,
+    [InvoiceDate] DATETIME NOT NULL,
+    [BillingAddress] NVARCHAR(70),
+    [BillingCity] NVARCHAR(40),
+    [BillingState] NVARCHAR(40),
+    [BillingCountry] NVARCHAR(40),
+    [BillingPostalCode] NVARCHAR(10),
+    [Total] NUMERIC(10,2) NOT NULL,
+    CONSTRAINT [PK_Invoice] PRIMARY KEY ([InvoiceId]),
+    CONSTRAINT [FK_InvoiceCustomerId] FOREIGN KEY ([CustomerId]) REFERENCES [Customer] ([CustomerId])
+        ON DELETE NO ACTION ON UPDATE NO ACTION
+);
+
+CREATE TABLE IF NOT EXISTS [InvoiceLine]
+(
+    [InvoiceLineId] INTEGER NOT NULL,
+    [InvoiceId] INTEGER NOT NULL,
+    [TrackId] INTEGER NOT NULL,
+    [UnitPrice] NUMERIC(10,2) NOT NULL,
+    [Quantity] INTEGER NOT NULL,
+    CONSTRAINT [PK_InvoiceLine] PRIMARY KEY ([InvoiceLineId]),
+    CONSTRAINT [FK_InvoiceLineInvoiceId] FOREIGN KEY ([InvoiceId]) REFERENCES [Invoice] ([InvoiceId])
+        ON DELETE NO ACTION ON UPDATE NO ACTION,
+    CONSTRAINT [FK_InvoiceLineTrackId] FOREIGN KEY ([TrackId]) REFERENCES [Track] ([TrackId])
+        ON DELETE NO ACTION ON UPDATE NO ACTION
+);
+
+CREATE TABLE IF NOT EXISTS [MediaType]
+(
+    [MediaTypeId] INTEGER NOT NULL,
+    [Name] NVARCHAR(120),
+    CONSTRAINT [PK_MediaType] PRIMARY KEY ([MediaTypeId])
+);
+
+CREATE TABLE IF NOT EXISTS [Playlist]
+(
+    [PlaylistId] INTEGER NOT NULL,
+    [Name] NVARCHAR(120),
+    CONSTRAINT [PK_Playlist] PRIMARY KEY ([PlaylistId])
+);
+
+CREATE TABLE IF NOT EXISTS [PlaylistTrack]
+(
+    [PlaylistId] INTEGER NOT NULL,
+    [TrackId] INTEGER NOT NULL,
+    CONSTRAINT [PK_PlaylistTrack] PRIMARY KEY ([PlaylistId], [TrackId]),
+    CONSTRAINT [FK_PlaylistTrackPlaylistId] FOREIGN KEY ([PlaylistId]) REFERENCES [Playlist] ([PlaylistId])
+        ON DELETE NO ACTION ON UPDATE NO ACTION,
+    CONSTRAINT [FK_PlaylistTrackTrackId] FOREIGN KEY ([TrackId]) REFERENCES [Track] ([TrackId])
+        ON DELETE NO ACTION ON UPDATE NO ACTION
+);
+
+CREATE TABLE IF NOT EXISTS [Track]
+(
+    [TrackId] INTEGER NOT NULL,
+    [Name] NVARCHAR(200) NOT NULL,
+    [AlbumId] INTEGER,
+    [MediaTypeId] INTEGER NOT NULL,
+    [GenreId] INTEGER,
+    [Composer] NVARCHAR(220),
+    [Milliseconds] INTEGER NOT NULL,
+    [Bytes] INTEGER,
+    [UnitPrice] NUMERIC(10,2) NOT NULL,
+    CONSTRAINT [PK_Track] PRIMARY KEY ([TrackId]),
+    CONSTRAINT [FK_TrackAlbumId] FOREIGN KEY ([AlbumId]) REFERENCES [Album] ([AlbumId])
+        ON DELETE NO ACTION ON UPDATE NO ACTION,
+    CONSTRAINT [FK_TrackGenreId] FOREIGN KEY ([GenreId]) REFERENCES [Genre] ([GenreId])
+        ON DELETE NO ACTION ON UPDATE NO ACTION,
+    CONSTRAINT [FK_TrackMediaTypeId] FOREIGN KEY ([MediaTypeId]) REFERENCES [MediaType] ([MediaTypeId])
+        ON DELETE NO ACTION ON UPDATE NO ACTION
+);
+
+CREATE TABLE IF NOT EXISTS [TrackReview]
+(
+    [ReviewId] INTEGER NOT NULL,
+    [TrackId] INTEGER NOT NULL,
+    [ReviewerName] NVARCHAR(100) NOT NULL,
+    [Rating] INTEGER,
+    [ReviewText] NVARCHAR(1000),
+    [ReviewDate] DATE NOT NULL,
+    CONSTRAINT [PK_TrackReview] PRIMARY KEY ([ReviewId]),
+    CONSTRAINT [CK_TrackReview_Rating] CHECK ([Rating] BETWEEN 1 AND 5)
+);
+
+CREATE TABLE IF NOT EXISTS [AppConfig]
+(
+    [ConfigId] INTEGER NOT NULL,
+    [ConfigKey] NVARCHAR(50) NOT NULL,
+    [ConfigValue] NVARCHAR(200) NOT NULL,
+    CONSTRAINT [PK_AppConfig] PRIMARY KEY ([ConfigId])
+);
+
+CREATE TABLE IF NOT EXISTS [SystemLog]
+(
+    [LogId] INTEGER NOT NULL,
+    [InvoiceId] INTEGER NOT NULL,
+    [LogDate] DATETIME NOT NULL,
+    [LogMessage] TEXT,
+    CONSTRAINT [PK_SystemLog] PRIMARY KEY ([LogId]),
+    CONSTRAINT [fk_SystemLog_Invoice] FOREIGN KEY ([InvoiceId]) REFERENCES [Invoice] ([InvoiceId])
+);
+
+/*******************************************************************************
+   Create Foreign Key Indexes
+********************************************************************************/
+CREATE INDEX IF NOT EXISTS [IFK_AlbumArtistId] ON [Album] ([ArtistId]);
+
+CREATE INDEX IF NOT EXISTS [IFK_CustomerSupportRepId] ON [Customer] ([SupportRepId]);
+
+CREATE INDEX IF NOT EXISTS [IFK_EmployeeReportsTo] ON [Employee] ([ReportsTo]);
+
+CREATE INDEX IF NOT EXISTS [IFK_InvoiceCustomerId] ON [Invoice] ([CustomerId]);
+
+CREATE INDEX IF NOT EXISTS [IFK_InvoiceLineInvoiceId] ON [InvoiceLine] ([InvoiceId]);
+
+CREATE INDEX IF NOT EXISTS [IFK_InvoiceLineTrackId] ON [InvoiceLine] ([TrackId]);
+
+CREATE INDEX IF NOT EXISTS [IFK_PlaylistTrackPlaylistId] ON [PlaylistTrack] ([PlaylistId]);
+
+CREATE INDEX IF NOT EXISTS [IFK_PlaylistTrackTrackId] ON [PlaylistTrack] ([TrackId]);
+
+CREATE INDEX IF NOT EXISTS [IFK_TrackAlbumId] ON [Track] ([AlbumId]);
+
+CREATE INDEX IF NOT EXISTS [IFK_TrackGenreId] ON [Track] ([GenreId]);
+
+CREATE INDEX IF NOT EXISTS [IFK_TrackMediaTypeId] ON [Track] ([MediaTypeId]);
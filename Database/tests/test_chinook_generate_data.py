@@ -0,0 +1,727 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Chinook_GenerateData as g
+
+SMALL_PLAN = g.DatasetPlan(customers=100, invoices=200, systemlog=10, seed=7)
+
+
+@pytest.mark.parametrize('db_type', list(g.DIALECTS))
+def test_chunked_output_with_system_log(tmp_path, db_type):
+    directory = tmp_path / db_type
+    row_counts = g.write_sql_files(SMALL_PLAN, [(db_type, str(directory))], chunk_bytes=1 << 20)
+
+    assert row_counts[g.SYSTEM_LOG] == 10
+    with open(directory / g.MANIFEST_FILE, encoding='utf-8') as f:
+        manifest = json.load(f)
+    assert manifest['tables']['SystemLog'] == 10
+    assert [chunk for chunk in manifest['chunks'] if chunk['table'] == 'SystemLog']
+
+
+class _Connection:
+    """Stands in for a DB-API connection and cursor: every statement succeeds"""
+
+    def cursor(self):
+        return self
+
+    def execute(self, *args):
+        pass
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class _NoSystemLogLoader(g.DirectLoader):
+    """Loader for a database without the SystemLog table"""
+
+    def __init__(self):
+        super().__init__(_Connection())
+        self.cursor = self.connection.cursor()
+        self.inserted = {}
+
+    def begin_table(self, spec):
+        if spec is g.SYSTEM_LOG:
+            self._skip.add(spec)
+
+    def insert(self, spec, rows):
+        self.inserted[spec] = self.inserted.get(spec, 0) + len(rows)
+
+
+def test_direct_load_skipped_table_has_no_rows():
+    loader = _NoSystemLogLoader()
+    row_counts = g.load_direct(SMALL_PLAN, loader)
+
+    assert row_counts[g.SYSTEM_LOG] == 0
+    assert g.SYSTEM_LOG not in loader.inserted
+    assert row_counts[g.CUSTOMER] == loader.inserted[g.CUSTOMER] == 100
+    assert row_counts[g.INVOICE] == loader.inserted[g.INVOICE] == 200
+
+
+def _sqlite_database(path, drop_table=None):
+    connection = g.connect_sqlite(str(path))
+    with open(g.SQLITE_DATABASE_FILE, encoding='utf-8') as f:
+        connection.executescript(f.read())
+    if drop_table:
+        connection.execute(f"DROP TABLE {drop_table}")
+    return connection
+
+
+def _sqlite_row_counts(connection):
+    """Generated rows per table: those from the table's first generated ID on"""
+    return {spec.name: connection.execute(f"SELECT COUNT(*) FROM {spec.name} "
+                                          f"WHERE {spec.columns[0][0]} >= {g.FIRST_IDS[spec]}").fetchone()[0]
+            for spec in g.TABLES}
+
+
+def test_sqlite_direct_load(tmp_path):
+    # The loader creates the database, base Chinook rows included
+    connection = g.connect_sqlite(str(tmp_path / 'chinook.db'))
+    try:
+        row_counts = g.load_direct(SMALL_PLAN, g.SqliteLoader(connection))
+        loaded = _sqlite_row_counts(connection)
+        violations = connection.execute("PRAGMA foreign_key_check").fetchall()
+    finally:
+        connection.close()
+
+    assert {spec.name: count for spec, count in row_counts.items()} == loaded
+    assert loaded['Customer'] == 100
+    assert loaded['Invoice'] == 200
+    assert loaded['SystemLog'] == 10
+    assert violations == []
+
+
+def test_sqlite_direct_load_skips_missing_table(tmp_path):
+    connection = _sqlite_database(tmp_path / 'chinook.db', drop_table='SystemLog')
+    try:
+        row_counts = g.load_direct(SMALL_PLAN, g.SqliteLoader(connection))
+    finally:
+        connection.close()
+
+    assert row_counts[g.SYSTEM_LOG] == 0
+    assert row_counts[g.CUSTOMER] == 100
+
+
+@pytest.mark.parametrize('db_type', list(g.DIALECTS))
+def test_rendered_script(tmp_path, db_type):
+    output_file = tmp_path / f"{db_type}.sql"
+    row_counts = g.write_sql_files(SMALL_PLAN, [(db_type, str(output_file))])
+
+    assert row_counts[g.CUSTOMER] == 100
+    assert row_counts[g.SYSTEM_LOG] == 10
+    with open(output_file, encoding='utf-8') as f:
+        script = f.read().lower().replace('_', '')
+    assert 'customer' in script
+    assert 'systemlog' in script
+
+
+def test_dataset_file_identical_for_any_worker_count(tmp_path):
+    # Several blocks per table, so the worker processes really do share the work
+    plan = g.DatasetPlan(customers=2500, invoices=5000, systemlog=2500, seed=11)
+    contents = []
+    for workers in (1, 3):
+        directory = tmp_path / f"workers{workers}"
+        g.generate_dataset_file(plan, str(directory), workers=workers)
+        contents.append((directory / g.DATASET_FILE).read_bytes())
+
+    assert contents[0] == contents[1]
+
+
+def test_customer_prefix_stable_as_count_grows():
+    def customers(count, workers):
+        return [customer for batch in g.generate_customers(count=count, seed=11, workers=workers)
+                for customer in batch]
+
+    smaller = customers(1500, workers=1)
+    larger = customers(3500, workers=3)
+
+    assert len(larger) == 3500
+    assert larger[:1500] == smaller
+
+
+@pytest.mark.parametrize('output_format', ['sql', 'copy'])
+def test_postgresql_system_log_check_is_schema_qualified(tmp_path, output_format):
+    output = tmp_path / 'postgresql'
+    g.write_sql_files(SMALL_PLAN, [('postgresql', str(output))], output_format=output_format)
+
+    script = ''.join(path.read_text(encoding='utf-8') for path in [output, *output.glob('*')] if path.is_file())
+    checks = script.count("FROM information_schema.tables ")
+    assert checks
+    assert script.count("WHERE table_schema = current_schema() AND table_name = 'system_log'") == checks
+
+
+def test_mysql_batches_go_through_executemany():
+    pymysql = pytest.importorskip('pymysql')
+
+    class Cursor(pymysql.cursors.Cursor):
+        """Records statements instead of sending them, and answers the loader's queries"""
+
+        def execute(self, query, args=None):
+            if args is not None:
+                query = self.mogrify(query, args)
+            if isinstance(query, (bytes, bytearray)):
+                query = bytes(query).decode('utf-8')
+            self.connection.statements.append(query)
+            self._answer = (1 << 20,) if '@@max_allowed_packet' in query else (1,)
+            return 1
+
+        def fetchone(self):
+            return self._answer
+
+    class Connection(pymysql.connections.Connection):
+        server_status = 0  # Set by the server handshake, which never happens here
+        statements = None
+
+        def commit(self):
+            pass
+
+        def rollback(self):
+            pass
+
+    connection = Connection(defer_connect=True, cursorclass=Cursor)
+    connection.statements = []
+    row_counts = g.load_direct(SMALL_PLAN, g.MysqlLoader(connection))
+
+    assert row_counts[g.CUSTOMER] == 100
+    customers = [s for s in connection.statements if s.startswith('INSERT INTO `Customer`')]
+    assert len(customers) == 1 and customers[0].count('),(') == 99
+    staged = [s for s in connection.statements if s.startswith('INSERT INTO SystemLogStage')]
+    assert len(staged) == 1 and staged[0].count('),(') == 9
+    moves = [s for s in connection.statements if s.startswith('INSERT INTO `SystemLog`')]
+    assert len(moves) == 1 and "REPEAT('PADDING_', 70000)" in moves[0] and 'FROM SystemLogStage' in moves[0]
+
+
+def test_top_up_rows_differ_from_the_first_rows():
+    original = {}
+    for spec, rows in g.generate_dataset(SMALL_PLAN):
+        original.setdefault(spec, []).extend(rows)
+    state = {spec: (len(rows), rows[-1][0]) for spec, rows in original.items()}
+
+    # Same seed, twice the rows: the top-up adds as many rows as the first run made
+    plan = g.top_up_plan(SMALL_PLAN._replace(customers=200, invoices=400, systemlog=20), state)
+    topped_up = {}
+    for spec, rows in g.generate_dataset(plan):
+        topped_up.setdefault(spec, []).extend(rows)
+
+    # Values drawn for each row (emails and referenced IDs follow from the IDs)
+    drawn = {g.CUSTOMER: lambda row: (row.first_name, row.last_name, row.address, row.phone),
+             g.INVOICE: lambda row: (row.invoice_date, row.total_cents),
+             g.SYSTEM_LOG: lambda row: row.log_date}
+    assert not plan.emits_catalog
+    for spec, values in drawn.items():
+        assert topped_up[spec][0][0] == original[spec][-1][0] + 1
+        assert len(topped_up[spec]) == len(original[spec])
+        assert list(map(values, topped_up[spec])) != list(map(values, original[spec]))
+    first_customers = set(map(drawn[g.CUSTOMER], original[g.CUSTOMER]))
+    assert not [row for row in topped_up[g.CUSTOMER] if drawn[g.CUSTOMER](row) in first_customers]
+
+
+@pytest.mark.parametrize('engine', list(g.INVOICE_ENGINES))
+def test_invoice_engine_rows_are_valid(engine):
+    if engine == 'numpy':
+        pytest.importorskip('numpy')
+    plan = g.DatasetPlan(customers=300, invoices=2500, seed=5, engine=engine)
+    rows = {}
+    for spec, batch in g.generate_dataset(plan):
+        rows.setdefault(spec, []).extend(batch)
+    customers = {customer.customer_id for customer in rows[g.CUSTOMER]}
+    invoices, lines = rows[g.INVOICE], rows[g.INVOICE_LINE]
+    last_track_id = g.FIRST_IDS[g.TRACK] + len(rows[g.TRACK]) - 1
+
+    assert len(invoices) == 2500
+    assert [invoice.invoice_id for invoice in invoices] == list(range(g.FIRST_IDS[g.INVOICE], g.FIRST_IDS[g.INVOICE] + 2500))
+    assert [line.invoice_line_id for line in lines] == list(range(g.FIRST_IDS[g.INVOICE_LINE],
+                                                                  g.FIRST_IDS[g.INVOICE_LINE] + len(lines)))
+    assert len(lines) == g.count_invoice_lines(2500, plan.seed, engine)
+    totals = {}
+    for line in lines:
+        assert 1 <= line.track_id <= last_track_id
+        assert line.unit_price_cents in (99, 199) and line.quantity >= 1
+        totals[line.invoice_id] = totals.get(line.invoice_id, 0) + line.unit_price_cents * line.quantity
+    for invoice in invoices:
+        assert invoice.customer_id in customers
+        assert g.date(2022, 1, 1) <= invoice.invoice_date <= g.date(2026, 1, 19)
+        assert invoice.total_cents == totals[invoice.invoice_id]
+
+
+@pytest.mark.parametrize('compression', list(g.COMPRESSIONS))
+def test_compressed_script_matches_plain_script(tmp_path, compression):
+    if compression == 'zstd':
+        pytest.importorskip('zstandard')
+    plain_file = tmp_path / 'sqlite.sql'
+    compressed_file = tmp_path / f"sqlite.sql{g.COMPRESSIONS[compression]}"
+    g.write_sql_files(SMALL_PLAN, [('sqlite', str(plain_file))], workers=3)
+    g.write_sql_files(SMALL_PLAN, [('sqlite', str(compressed_file))], workers=3, compress=compression)
+
+    with open(plain_file, encoding='utf-8') as f:
+        plain = f.read()
+    with g.open_compressed_text(str(compressed_file)) as f:
+        assert f.read() == plain
+
+
+@pytest.mark.parametrize('compression', list(g.COMPRESSIONS))
+def test_block_compressed_writer_keeps_block_order(tmp_path, compression):
+    if compression == 'zstd':
+        pytest.importorskip('zstandard')
+    path = str(tmp_path / f"blocks.sql{g.COMPRESSIONS[compression]}")
+    parts = [f"INSERT INTO t VALUES ({i}, 'row {i}');\n" for i in range(5000)]
+    with g.BlockCompressedWriter(path, compression, block_size=1000, threads=3) as f:
+        for part in parts:
+            f.write(part)
+
+    with g.open_compressed_text(path) as f:
+        assert f.read() == ''.join(parts)
+
+
+def _copy_blocks(script):
+    """COPY ... FROM STDIN statement -> its data lines"""
+    blocks, current = {}, None
+    for line in script.split('\n'):
+        if current is not None:
+            if line == '\\.':
+                current = None
+            else:
+                current.append(line)
+        elif line.startswith('COPY ') and line.endswith(' FROM STDIN;'):
+            current = blocks[line] = []
+    return blocks
+
+
+def test_postgresql_copy_script(tmp_path):
+    output_file = tmp_path / 'postgresql.sql'
+    row_counts = g.write_sql_files(SMALL_PLAN, [('postgresql', str(output_file))], output_format='copy')
+    with open(output_file, encoding='utf-8') as f:
+        blocks = _copy_blocks(f.read())
+
+    customers = blocks['COPY customer (customer_id, first_name, last_name, company, address, city, state, country, '
+                       'postal_code, phone, fax, email, support_rep_id) FROM STDIN;']
+    assert len(customers) == row_counts[g.CUSTOMER] == 100
+    assert len(blocks['COPY system_log_copy FROM STDIN;']) == 10
+    for statement, lines in blocks.items():
+        columns = 4 if 'system_log_copy' in statement else statement.count(',') + 1
+        assert all(len(line.split('\t')) == columns for line in lines), statement
+
+
+def test_postgresql_copy_escapes_text():
+    row = g.CustomerRow(60, 'Tab\there', 'New\nline', None, 'C:\\Music\\', 'Carriage\rreturn', None, 'Brazil',
+                        '12227-000', '+55 (12) 3923-5555', None, 'luis@embraer.com.br', 3)
+    rendered = g.SCRIPT_FORMATS['copy'].insert_batch(g.CUSTOMER, [row])
+
+    assert rendered == ('60\tTab\\there\tNew\\nline\t\\N\tC:\\\\Music\\\\\tCarriage\\rreturn\t\\N\tBrazil\t'
+                        '12227-000\t+55 (12) 3923-5555\t\\N\tluis@embraer.com.br\t3\n')
+
+
+NULL_ROW = g.CustomerRow(60, 'Luís', 'Gonçalves', None, 'Av. Brigadeiro Faria Lima, 2170', 'São José dos Campos', None,
+                         'Brazil', '12227-000', '+55 (12) 3923-5555', None, 'luisg@embraer.com.br', 3)
+
+
+def _bulk_files(tmp_path, output_format, batches=((g.CUSTOMER, [NULL_ROW]),)):
+    """Write batches through a BULK_FORMATS writer; return the files it wrote, by name"""
+    directory = tmp_path / output_format
+    writer = g.BULK_FORMATS[output_format](str(directory))
+    g.write_dataset(batches, [writer])
+    files = {}
+    for path in directory.iterdir():
+        with open(path, encoding='utf-8', newline='') as f:
+            files[path.name] = f.read()
+    return files
+
+
+def test_bcp_files(tmp_path):
+    files = _bulk_files(tmp_path, 'bcp')
+
+    assert files['customer.dat'] == ('60\tLuís\tGonçalves\t\tAv. Brigadeiro Faria Lima, 2170\tSão José dos Campos\t\t'
+                                     'Brazil\t12227-000\t+55 (12) 3923-5555\t\tluisg@embraer.com.br\t3\r\n')
+    format_file = files['customer.fmt'].split('\n')
+    assert format_file[:2] == ['14.0', '13']
+    assert format_file[2] == '1   SQLCHAR  0  12    "\\t"  1   CustomerId          ""'
+    assert format_file[14] == '13  SQLCHAR  0  12    "\\r\\n"  13  SupportRepId        ""'
+    assert ("BULK INSERT [dbo].[Customer] FROM '$(DataDir)/customer.dat'\n"
+            "WITH (FORMATFILE = '$(DataDir)/customer.fmt', CODEPAGE = '65001', KEEPIDENTITY, KEEPNULLS, TABLOCK"
+            in files['load_bcp.sql'])
+    assert 'system_log' not in ''.join(files)
+
+
+def test_load_data_files(tmp_path):
+    customer = NULL_ROW._replace(first_name='Tab\there', address='C:\\Music', company='Line\nbreak')
+    log = g.SystemLogRow(1000, 413, g.datetime(2024, 5, 1, 12, 30), 'Invoice processed')
+    files = _bulk_files(tmp_path, 'loaddata', [(g.CUSTOMER, [customer]), (g.SYSTEM_LOG, [log])])
+
+    assert files['customer.tsv'] == ('60\tTab\\there\tGonçalves\tLine\\nbreak\tC:\\\\Music\tSão José dos Campos\t\\N\t'
+                                     'Brazil\t12227-000\t+55 (12) 3923-5555\t\\N\tluisg@embraer.com.br\t3\n')
+    assert files['system_log.tsv'] == '1000\t413\t2024-05-01 12:30:00\tInvoice processed\n'
+    script = files['load_data.sql']
+    assert ("LOAD DATA LOCAL INFILE 'customer.tsv'\n"
+            "INTO TABLE `Customer`\n"
+            "CHARACTER SET utf8mb4\n"
+            "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'\n"
+            "LINES TERMINATED BY '\\n'\n" in script)
+    assert ("(`LogId`, `InvoiceId`, `LogDate`, @LogMessage)\n"
+            "SET `LogMessage` = CONCAT(@LogMessage, ' | ', REPEAT('PADDING_', 70000));" in script)
+
+
+def test_sql_loader_files(tmp_path):
+    logs = [g.SystemLogRow(log_id, 413, g.datetime(2024, 5, 1, 12, 30), 'Invoice processed') for log_id in (1000, 1001)]
+    files = _bulk_files(tmp_path, 'sqlldr', [(g.CUSTOMER, [NULL_ROW]), (g.SYSTEM_LOG, logs)])
+
+    assert files['customer.dat'] == ('60\tLuís\tGonçalves\t\tAv. Brigadeiro Faria Lima, 2170\tSão José dos Campos\t\t'
+                                     'Brazil\t12227-000\t+55 (12) 3923-5555\t\tluisg@embraer.com.br\t3\n')
+    assert files['system_log.dat'] == ('1000\t413\t2024-05-01 12:30:00\tInvoice processed\n'
+                                       '1001\t413\t2024-05-01 12:30:00\tInvoice processed\n')
+    control = files['customer.ctl']
+    assert control.startswith("OPTIONS (DIRECT=TRUE, ERRORS=0)\nLOAD DATA\nCHARACTERSET AL32UTF8\n"
+                              "INFILE 'customer.dat'\nAPPEND\nINTO TABLE Customer\n"
+                              "FIELDS TERMINATED BY X'09'\nTRAILING NULLCOLS\n")
+    assert "  CustomerId INTEGER EXTERNAL,\n  FirstName CHAR(4000),\n" in control
+    assert "  LogDate DATE \"YYYY-MM-DD HH24:MI:SS\",\n  LogMessage CHAR(4000)\n)\n" in files['system_log.ctl']
+    assert 'WHERE LogId BETWEEN 1000 AND 1001;' in files['pad_system_log.sql']
+    shell = files['load_sqlldr.sh']
+    assert shell.index('control=customer.ctl') < shell.index('control=system_log.ctl') < shell.index('@pad_system_log.sql')
+    assert files['load_sqlldr.cmd'].endswith('\r\n') and '\n' not in files['load_sqlldr.cmd'].replace('\r\n', '')
+
+
+class _RecordingLoader(g.DirectLoader):
+    """Loader that records each insert and commit, in order, in a log shared between connections"""
+
+    def __init__(self, log, lock):
+        super().__init__(_Connection())
+        self.cursor = self.connection.cursor()
+        self.log = log
+        self.lock = lock
+
+    def insert(self, spec, rows):
+        import time
+        time.sleep(0.001)  # Let the other connections run
+        with self.lock:
+            self.log.append(('insert', spec, [row[0] for row in rows]))
+
+    def commit(self):
+        tables = list(self._open_tables)
+        super().commit()
+        with self.lock:
+            self.log.extend(('commit', spec, None) for spec in tables)
+
+
+def test_parallel_load_commits_parents_before_children():
+    import threading
+    log, lock = [], threading.Lock()
+    plan = g.DatasetPlan(customers=300, invoices=3000, systemlog=300, seed=7)
+    loader = g.ParallelLoader([_RecordingLoader(log, lock) for _ in range(4)], plan.expected_rows())
+    loader.partition_rows = 500
+    loader.system_log_partition_rows = 50
+    row_counts = g.load_direct(plan, loader, workers=2)
+
+    inserted = {spec: [] for spec in g.TABLES}
+    for event, spec, ids in log:
+        if event == 'insert':
+            inserted[spec] += ids
+    for spec in g.TABLES:
+        assert sorted(inserted[spec]) == list(range(g.FIRST_IDS[spec], g.FIRST_IDS[spec] + row_counts[spec]))
+    assert (row_counts[g.CUSTOMER], row_counts[g.INVOICE], row_counts[g.SYSTEM_LOG]) == (300, 3000, 300)
+    for child, parents in g.FOREIGN_KEYS.items():
+        first_insert = min(i for i, (event, spec, _) in enumerate(log) if event == 'insert' and spec is child)
+        for _, parent in parents:
+            last_commit = max(i for i, (event, spec, _) in enumerate(log) if event == 'commit' and spec is parent)
+            assert last_commit < first_insert, f"{child.name} started before {parent.name} was committed"
+
+
+def _feed(batch_size, seconds_per_batch, batches=200):
+    """Record batches timed by seconds_per_batch(size); return every size the batches were cut at"""
+    sizes = []
+    for _ in range(batches):
+        sizes.append(batch_size.size)
+        batch_size.record(batch_size.size, seconds_per_batch(batch_size.size))
+    return sizes
+
+
+def test_adaptive_batch_size_grows_while_throughput_improves():
+    # A fixed 10ms round trip plus 10us a row: larger batches are always faster, up to the maximum
+    batch_size = g.AdaptiveBatchSize(initial=100, minimum=50, maximum=6400)
+    sizes = _feed(batch_size, lambda size: 0.01 + size * 0.00001)
+
+    assert all(50 <= size <= 6400 for size in sizes)
+    assert sizes[0] == 100 and batch_size.settled and batch_size.size == 6400
+    assert sizes == sorted(sizes)
+
+
+def test_adaptive_batch_size_settles_when_throughput_stops_improving():
+    # Cost per row only: every size has the same rows/sec, so the first size is kept
+    batch_size = g.AdaptiveBatchSize(initial=1000, minimum=50, maximum=50000)
+    sizes = _feed(batch_size, lambda size: size * 0.0001)
+
+    assert batch_size.settled and batch_size.size == 1000
+    assert max(sizes) == 2000
+
+
+def test_adaptive_batch_size_backs_off_slow_and_failed_batches():
+    batch_size = g.AdaptiveBatchSize(initial=1000, minimum=50, maximum=50000)
+    batch_size.record(1000, batch_size.max_seconds + 1)
+    assert batch_size.size == batch_size.maximum == 500
+
+    # Never grows past the size it backed off to, however fast the batches get
+    assert set(_feed(batch_size, lambda size: 0.001)) == {500}
+
+    batch_size = g.AdaptiveBatchSize(initial=400, minimum=50, maximum=50000)
+    assert batch_size.probing
+    assert [batch_size.failed() for _ in range(4)] == [True, True, True, False]
+    assert batch_size.size == 50 and not batch_size.probing
+
+
+def test_adaptive_batch_size_fixed():
+    batch_size = g.AdaptiveBatchSize(500, 500, 500)
+    assert set(_feed(batch_size, lambda size: 0.0001)) == {500}
+    assert not batch_size.probing
+
+
+class _FlakySqliteLoader(g.SqliteLoader):
+    """Inserts part of any InvoiceLine batch over max_rows rows, then fails, like a server rejecting it"""
+    max_rows = 300
+
+    def insert(self, spec, rows):
+        if spec is g.INVOICE_LINE and len(rows) > self.max_rows:
+            super().insert(spec, rows[:10])
+            raise RuntimeError(f"batch of {len(rows)} rows too large")
+        super().insert(spec, rows)
+
+
+def test_sqlite_failed_batch_is_retried_smaller(tmp_path):
+    plan = g.DatasetPlan(customers=100, invoices=1000, systemlog=10, seed=7)
+    connection = g.connect_sqlite(str(tmp_path / 'chinook.db'))
+    try:
+        loader = _FlakySqliteLoader(connection)
+        row_counts = g.load_direct(plan, loader)
+        loaded = _sqlite_row_counts(connection)
+        journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+    finally:
+        connection.close()
+
+    lines = g.count_invoice_lines(1000, plan.seed)
+    assert row_counts[g.INVOICE_LINE] == loaded['InvoiceLine'] == lines
+    assert loader.batch_sizes[g.INVOICE_LINE].size <= _FlakySqliteLoader.max_rows
+    assert journal_mode == 'delete'  # Restored after the load
+
+
+class _InterruptedSqliteLoader(g.SqliteLoader):
+    """Stops the load at the given insert of a table, as if the process had been killed"""
+
+    def __init__(self, connection, stop_table, stop_batch, **options):
+        super().__init__(connection, **options)
+        self.stop_table = stop_table
+        self.stop_batch = stop_batch
+
+    def insert(self, spec, rows):
+        if spec is self.stop_table:
+            self.stop_batch -= 1
+            if not self.stop_batch:
+                raise KeyboardInterrupt
+        super().insert(spec, rows)
+
+
+def _generated_rows(connection):
+    return {spec.name: connection.execute(f"SELECT * FROM {spec.name} WHERE {spec.columns[0][0]} >= "
+                                          f"{g.FIRST_IDS[spec]} ORDER BY 1").fetchall()
+            for spec in g.TABLES}
+
+
+@pytest.mark.parametrize('stop_table, stop_batch', [(g.CUSTOMER, 1), (g.INVOICE, 3), (g.INVOICE_LINE, 5),
+                                                    (g.SYSTEM_LOG, 2)])
+def test_sqlite_resume_after_interrupted_load(tmp_path, stop_table, stop_batch):
+    plan = g.DatasetPlan(customers=200, invoices=400, systemlog=120, seed=7)
+    options = dict(batch_size=50)
+    expected = g.connect_sqlite(str(tmp_path / 'expected.db'))
+    connection = g.connect_sqlite(str(tmp_path / 'chinook.db'))
+    try:
+        g.load_direct(plan, g.SqliteLoader(expected, **options))
+
+        path = str(tmp_path / g.CHECKPOINT_FILE)
+        checkpoint = g.LoadCheckpoint(path, {'database': 'sqlite'}, plan, 150)
+        checkpoint.save()
+        loader = _InterruptedSqliteLoader(connection, stop_table, stop_batch, checkpoint=checkpoint, **options)
+        with pytest.raises(KeyboardInterrupt):
+            g.write_dataset(plan.batches(), [loader])
+        loader.rollback()
+
+        checkpoint = g.LoadCheckpoint.load(path)
+        assert not checkpoint.complete
+        assert g.load_direct(checkpoint.remaining_plan(), g.SqliteLoader(connection, checkpoint=checkpoint, **options))
+        assert g.LoadCheckpoint.load(path).complete
+        assert _generated_rows(connection) == _generated_rows(expected)
+    finally:
+        expected.close()
+        connection.close()
+
+
+
+class _StoppingConnection:
+    """sqlite3 connection that stops the load in its second commit, which goes through or not"""
+
+    def __init__(self, connection, committed):
+        self.connection = connection
+        self.committed = committed
+        self.commits = 0
+
+    def __getattr__(self, name):
+        return getattr(self.connection, name)
+
+    def commit(self):
+        self.commits += 1
+        if self.commits == 2:
+            if self.committed:
+                self.connection.commit()
+            raise KeyboardInterrupt
+        self.connection.commit()
+
+
+@pytest.mark.parametrize('committed', [True, False])
+def test_sqlite_resume_settles_interrupted_commit(tmp_path, committed):
+    plan = g.DatasetPlan(customers=200, invoices=300, systemlog=10, seed=7)
+    connection = g.connect_sqlite(str(tmp_path / 'chinook.db'))
+    try:
+        path = str(tmp_path / g.CHECKPOINT_FILE)
+        checkpoint = g.LoadCheckpoint(path, {'database': 'sqlite'}, plan, 150)
+        checkpoint.save()
+        loader = g.SqliteLoader(_StoppingConnection(connection, committed), batch_size=50, checkpoint=checkpoint)
+        with pytest.raises(KeyboardInterrupt):
+            g.write_dataset(plan.batches(), [loader])
+        loader.rollback()
+
+        # As _insert_direct() does on --resume
+        checkpoint = g.LoadCheckpoint.load(path)
+        assert checkpoint.committing is not None
+        resumed = g.SqliteLoader(connection, batch_size=50, checkpoint=checkpoint)
+        checkpoint.settle(resumed)
+        assert g.load_direct(checkpoint.remaining_plan(), resumed)
+        loaded = _sqlite_row_counts(connection)
+    finally:
+        connection.close()
+
+    assert (loaded['Customer'], loaded['Invoice'], loaded['SystemLog']) == (200, 300, 10)
+    assert loaded['InvoiceLine'] == g.count_invoice_lines(300, plan.seed)
+
+
+class _RecordingCursor:
+    """DB-API connection and cursor stand-in that records every statement, answering queries from results"""
+    # (fragment of a query, rows it returns); the first match is used, else one row (1,)
+    results = [
+        ('recovery_model_desc', [('FULL',)]),
+        ('@@max_allowed_packet', [(64 << 20,)]),
+        ('@@unique_checks', [(1, 1)]),
+        ('AND table_name IN', [(g._snake_case(spec.name),) for spec in g.TABLES]),
+        ('pg_constraint', [('invoice_line', 'invoice_line_invoice_id_fkey',
+                            'FOREIGN KEY (invoice_id) REFERENCES invoice(invoice_id)')]),
+        ('KEY_COLUMN_USAGE', [('InvoiceLine', 'InvoiceId', 'Invoice', 'InvoiceId')]),
+        ('LEFT JOIN', [(0,)]),
+    ]
+
+    def __init__(self):
+        self.statements = []
+        self._rows = []
+
+    def cursor(self):
+        return self
+
+    def execute(self, sql, *args):
+        self.statements.append(sql)
+        self._rows = next((rows for fragment, rows in self.results if fragment in sql), [(1,)])
+
+    def executemany(self, sql, rows):
+        self.statements.append(sql)
+
+    def copy(self, sql):
+        import contextlib
+        import io
+        self.statements.append(sql)
+        return contextlib.nullcontext(io.StringIO())
+
+    def fetchone(self):
+        return self._rows[0]
+
+    def fetchall(self):
+        return self._rows
+
+    def commit(self):
+        self.statements.append('COMMIT')
+
+    def rollback(self):
+        self.statements.append('ROLLBACK')
+
+
+# Per loader and strategy: statements (fragments) issued before the first row is inserted, after the
+# last one, and fragments no statement may contain
+STRATEGY_SQL = {
+    ('mssql', 'safe'): ([], [], ['TABLOCK', 'NOCHECK', 'SET RECOVERY']),
+    ('mssql', 'fast'): ([], [], ['NOCHECK', 'SET RECOVERY']),
+    ('mssql', 'unsafe-max'): (
+        ["ALTER DATABASE CURRENT SET RECOVERY BULK_LOGGED",
+         "IF OBJECT_ID(N'[dbo].[InvoiceLine]') IS NOT NULL ALTER TABLE [dbo].[InvoiceLine] NOCHECK CONSTRAINT ALL"],
+        ["IF OBJECT_ID(N'[dbo].[InvoiceLine]') IS NOT NULL ALTER TABLE [dbo].[InvoiceLine] WITH CHECK CHECK CONSTRAINT ALL",
+         "ALTER DATABASE CURRENT SET RECOVERY FULL"], []),
+    ('postgresql', 'safe'): ([], [], ['synchronous_commit', 'UNLOGGED', 'CONSTRAINT']),
+    ('postgresql', 'fast'): (["SET synchronous_commit = off", "ALTER TABLE system_log SET UNLOGGED"],
+                             ["ALTER TABLE system_log SET LOGGED"], ['ALTER TABLE invoice SET', 'CONSTRAINT']),
+    ('postgresql', 'unsafe-max'): (
+        ['ALTER TABLE invoice_line DROP CONSTRAINT "invoice_line_invoice_id_fkey"', "ALTER TABLE invoice SET UNLOGGED",
+         "ALTER TABLE system_log SET UNLOGGED"],
+        ["ALTER TABLE invoice SET LOGGED",
+         'ALTER TABLE invoice_line ADD CONSTRAINT "invoice_line_invoice_id_fkey" '
+         'FOREIGN KEY (invoice_id) REFERENCES invoice(invoice_id) NOT VALID',
+         'ALTER TABLE invoice_line VALIDATE CONSTRAINT "invoice_line_invoice_id_fkey"'], []),
+    ('mysql', 'safe'): ([], [], ['unique_checks = 0', 'REDO_LOG', 'LEFT JOIN']),
+    ('mysql', 'fast'): (["SET unique_checks = 0, foreign_key_checks = 0"],
+                        ["SET unique_checks = 1, foreign_key_checks = 1"], ['REDO_LOG', 'LEFT JOIN']),
+    ('mysql', 'unsafe-max'): (
+        ["ALTER INSTANCE DISABLE INNODB REDO_LOG", "SET unique_checks = 0, foreign_key_checks = 0"],
+        ["SET unique_checks = 1, foreign_key_checks = 1", "ALTER INSTANCE ENABLE INNODB REDO_LOG",
+         "SELECT COUNT(*) FROM `InvoiceLine` c LEFT JOIN `Invoice` p ON p.`InvoiceId` = c.`InvoiceId`"], []),
+}
+
+
+@pytest.mark.parametrize('db_type, strategy', list(STRATEGY_SQL))
+def test_load_strategy_sql(db_type, strategy):
+    before, after, absent = STRATEGY_SQL[db_type, strategy]
+    connection = _RecordingCursor()
+    loader = g.DIRECT_TARGETS[db_type].loader(connection, batch_size=50, strategy=g.LOAD_STRATEGIES[strategy])
+    assert g.load_direct(SMALL_PLAN, loader)
+
+    statements = connection.statements
+    data = [i for i, sql in enumerate(statements) if sql.startswith(('INSERT INTO', 'COPY '))]
+    first, last = data[0], data[-1]
+    for fragment in before:
+        assert any(fragment in sql for sql in statements[:first]), fragment
+    for fragment in after:
+        assert any(fragment in sql for sql in statements[last + 1:]), fragment
+    for fragment in absent:
+        assert not any(fragment in sql for sql in statements), fragment
+    # Only the safe strategy loads in one transaction, committed after the last row
+    assert ('COMMIT' in statements[first:last]) == (strategy != 'safe')
+    if db_type == 'mssql':
+        tablock = [sql for sql in statements if sql.startswith('INSERT INTO [dbo].[Invoice] ')]
+        assert all(('WITH (TABLOCK)' in sql) == (strategy != 'safe') for sql in tablock)
+
+
+def test_dialects_rendered_from_one_generation(tmp_path, monkeypatch):
+    generated = []
+    generate_dataset_file = g.generate_dataset_file
+    monkeypatch.setattr(g, 'generate_dataset_file',
+                        lambda *args: generated.append(args[0]) or generate_dataset_file(*args))
+    outputs = [(db_type, str(tmp_path / f"{db_type}.sql")) for db_type in ('mssql', 'postgresql', 'sqlite')]
+    row_counts = g.write_sql_files(SMALL_PLAN, outputs, workers=2)
+
+    assert generated == [SMALL_PLAN]
+    assert row_counts[g.CUSTOMER] == 100
+    assert sorted(os.listdir(tmp_path)) == ['mssql.sql', 'postgresql.sql', 'sqlite.sql']  # Temporary dataset removed
+    # The same scripts as `render` writes from a stored dataset of the plan
+    dataset_directory = tmp_path / 'dataset'
+    g.generate_dataset_file(SMALL_PLAN, str(dataset_directory))
+    for db_type, output_file in outputs:
+        rendered_file = dataset_directory / f"{db_type}.sql"
+        g.write_sql_files(g.StoredDataset(str(dataset_directory)), [(db_type, str(rendered_file))])
+        with open(output_file, encoding='utf-8') as f, open(rendered_file, encoding='utf-8') as rendered:
+            assert f.read() == rendered.read(), db_type